@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+
+'''
+One entry point for the build scripts.
+
+Each subcommand imports only the script it runs, and the scripts import their
+heavy dependencies (tqdm, PIL, icrawler) where they are used, so quick calls
+such as list or --help don't pay for them. Arguments after the subcommand go
+to the script unchanged.
+
+python3 carrot.py list
+python3 carrot.py download --lang japanese --limit 3 --extract
+python3 carrot.py download --langs de,ja,es --limit 3 --dest packages
+python3 carrot.py cache ls
+python3 carrot.py extract --source scale-japanese-package.tgz --limit 3
+python3 carrot.py index mini-german-package-k3
+python3 carrot.py mini scale-german-package-k3 --items 600
+python3 carrot.py manifest
+python3 carrot.py lookup --strict
+python3 carrot.py crawl --workers 8
+python3 carrot.py startup-time --runs 10 --imports
+'''
+
+import os
+import sys
+import importlib
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MMID_DIR = os.path.join(ROOT, 'scripts', 'mmid_master')
+CODING_FRIEND_DIR = os.path.join(ROOT, 'scripts', 'coding_friend')
+
+# name -> (script folder, module, arguments put in front of the user's, help)
+COMMANDS = {
+    'list': (MMID_DIR, 'mmid_manager', ['--list'], "List the languages in mmid-master/downloads.md"),
+    'download': (MMID_DIR, 'mmid_manager', ['--download'], "Download (and with --extract, extract) MMID packages"),
+    'extract': (MMID_DIR, 'mmid_manager', ['--extract'], "Extract the top k images per word from a local package"),
+    'cache': (MMID_DIR, 'download_cache', [], "List (ls) or prune the shared download cache"),
+    'index': (MMID_DIR, 'generate_index_csv', [], "Write index.csv for an extracted package"),
+    'mini': (ROOT, 'create_mini_dataset', [], "Create mini-* packages from scale-*-k3 packages"),
+    'manifest': (ROOT, 'generate_package_manifest', [], "Regenerate package_manifest.js"),
+    'versions': (ROOT, 'package_versions', [], "Show package versions and the deltas between them"),
+    'lookup': (ROOT, 'generate_lookup_index', [], "Regenerate lookup_index.js and the word collision report"),
+    'crawl': (CODING_FRIEND_DIR, 'download_images', [], "Download coding_friend images"),
+}
+
+
+def run_command(name, argv):
+    folder, module_name, prefix, _ = COMMANDS[name]
+    # The scripts import their siblings by bare module name
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    sys.argv[0] = f"{os.path.basename(sys.argv[0])} {name}" # so argparse usage shows the subcommand
+    module = importlib.import_module(module_name)
+    return module.main(prefix + argv)
+
+
+# --- Startup time ---
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+
+def _time_process(command, runs):
+    import time
+    import subprocess
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=ROOT)
+        timings.append(time.perf_counter() - started)
+    return _median(timings)
+
+
+def _top_level_imports(command):
+    """{module: cumulative ms} for the top-level imports of command, from python -X importtime."""
+    import subprocess
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + command[1:],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, cwd=ROOT)
+    imports = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split('|')
+        if not line.startswith('import time:') or len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        if not name.startswith('  '): # top level only; nested imports are already in their parent's total
+            imports[name.strip()] = int(fields[1]) / 1000
+    return imports
+
+
+def _slowest_imports(command, limit, interpreter_imports):
+    """[(module, ms)] of the slowest imports the command adds to a bare interpreter's (site, encodings, ...)."""
+    imports = [(m, ms) for m, ms in _top_level_imports(command).items() if m not in interpreter_imports]
+    return sorted(imports, key=lambda item: -item[1])[:limit]
+
+
+def startup_time(runs, show_imports, commands=None):
+    """Median wall time of `carrot.py <command> --help` per command, against a bare interpreter."""
+    print(f"Median of {runs} runs:")
+    baseline = _time_process([sys.executable, '-c', 'pass'], runs)
+    interpreter_imports = _top_level_imports([sys.executable, '-c', 'pass']) if show_imports else {}
+    print(f"  {'python -c pass':<14} {baseline * 1000:7.1f} ms")
+    results = {}
+    for name in commands or COMMANDS:
+        command = [sys.executable, os.path.abspath(__file__), name, '--help']
+        results[name] = _time_process(command, runs)
+        print(f"  {name:<14} {results[name] * 1000:7.1f} ms (+{(results[name] - baseline) * 1000:.1f} ms over the interpreter)")
+        if show_imports:
+            for module, ms in _slowest_imports(command, 5, interpreter_imports):
+                print(f"      {module:<32} {ms:6.1f} ms")
+    return results
+
+
+def print_usage():
+    print("usage: carrot.py <command> [arguments]\n\ncommands:")
+    for name, (_, _, _, help_text) in COMMANDS.items():
+        print(f"  {name:<14} {help_text}")
+    print(f"  {'startup-time':<14} Measure start-up time of each command (--runs N, --imports)")
+    print("\nRun carrot.py <command> --help for the command's own options.")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        print_usage()
+        return 0
+
+    name, rest = argv[0], argv[1:]
+    if name == 'startup-time':
+        import argparse
+        parser = argparse.ArgumentParser(prog='carrot.py startup-time', description="Measure start-up time of each command.")
+        parser.add_argument('commands', nargs='*', help=f"Commands to time (default: all of {', '.join(COMMANDS)})")
+        parser.add_argument('--runs', type=int, default=5, help="Runs per command; the median is reported")
+        parser.add_argument('--imports', action='store_true', help="Also show the slowest top-level imports of each command")
+        args = parser.parse_args(rest)
+        unknown = [c for c in args.commands if c not in COMMANDS]
+        if unknown:
+            parser.error(f"unknown command(s): {', '.join(unknown)}")
+        startup_time(max(1, args.runs), args.imports, args.commands)
+        return 0
+
+    if name not in COMMANDS:
+        print(f"Unknown command '{name}'.\n")
+        print_usage()
+        return 2
+    run_command(name, rest)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 import os
 import csv
 import shutil
+import argparse
 
 # Configuration
 SOURCE_PACKAGES = [
@@ -12,7 +13,7 @@ SOURCE_PACKAGES = [
 TARGET_PREFIX = 'mini-'
 ITEMS_TO_KEEP = 600 # Adjust this to fit within size limits
 
-def create_mini_package(package_name):
+def create_mini_package(package_name, items_to_keep=ITEMS_TO_KEEP):
     target_name = package_name.replace('scale-', TARGET_PREFIX)
     
     if os.path.exists(target_name):
@@ -46,7 +47,7 @@ def create_mini_package(package_name):
         
         count = 0
         for row in all_rows:
-            if count >= ITEMS_TO_KEEP:
+            if count >= items_to_keep:
                 break
                 
             # Copy the folder associated with this ID
@@ -70,10 +71,15 @@ def create_mini_package(package_name):
                 
     print(f"Created {target_name} with {count} items.")
 
-def main():
-    for pkg in SOURCE_PACKAGES:
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create mini-* packages with a random subset of words.")
+    parser.add_argument('packages', nargs='*', default=SOURCE_PACKAGES, help="scale-*-k3 package folders (default: the three app languages)")
+    parser.add_argument('--items', type=int, default=ITEMS_TO_KEEP, help="Words to keep per package")
+    args = parser.parse_args(argv)
+
+    for pkg in args.packages:
         if os.path.exists(pkg):
-            create_mini_package(pkg)
+            create_mini_package(pkg, args.items)
         else:
             print(f"Skipping missing package: {pkg}")
 
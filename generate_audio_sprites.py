@@ -0,0 +1,147 @@
+'''
+Builds audio sprites for the feedback clips (posi / neg / cat).
+
+Each clip is loudness-normalized (EBU R128 via ffmpeg loudnorm) in parallel,
+the clips of a category are concatenated with a short silence between them,
+and the result is encoded once as a small mono MP3. Clip offsets go to
+assets/audio/sprites/sprites.json, which generate_package_manifest.py folds
+into AUDIO_MANIFEST so the frontend loads one file per category.
+
+Requires ffmpeg on PATH.
+
+python3 generate_audio_sprites.py
+python3 generate_audio_sprites.py --bitrate 48k --force
+'''
+
+import os
+import json
+import wave
+import shutil
+import argparse
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+AUDIO_BASE = os.path.join('assets', 'audio')
+SPRITE_DIR = os.path.join(AUDIO_BASE, 'sprites')
+SPRITE_INDEX = os.path.join(SPRITE_DIR, 'sprites.json')
+
+# Same folders generate_package_manifest.py scans
+CATEGORIES = {
+    'posi': os.path.join(AUDIO_BASE, 'human', 'posi'),
+    'neg': os.path.join(AUDIO_BASE, 'human', 'neg'),
+    'cat': os.path.join(AUDIO_BASE, 'cat'),
+}
+
+SAMPLE_RATE = 44100
+GAP_SECONDS = 0.25 # silence between clips so seeking imprecision never bleeds into a neighbour
+
+
+def list_clips(folder):
+    if not os.path.exists(folder):
+        return []
+    return sorted(f.name for f in os.scandir(folder) if f.is_file() and f.name.lower().endswith('.mp3'))
+
+
+def normalize_clip(src_path, wav_path):
+    """Decodes one clip to loudness-normalized mono 16-bit PCM."""
+    subprocess.run([
+        'ffmpeg', '-nostdin', '-loglevel', 'error', '-y', '-i', src_path,
+        '-af', 'loudnorm=I=-16:TP=-1.5:LRA=11',
+        '-ac', '1', '-ar', str(SAMPLE_RATE), '-c:a', 'pcm_s16le', wav_path,
+    ], check=True)
+    return wav_path
+
+
+def concatenate_wavs(wav_paths, out_path, gap_seconds=GAP_SECONDS):
+    """
+    Joins mono 16-bit WAVs with silence between them.
+    Returns [(start, duration), ...] in seconds, exact to the sample.
+    """
+    offsets = []
+    gap = b'\x00\x00' * int(SAMPLE_RATE * gap_seconds)
+    position = 0
+
+    with wave.open(out_path, 'wb') as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(SAMPLE_RATE)
+        for i, path in enumerate(wav_paths):
+            if i > 0:
+                out.writeframes(gap)
+                position += len(gap) // 2
+            with wave.open(path, 'rb') as clip:
+                frames = clip.readframes(clip.getnframes())
+            frame_count = len(frames) // 2
+            offsets.append((round(position / SAMPLE_RATE, 3), round(frame_count / SAMPLE_RATE, 3)))
+            out.writeframes(frames)
+            position += frame_count
+    return offsets
+
+
+def encode_sprite(wav_path, out_path, bitrate):
+    subprocess.run([
+        'ffmpeg', '-nostdin', '-loglevel', 'error', '-y', '-i', wav_path,
+        '-ac', '1', '-c:a', 'libmp3lame', '-b:a', bitrate, out_path,
+    ], check=True)
+
+
+def build_sprites(bitrate='48k', workers=None, force=False):
+    if shutil.which('ffmpeg') is None:
+        print("Error: ffmpeg is not installed or not found.")
+        return None
+
+    os.makedirs(SPRITE_DIR, exist_ok=True)
+    previous = {}
+    if os.path.exists(SPRITE_INDEX) and not force:
+        with open(SPRITE_INDEX, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+
+    sprites = {}
+    with tempfile.TemporaryDirectory() as temp_dir, ThreadPoolExecutor(max_workers=workers) as executor:
+        for category, folder in CATEGORIES.items():
+            clips = list_clips(folder)
+            if not clips:
+                continue
+
+            sprite_path = os.path.join(SPRITE_DIR, f"{category}.mp3")
+            newest_clip = max(os.path.getmtime(os.path.join(folder, c)) for c in clips)
+            old = previous.get(category)
+            if (old and [c['name'] for c in old['clips']] == clips and old.get('bitrate') == bitrate
+                    and os.path.exists(sprite_path) and os.path.getmtime(sprite_path) >= newest_clip):
+                print(f"{category}: up to date ({len(clips)} clips)")
+                sprites[category] = old
+                continue
+
+            jobs = [
+                executor.submit(normalize_clip, os.path.join(folder, c), os.path.join(temp_dir, f"{category}_{i}.wav"))
+                for i, c in enumerate(clips)
+            ]
+            wav_paths = [job.result() for job in jobs]
+
+            joined = os.path.join(temp_dir, f"{category}.wav")
+            offsets = concatenate_wavs(wav_paths, joined)
+            encode_sprite(joined, sprite_path, bitrate)
+
+            sprites[category] = {
+                'src': sprite_path.replace(os.sep, '/'),
+                'bitrate': bitrate,
+                'clips': [{'name': c, 'start': s, 'duration': d} for c, (s, d) in zip(clips, offsets)],
+            }
+            source_bytes = sum(os.path.getsize(os.path.join(folder, c)) for c in clips)
+            print(f"{category}: {len(clips)} clips, {source_bytes // 1024} KB -> {os.path.getsize(sprite_path) // 1024} KB")
+
+    with open(SPRITE_INDEX, 'w', encoding='utf-8') as f:
+        json.dump(sprites, f, ensure_ascii=False, indent=2)
+    print(f"Sprite index written to {SPRITE_INDEX}. Re-run generate_package_manifest.py to update AUDIO_MANIFEST.")
+    return sprites
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Normalize feedback clips and pack them into per-category audio sprites.")
+    parser.add_argument('--bitrate', type=str, default='48k', help="MP3 bitrate for the sprites (mono)")
+    parser.add_argument('--workers', type=int, default=None, help="Parallel ffmpeg processes")
+    parser.add_argument('--force', action='store_true', help="Rebuild even if sprites look up to date")
+    args = parser.parse_args()
+
+    build_sprites(args.bitrate, args.workers, args.force)
@@ -0,0 +1,127 @@
+'''
+Builds the normalized word lookup for each quiz language.
+
+script.js keys its word map by a normalized form of each word (lowercase,
+leading article dropped for de/es). Doing that on every page load costs a
+CSV parse per language, and two words that normalize to the same key used to
+overwrite each other without a trace. This script does it once at build time:
+
+- entries: [key, id, word] per word with images, in index.csv order, one per key
+- collisions: words dropped because an earlier word has the same key, printed
+  and written to lookup_collisions.json
+
+Output: lookup_index.js (const LOOKUP_INDEX). Keep normalize() in sync with
+normalizeText() in script.js, which is still used when the index is missing.
+
+python3 generate_lookup_index.py
+python3 generate_lookup_index.py --langs de,es --strict
+'''
+
+import os
+import re
+import csv
+import sys
+import json
+import argparse
+
+PACKAGES = {
+    'de': 'mini-german-package-k3',
+    'ja': 'mini-japanese-package-k3',
+    'es': 'mini-spanish-package-k3',
+}
+
+# Leading articles dropped per language, as in script.js normalizeText()
+ARTICLES = {
+    'de': re.compile(r'^(der|die|das)\s+'),
+    'es': re.compile(r'^(el|la|los|las)\s+'),
+}
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+OUTPUT_PATH = 'lookup_index.js'
+COLLISIONS_PATH = 'lookup_collisions.json'
+
+
+def normalize(text, lang):
+    key = text.lower()
+    if lang in ARTICLES:
+        key = ARTICLES[lang].sub('', key)
+    return key.strip()
+
+
+def _has_images(word_dir):
+    try:
+        return any(e.is_file() and e.name.lower().endswith(IMAGE_EXTENSIONS) for e in os.scandir(word_dir))
+    except OSError:
+        return False
+
+
+def build_language(lang, package):
+    """(index for LOOKUP_INDEX[lang], {key: [{'id', 'word'}, ...]} for keys shared by several words)."""
+    entries = []
+    first_for_key = {}
+    collisions = {}
+    with open(os.path.join(package, 'index.csv'), 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            word_id, word = (row.get('id') or '').strip(), (row.get('word') or '').strip()
+            if not word_id or not word or not _has_images(os.path.join(package, word_id)):
+                continue
+            key = normalize(word, lang)
+            if key in first_for_key:
+                kept = entries[first_for_key[key]]
+                collisions.setdefault(key, [{'id': kept[1], 'word': kept[2]}]).append({'id': word_id, 'word': word})
+                continue
+            first_for_key[key] = len(entries)
+            entries.append([key, word_id, word])
+
+    return {'package': package, 'entries': entries}, collisions
+
+
+def generate(langs=None, output_path=OUTPUT_PATH, collisions_path=COLLISIONS_PATH):
+    """Writes lookup_index.js and the collision report. Returns the number of colliding words."""
+    lookup = {}
+    all_collisions = {}
+    for lang, package in PACKAGES.items():
+        if langs and lang not in langs:
+            continue
+        if not os.path.exists(os.path.join(package, 'index.csv')):
+            print(f"Skipping {lang}: {package}/index.csv not found.")
+            continue
+        lookup[lang], collisions = build_language(lang, package)
+        dropped = sum(len(words) - 1 for words in collisions.values())
+        print(f"{lang}: {len(lookup[lang]['entries'])} keys, {dropped} words dropped as collisions")
+        for key, words in collisions.items():
+            kept, rest = words[0], words[1:]
+            print(f"  '{key}': kept {kept['word']} ({kept['id']}), dropped " + ', '.join(f"{w['word']} ({w['id']})" for w in rest))
+        if collisions:
+            all_collisions[lang] = collisions
+
+    # One language per line keeps the file small and its diffs readable
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write("const LOOKUP_INDEX = {\n")
+        f.write(",\n".join(f"  {json.dumps(lang)}: {json.dumps(index, ensure_ascii=False, separators=(',', ':'))}"
+                           for lang, index in lookup.items()))
+        f.write("\n};")
+    os.replace(temp_path, output_path)
+
+    with open(collisions_path, 'w', encoding='utf-8') as f:
+        json.dump(all_collisions, f, ensure_ascii=False, indent=2)
+    print(f"Lookup index written to {output_path}, collision report to {collisions_path}.")
+    return sum(len(words) - 1 for collisions in all_collisions.values() for words in collisions.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the normalized word lookup for each language.")
+    parser.add_argument('--langs', type=str, default=None, help="Comma separated language codes to build (default: all)")
+    parser.add_argument('--strict', action='store_true', help="Exit with an error if any words collide")
+    args = parser.parse_args(argv)
+
+    langs = set(args.langs.split(',')) if args.langs else None
+    dropped = generate(langs)
+    if args.strict and dropped:
+        print(f"Error: {dropped} words collide with another word's key.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
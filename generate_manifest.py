@@ -1,20 +1,41 @@
 import os
+import sys
 import json
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts', 'mmid_master'))
+from build_metrics import add_metrics_arguments, metrics_from_args
 
 root_dir = "coding_friend_vocabulary/~assets/img"
-manifest = []
-
-for dirpath, dirnames, filenames in os.walk(root_dir):
-    for filename in filenames:
-        if filename.endswith(('.jpg', '.jpeg', '.png')):
-            # path relative to project root
-            # dirpath is e.g. "coding_friend_vocabulary/~assets/img"
-            # we want "coding_friend_vocabulary/~assets/img/filename"
-            full_path = os.path.join(dirpath, filename)
-            manifest.append(full_path)
-
-# Write to manifest.js
-with open("manifest.js", "w") as f:
-    f.write("const IMAGE_MANIFEST = ")
-    json.dump(manifest, f, indent=2)
-    f.write(";")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate manifest.js from the coding_friend vocabulary images.")
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+    metrics = metrics_from_args('generate_manifest', args)
+
+    manifest = []
+
+    with metrics.phase('scan'):
+        for dirpath, dirnames, filenames in os.walk(root_dir):
+            for filename in filenames:
+                if filename.endswith(('.jpg', '.jpeg', '.png')):
+                    # path relative to project root
+                    # dirpath is e.g. "coding_friend_vocabulary/~assets/img"
+                    # we want "coding_friend_vocabulary/~assets/img/filename"
+                    full_path = os.path.join(dirpath, filename)
+                    manifest.append(full_path)
+    metrics.count('images', len(manifest))
+
+    # Write to manifest.js
+    with metrics.phase('write'), open("manifest.js", "w") as f:
+        f.write("const IMAGE_MANIFEST = ")
+        json.dump(manifest, f, indent=2)
+        f.write(";")
+
+    metrics.finish(args.profile, args.metrics, args.trace)
+
+
+if __name__ == "__main__":
+    main()
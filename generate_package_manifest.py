@@ -1,88 +1,228 @@
 import os
+import sys
 import json
+import hashlib
+import argparse
 
-packages = [
-    'mini-german-package-k3',
-    'mini-japanese-package-k3',
-    'mini-spanish-package-k3'
-]
-
-manifest = {}
-
-for pkg in packages:
-    if not os.path.exists(pkg):
-        continue
-        
-    manifest[pkg] = {}
-    
-    # Iterate through all subdirectories (which are IDs)
-    for entry in os.scandir(pkg):
-        if entry.is_dir():
-            folder_id = entry.name
-            images = []
-            
-            # Look for images in the folder
-            for file in os.scandir(entry.path):
-                if file.is_file() and file.name.lower().endswith(('.jpg', '.jpeg', '.png')):
-                    images.append(file.name)
-            
-            if images:
-                manifest[pkg][folder_id] = images
-
-# Scan Audio Files
-audio_manifest = {
-    'posi': [],
-    'neg': [],
-    'cat': []
-}
-
-audio_base = 'assets/audio'
-if os.path.exists(audio_base):
-    # Scan Posi
-    posi_path = os.path.join(audio_base, 'human', 'posi')
-    if os.path.exists(posi_path):
-        for f in os.scandir(posi_path):
-            if f.is_file() and f.name.lower().endswith('.mp3'):
-                audio_manifest['posi'].append(f.name)
-
-    # Scan Neg
-    neg_path = os.path.join(audio_base, 'human', 'neg')
-    if os.path.exists(neg_path):
-        for f in os.scandir(neg_path):
-            if f.is_file() and f.name.lower().endswith('.mp3'):
-                audio_manifest['neg'].append(f.name)
-
-    # Scan Cat
-    cat_path = os.path.join(audio_base, 'cat')
-    if os.path.exists(cat_path):
-        for f in os.scandir(cat_path):
-            if f.is_file() and f.name.lower().endswith('.mp3'):
-                audio_manifest['cat'].append(f.name)
-
-# Scan Characters
-character_manifest = []
-char_base = 'assets/img'
-if os.path.exists(char_base):
-    for entry in os.scandir(char_base):
-        if entry.is_dir():
-            # Check if idle.png exists in this folder
-            idle_path = os.path.join(entry.path, 'idle.png')
-            if os.path.exists(idle_path):
-                character_manifest.append(entry.name)
-
-# Sort for consistency
-character_manifest.sort()
-
-# Write to package_manifest.js
-with open("package_manifest.js", "w") as f:
-    f.write("const PACKAGE_MANIFEST = ")
-    json.dump(manifest, f, indent=2)
-    f.write(";\n\n")
-    f.write("const AUDIO_MANIFEST = ")
-    json.dump(audio_manifest, f, indent=2)
-    f.write(";\n\n")
-    f.write("const CHARACTER_MANIFEST = ")
-    json.dump(character_manifest, f, indent=2)
-    f.write(";")
-
-print("Manifest generated.")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts', 'mmid_master'))
+from build_metrics import add_metrics_arguments, metrics_from_args
+from package_versions import update_versions
+
+LQIP_CACHE = '.lqip_cache.json' # image sha1 -> placeholder color
+LQIP_BATCH = 64 # images per process pool task
+
+
+def _average_colors(paths):
+    """Runs in a worker: '#rrggbb' average color per image, None if it can't be read."""
+    from PIL import Image
+    colors = []
+    for path in paths:
+        try:
+            with Image.open(path) as img:
+                img.draft('RGB', (16, 16)) # JPEG decodes straight at 1/8 scale
+                if img.mode in ('RGBA', 'LA', 'P'):
+                    img = img.convert('RGBA')
+                    background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+                    img = Image.alpha_composite(background, img)
+                color = img.convert('RGB').resize((1, 1), Image.BOX).getpixel((0, 0))
+            colors.append('#%02x%02x%02x' % color)
+        except Exception:
+            colors.append(None)
+    return colors
+
+
+def hash_images(manifest):
+    """{image path: sha1 of its content} for every image in the manifest."""
+    digests = {}
+    for pkg, words in manifest.items():
+        for folder_id, images in words.items():
+            for img in images:
+                path = os.path.join(pkg, folder_id, img)
+                with open(path, 'rb') as f:
+                    digests[path] = hashlib.sha1(f.read()).hexdigest()
+    return digests
+
+
+def compute_placeholders(manifest, digests, workers=None):
+    """
+    {pkg: {id: [color, ...]}} in the same order as the manifest's image lists.
+    Colors are cached by image content hash, so reruns only decode new or changed images.
+    """
+    try:
+        import PIL
+    except ImportError:
+        print("Note: Pillow is not installed, skipping image placeholders.")
+        return {}
+    from concurrent.futures import ProcessPoolExecutor
+
+    cache = {}
+    if os.path.exists(LQIP_CACHE):
+        try:
+            with open(LQIP_CACHE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+
+    todo = {}
+    for path, digest in digests.items():
+        if digest not in cache:
+            todo.setdefault(digest, path)
+    if todo:
+        items = list(todo.items())
+        batches = [items[i:i + LQIP_BATCH] for i in range(0, len(items), LQIP_BATCH)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for batch, colors in zip(batches, executor.map(_average_colors, [[path for _, path in b] for b in batches])):
+                for (digest, _), color in zip(batch, colors):
+                    cache[digest] = color
+    print(f"Placeholders: {len(digests)} images, {len(todo)} computed, {len(digests) - len(todo)} reused (cache or duplicate image).")
+
+    # Only keep entries for images that still exist
+    used = {digest: cache[digest] for digest in set(digests.values())}
+    with open(LQIP_CACHE, 'w', encoding='utf-8') as f:
+        json.dump(used, f, separators=(',', ':'))
+
+    return {
+        pkg: {folder_id: [used[digests[os.path.join(pkg, folder_id, img)]] for img in images] for folder_id, images in words.items()}
+        for pkg, words in manifest.items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate package_manifest.js from the mini packages and assets.")
+    parser.add_argument('--no-placeholders', action='store_true', help="Skip computing image placeholder colors")
+    parser.add_argument('--workers', type=int, default=None, help="Processes for placeholder computation")
+    parser.add_argument('--versions', action='store_true', help="Bump package versions and write deltas to versions/ (on the deploy host)")
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+    metrics = metrics_from_args('generate_package_manifest', args)
+
+    packages = [
+        'mini-german-package-k3',
+        'mini-japanese-package-k3',
+        'mini-spanish-package-k3'
+    ]
+
+    manifest = {}
+
+    with metrics.phase('scan'):
+        for pkg in packages:
+            if not os.path.exists(pkg):
+                continue
+
+            manifest[pkg] = {}
+
+            # Iterate through all subdirectories (which are IDs)
+            for entry in os.scandir(pkg):
+                if entry.is_dir():
+                    folder_id = entry.name
+                    images = []
+
+                    # Look for images in the folder
+                    for file in os.scandir(entry.path):
+                        if file.is_file() and file.name.lower().endswith(('.jpg', '.jpeg', '.png')):
+                            images.append(file.name)
+
+                    if images:
+                        manifest[pkg][folder_id] = images
+
+    digests = {}
+    if not args.no_placeholders or args.versions:
+        with metrics.phase('hash'):
+            digests = hash_images(manifest)
+
+    # Placeholder color per image, so the quiz can paint a card before its JPEG arrives
+    placeholders = {}
+    if not args.no_placeholders:
+        with metrics.phase('placeholders'):
+            placeholders = compute_placeholders(manifest, digests, args.workers)
+
+    # Version per package plus the version each word's images last changed in (package_versions.py)
+    versions = {}
+    if args.versions:
+        with metrics.phase('versions'):
+            versions = update_versions(manifest, digests)
+
+    # Scan Audio Files
+    audio_manifest = {
+        'posi': [],
+        'neg': [],
+        'cat': []
+    }
+
+    audio_base = 'assets/audio'
+    if os.path.exists(audio_base):
+        # Scan Posi
+        posi_path = os.path.join(audio_base, 'human', 'posi')
+        if os.path.exists(posi_path):
+            for f in os.scandir(posi_path):
+                if f.is_file() and f.name.lower().endswith('.mp3'):
+                    audio_manifest['posi'].append(f.name)
+
+        # Scan Neg
+        neg_path = os.path.join(audio_base, 'human', 'neg')
+        if os.path.exists(neg_path):
+            for f in os.scandir(neg_path):
+                if f.is_file() and f.name.lower().endswith('.mp3'):
+                    audio_manifest['neg'].append(f.name)
+
+        # Scan Cat
+        cat_path = os.path.join(audio_base, 'cat')
+        if os.path.exists(cat_path):
+            for f in os.scandir(cat_path):
+                if f.is_file() and f.name.lower().endswith('.mp3'):
+                    audio_manifest['cat'].append(f.name)
+
+    # Audio sprites (generate_audio_sprites.py): one file per category plus clip offsets
+    sprite_index = os.path.join(audio_base, 'sprites', 'sprites.json')
+    if os.path.exists(sprite_index):
+        with open(sprite_index, 'r', encoding='utf-8') as f:
+            sprites = json.load(f)
+        audio_manifest['sprites'] = {
+            category: {
+                'src': sprite['src'],
+                'clips': [[clip['start'], clip['duration']] for clip in sprite['clips']]
+            }
+            for category, sprite in sprites.items()
+        }
+
+    # Scan Characters
+    character_manifest = []
+    char_base = 'assets/img'
+    if os.path.exists(char_base):
+        for entry in os.scandir(char_base):
+            if entry.is_dir():
+                # Check if idle.png exists in this folder
+                idle_path = os.path.join(entry.path, 'idle.png')
+                if os.path.exists(idle_path):
+                    character_manifest.append(entry.name)
+
+    # Sort for consistency
+    character_manifest.sort()
+
+    # Write to package_manifest.js
+    with metrics.phase('write'), open("package_manifest.js", "w") as f:
+        f.write("const PACKAGE_MANIFEST = ")
+        json.dump(manifest, f, indent=2)
+        f.write(";\n\n")
+        f.write("const AUDIO_MANIFEST = ")
+        json.dump(audio_manifest, f, indent=2)
+        f.write(";\n\n")
+        f.write("const CHARACTER_MANIFEST = ")
+        json.dump(character_manifest, f, indent=2)
+        f.write(";")
+        if placeholders:
+            f.write("\n\nconst PACKAGE_PLACEHOLDERS = ")
+            json.dump(placeholders, f, indent=2)
+            f.write(";")
+        if versions:
+            f.write("\n\nconst PACKAGE_VERSIONS = ")
+            json.dump(versions, f, indent=2)
+            f.write(";")
+
+    print("Manifest generated.")
+    metrics.count('images', sum(len(images) for pkg in manifest.values() for images in pkg.values()))
+    metrics.finish(args.profile, args.metrics, args.trace)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+'''
+Pre-synthesizes pronunciation audio for every quiz word so the frontend plays
+a static file instead of calling a TTS API on each click.
+
+Words come from the mini-* package index.csv files and the coding_friend
+vocabulary (target terms per language, plus the English words). Audio is
+cached by a hash of (text, voice, language, provider), so reruns only
+synthesize new words. Paths are written to tts_manifest.js as TTS_MANIFEST.
+
+python3 generate_tts_audio.py --provider google          (needs GOOGLE_TTS_API_KEY)
+python3 generate_tts_audio.py --provider minimax         (needs MINIMAX_API_KEY)
+python3 generate_tts_audio.py --provider google --base-url http://127.0.0.1:8000/synthesize   (local stand-in)
+'''
+
+import os
+import sys
+import csv
+import json
+import time
+import base64
+import hashlib
+import argparse
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts', 'coding_friend'))
+from compile_vocabulary import compile_index
+
+PACKAGES = {
+    'de': 'mini-german-package-k3',
+    'ja': 'mini-japanese-package-k3',
+    'es': 'mini-spanish-package-k3',
+}
+
+AUDIO_DIR = os.path.join('assets', 'audio', 'tts')
+MANIFEST_PATH = 'tts_manifest.js'
+
+# Same voices script.js uses for runtime synthesis
+GOOGLE_VOICES = {
+    'en': ('en-US', 'en-US-Wavenet-F'),
+    'de': ('de-DE', 'de-DE-Wavenet-G'),
+    'ja': ('ja-JP', 'ja-JP-Wavenet-A'),
+    'es': ('es-ES', 'es-ES-Wavenet-F'),
+    'fr': ('fr-FR', 'fr-FR-Wavenet-F'),
+    'ko': ('ko-KR', 'ko-KR-Wavenet-A'),
+    'fi': ('fi-FI', 'fi-FI-Wavenet-A'),
+    'sk': ('sk-SK', 'sk-SK-Wavenet-A'),
+}
+
+MINIMAX_LANGUAGES = {
+    'en': 'English', 'de': 'German', 'ja': 'Japanese', 'es': 'Spanish',
+    'fr': 'French', 'ko': 'Korean', 'fi': 'Finnish', 'sk': 'Slovak',
+}
+
+
+class RateLimiter:
+    """Spaces requests at least 1/rate seconds apart across all threads."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _post_json(url, body, headers, timeout=30):
+    request = urllib.request.Request(url, data=json.dumps(body).encode('utf-8'), method='POST',
+                                     headers={'Content-Type': 'application/json', **headers})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+
+class GoogleTTS:
+    name = 'google'
+
+    def __init__(self, api_key, base_url='https://texttospeech.googleapis.com/v1/text:synthesize'):
+        self.api_key = api_key
+        self.base_url = base_url
+
+    def voice(self, lang):
+        return GOOGLE_VOICES.get(lang, GOOGLE_VOICES['en'])[1]
+
+    def synthesize(self, text, lang):
+        language_code, voice_name = GOOGLE_VOICES.get(lang, GOOGLE_VOICES['en'])
+        body = {
+            'input': {'text': text},
+            'voice': {'languageCode': language_code, 'name': voice_name},
+            'audioConfig': {'audioEncoding': 'MP3', 'speakingRate': 0.9, 'volumeGainDb': 10.0},
+        }
+        data = _post_json(f"{self.base_url}?key={self.api_key}", body, {})
+        if not data.get('audioContent'):
+            raise RuntimeError(data.get('error', {}).get('message', 'no audioContent in response'))
+        return base64.b64decode(data['audioContent'])
+
+
+class MiniMaxTTS:
+    name = 'minimax'
+
+    def __init__(self, api_key, base_url='https://api.minimax.io/v1/t2a_v2', voice_id='English_expressive_narrator', model='speech-2.6-hd'):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.voice_id = voice_id
+        self.model = model
+
+    def voice(self, lang):
+        return self.voice_id
+
+    def synthesize(self, text, lang):
+        body = {
+            'model': self.model,
+            'text': text,
+            'stream': False,
+            'language_boost': MINIMAX_LANGUAGES.get(lang, 'auto'),
+            'output_format': 'hex',
+            'voice_setting': {'voice_id': self.voice_id, 'speed': 0.9, 'vol': 1, 'pitch': 0},
+            'audio_setting': {'sample_rate': 32000, 'bitrate': 128000, 'format': 'mp3', 'channel': 1},
+        }
+        data = _post_json(self.base_url, body, {'Authorization': f"Bearer {self.api_key}"})
+        status = data.get('base_resp', {})
+        if status.get('status_code', 0) != 0 or not data.get('data', {}).get('audio'):
+            raise RuntimeError(status.get('status_msg', 'no audio in response'))
+        return bytes.fromhex(data['data']['audio'])
+
+
+def cache_key(text, voice, lang, provider):
+    raw = '\x1f'.join([provider, voice, lang, text])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:20]
+
+
+def collect_words():
+    """lang -> sorted list of texts to synthesize."""
+    words = {}
+
+    for lang, pkg in PACKAGES.items():
+        csv_path = os.path.join(pkg, 'index.csv')
+        if not os.path.exists(csv_path):
+            continue
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                word = (row.get('word') or '').strip()
+                if word:
+                    words.setdefault(lang, set()).add(word)
+
+    if os.path.isdir('coding_friend_vocabulary'):
+        index, _ = compile_index('coding_friend_vocabulary')
+        words.setdefault('en', set()).update(index['english'])
+        for lang, terms in index['targets'].items():
+            words.setdefault(lang, set()).update(terms)
+
+    return {lang: sorted(texts) for lang, texts in words.items()}
+
+
+def generate(provider, langs=None, workers=4, rate=5.0):
+    os.makedirs(AUDIO_DIR, exist_ok=True)
+    words = collect_words()
+    if langs:
+        words = {lang: texts for lang, texts in words.items() if lang in langs}
+
+    manifest = {}
+    todo = []
+    for lang, texts in words.items():
+        manifest[lang] = {}
+        for text in texts:
+            key = cache_key(text, provider.voice(lang), lang, provider.name)
+            path = f"{AUDIO_DIR}/{key}.mp3".replace(os.sep, '/')
+            if os.path.exists(path):
+                manifest[lang][text] = path
+            else:
+                todo.append((lang, text, path))
+
+    cached = sum(len(m) for m in manifest.values())
+    print(f"{cached + len(todo)} words: {cached} cached, {len(todo)} to synthesize.")
+
+    limiter = RateLimiter(rate)
+
+    def synthesize(task):
+        lang, text, path = task
+        limiter.wait()
+        audio = provider.synthesize(text, lang)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(audio)
+        os.replace(temp_path, path)
+        return task
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(synthesize, task): task for task in todo}
+        for future in as_completed(futures):
+            lang, text, path = futures[future]
+            try:
+                future.result()
+                manifest[lang][text] = path
+            except Exception as e:
+                failed += 1
+                print(f"Error synthesizing '{text}' ({lang}): {e}")
+
+    # Sort for consistency
+    manifest = {lang: dict(sorted(entries.items())) for lang, entries in sorted(manifest.items())}
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        f.write("const TTS_MANIFEST = ")
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write(";")
+
+    print(f"Synthesized {len(todo) - failed}, failed {failed}. Manifest written to {MANIFEST_PATH}.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-generate TTS audio for all quiz words.")
+    parser.add_argument('--provider', choices=['google', 'minimax'], default='google', help="TTS provider")
+    parser.add_argument('--base-url', type=str, default=None, help="Override the provider endpoint (e.g. a local stand-in server)")
+    parser.add_argument('--voice', type=str, default=None, help="MiniMax voice_id")
+    parser.add_argument('--langs', type=str, default=None, help="Comma separated language codes to build (default: all)")
+    parser.add_argument('--workers', type=int, default=4, help="Concurrent requests")
+    parser.add_argument('--rate', type=float, default=5.0, help="Maximum requests per second")
+    args = parser.parse_args()
+
+    if args.provider == 'google':
+        kwargs = {'base_url': args.base_url} if args.base_url else {}
+        provider = GoogleTTS(os.environ.get('GOOGLE_TTS_API_KEY', ''), **kwargs)
+    else:
+        kwargs = {'base_url': args.base_url} if args.base_url else {}
+        if args.voice:
+            kwargs['voice_id'] = args.voice
+        provider = MiniMaxTTS(os.environ.get('MINIMAX_API_KEY', ''), **kwargs)
+
+    langs = set(args.langs.split(',')) if args.langs else None
+    generate(provider, langs, args.workers, args.rate)
@@ -0,0 +1,145 @@
+'''
+Load test for serve_assets.py (or any server hosting the app).
+
+Replays the page-load path: the app shell, then package images picked like a
+quiz round does, over persistent keep-alive connections. With --revalidate,
+each worker repeats its requests with If-None-Match, like a browser with a
+warm cache, so 304 handling can be measured as well.
+
+python3 serve_assets.py --pack mini-german-package-k3.pack &
+python3 load_test_assets.py --url http://127.0.0.1:8000 --workers 8 --duration 10
+python3 load_test_assets.py --url http://127.0.0.1:8000 --revalidate
+'''
+
+import re
+import json
+import time
+import random
+import argparse
+import threading
+import http.client
+import urllib.parse
+
+
+def load_shell_urls(index_path='index.html'):
+    """index.html plus the local scripts and stylesheets it references."""
+    with open(index_path, 'r', encoding='utf-8') as f:
+        html = f.read()
+    refs = re.findall(r'<(?:script|link)[^>]+(?:src|href)="([^"]+)"', html)
+    return ['index.html'] + [r for r in dict.fromkeys(refs) if '://' not in r and not r.startswith('//')]
+
+
+def load_image_urls(manifest_path='package_manifest.js', packages=None):
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    # First statement is "const PACKAGE_MANIFEST = {...};"
+    start = text.index('{')
+    manifest, _ = json.JSONDecoder().raw_decode(text[start:])
+    urls = []
+    for pkg, words in manifest.items():
+        if packages and pkg not in packages:
+            continue
+        for word_id, images in words.items():
+            urls.extend(f"{pkg}/{word_id}/{img}" for img in images)
+    return urls
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def worker(base, shell, paths, deadline, revalidate, stats, lock, seed):
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection(base.hostname, base.port or 80, timeout=10)
+    etags = {}
+    latencies, statuses, received, connections = [], {}, 0, 1
+
+    # Each "round" is the shell plus three option images, as in the quiz
+    while time.perf_counter() < deadline:
+        for path in shell + rng.sample(paths, min(3, len(paths))):
+            headers = {'Accept-Encoding': 'br, gzip'}
+            if revalidate and path in etags:
+                headers['If-None-Match'] = etags[path]
+            started = time.perf_counter()
+            try:
+                conn.request('GET', base.path.rstrip('/') + '/' + urllib.parse.quote(path, safe='/?=&'), headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection(base.hostname, base.port or 80, timeout=10)
+                connections += 1
+                statuses['error'] = statuses.get('error', 0) + 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+            received += len(body)
+            if response.getheader('ETag'):
+                etags[path] = response.getheader('ETag')
+            if response.getheader('Connection', '').lower() == 'close':
+                conn.close()
+                conn = http.client.HTTPConnection(base.hostname, base.port or 80, timeout=10)
+                connections += 1
+    conn.close()
+
+    with lock:
+        stats['latencies'].extend(latencies)
+        stats['bytes'] += received
+        stats['connections'] += connections
+        for status, n in statuses.items():
+            stats['statuses'][status] = stats['statuses'].get(status, 0) + n
+
+
+def run(url, workers, duration, revalidate, packages=None):
+    base = urllib.parse.urlsplit(url)
+    shell = load_shell_urls()
+    paths = load_image_urls(packages=packages)
+    if not paths:
+        print("No images found in package_manifest.js.")
+        return None
+
+    stats = {'latencies': [], 'bytes': 0, 'connections': 0, 'statuses': {}}
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + duration
+    threads = [threading.Thread(target=worker, args=(base, shell, paths, deadline, revalidate, stats, lock, i)) for i in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(stats['latencies'])
+    result = {
+        'requests': len(latencies),
+        'requests_per_s': round(len(latencies) / elapsed, 1),
+        'mb_per_s': round(stats['bytes'] / elapsed / 1e6, 2),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'connections': stats['connections'],
+        'statuses': {str(k): v for k, v in sorted(stats['statuses'].items(), key=lambda kv: str(kv[0]))},
+    }
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the asset server along the quiz page-load path.")
+    parser.add_argument('--url', type=str, default='http://127.0.0.1:8000', help="Server base URL")
+    parser.add_argument('--workers', type=int, default=8, help="Concurrent keep-alive clients")
+    parser.add_argument('--duration', type=float, default=10.0, help="Seconds to run")
+    parser.add_argument('--revalidate', action='store_true', help="Send If-None-Match for repeat requests (warm browser cache)")
+    parser.add_argument('--package', action='append', default=None, help="Only request images from this package (repeatable)")
+    parser.add_argument('--json', action='store_true', help="Print the result as JSON")
+    args = parser.parse_args()
+
+    result = run(args.url, args.workers, args.duration, args.revalidate, args.package)
+    if result and args.json:
+        print(json.dumps(result))
+    elif result:
+        print(f"{result['requests']} requests in {args.duration:.0f}s over {result['connections']} connections")
+        print(f"  {result['requests_per_s']} req/s, {result['mb_per_s']} MB/s")
+        print(f"  latency p50 {result['p50_ms']}ms, p95 {result['p95_ms']}ms, p99 {result['p99_ms']}ms")
+        print(f"  statuses {result['statuses']}")
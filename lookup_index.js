@@ -0,0 +1,5 @@
+const LOOKUP_INDEX = {
+  "de": {"package":"mini-german-package-k3","entries":[["gesagt","3500","gesagt"],["vampir","8490","vampir"],["bier","1283","bier"],["ergebnisse","2508","ergebnisse"],["einheitliches","2216","einheitliches"],["siedler","7430","siedler"],["koalition","4823","koalition"],["denken","1821","denken"],["wirkungsgrad","9288","wirkungsgrad"],["stätten","7894","stätten"],["optimale","6266","optimale"],["gegner","3315","gegner"],["eastwood","2107","eastwood"],["mexiko","5682","mexiko"],["kritiker","5015","kritiker"],["aus","591","aus"],["friedliche","3105","friedliche"],["länderinformationen","5413","länderinformationen"],["sicherheit","7412","sicherheit"],["eigener","2149","eigener"],["gesetze","3546","gesetze"],["schwache","7248","schwache"],["überwinden","9788","überwinden"],["öffnung","9722","öffnung"],["buddhismus","1477","buddhismus"],["v","9666","v"],["maßnahme","5586","maßnahme"],["diskussion","1950","diskussion"],["kein","4713","kein"],["laufe","5174","laufe"],["tendenz","8049","tendenz"],["zeitlich","9435","zeitlich"],["gesundheitswesen","3586","gesundheitswesen"],["starten","7730","starten"],["verlieren","8669","verlieren"],["guild","3828","guild"],["hervor","4036","hervor"],["christus","1640","christus"],["unterstützung","8436","unterstützung"],["gemeinde","3383","gemeinde"],["posten","6561","posten"],["statue","7748","statue"],["frac","3035","frac"],["populär","6539","populär"],["geworden","3623","geworden"],["brand","1406","brand"],["studierte","7861","studierte"],["area","466","area"],["stadtbezirk","7687","stadtbezirk"],["angelegenheiten","311","angelegenheiten"],["ph","6438","ph"],["wasserkraft","9073","wasserkraft"],["bravo","1420","bravo"],["dichten","1899","dichten"],["einführung","2185","einführung"],["wahren","9034","wahren"],["nachlass","5942","nachlass"],["höheres","4219","höheres"],["reinhold","6874","reinhold"],["router","7015","router"],["begründet","919","begründet"],["romane","6986","romane"],["airways","133","airways"],["katholische","4701","katholische"],["techniken","8022","techniken"],["heutigen","4054","heutigen"],["miniatur|die","5722","miniatur|die"],["bezeichnet","1258","bezeichnet"],["futurama","3140","futurama"],["beispiel","955","beispiel"],["angels","317","angels"],["lande","5119","lande"],["shakespeares","7404","shakespeares"],["staatspräsidenten","7675","staatspräsidenten"],["unwahrscheinlich","8451","unwahrscheinlich"],["betonung","1190","betonung"],["ressourcen","6910","ressourcen"],["problemen","6620","problemen"],["british","1449","british"],["weiterer","9126","weiterer"],["hitlers","4118","hitlers"],["weil","9109","weil"],["dvds","2084","dvds"],["behauptung","932","behauptung"],["intensiv","4383","intensiv"],["chemische","1606","chemische"],["befreundet","882","befreundet"],["rand","6757","rand"],["century","1583","century"],["bank","765","bank"],["feld","2863","feld"],["gegenteil","3307","gegenteil"],["überschritten","9777","überschritten"],["laufen","5175","laufen"],["revision","6922","revision"],["büro","1550","büro"],["beverly","1224","beverly"],["regierungen","6831","regierungen"],["truppen","8220","truppen"],["erhöhten","2537","erhöhten"],["solcher","7510","solcher"],["konzept","4952","konzept"],["unterworfen","8447","unterworfen"],["differenziert","1929","differenziert"],["südafrikanischen","7969","südafrikanischen"],["militärische","5704","militärische"],["habe","3865","habe"],["tempel","8046","tempel"],["front","3112","front"],["realen","6781","realen"],["zürcher","9618","zürcher"],["ostern","6316","ostern"],["motive","5832","motive"],["existenz","2769","existenz"],["generelle","3419","generelle"],["wörtlich","9382","wörtlich"],["betrieb","1207","betrieb"],["entstand","2420","entstand"],["werk","9184","werk"],["reichskanzler","6854","reichskanzler"],["freiwilligen","3086","freiwilligen"],["propheten","6653","propheten"],["spermien","7593","spermien"],["römer","7057","römer"],["verschwinden","8732","verschwinden"],["mio","5735","mio"],["stärkere","7889","stärkere"],["staatsoberhaupt","7673","staatsoberhaupt"],["ruhe","7028","ruhe"],["sirius","7465","sirius"],["britischen","1447","britischen"],["internationalen","4395","internationalen"],["singleauskopplung","7455","singleauskopplung"],["vergleiche","8612","vergleiche"],["leiden","5247","leiden"],["rathaus","6767","rathaus"],["kardinal","4663","kardinal"],["erlitt","2584","erlitt"],["leichte","5243","leichte"],["naturwissenschaftlichen","6006","naturwissenschaftlichen"],["ureinwohner","8456","ureinwohner"],["ausbruch","596","ausbruch"],["bräuche","1463","bräuche"],["buddha","1476","buddha"],["joe","4540","joe"],["bundesebene","1489","bundesebene"],["gesamten","3505","gesamten"],["ehre","2140","ehre"],["reicht","6859","reicht"],["hansestadt","3909","hansestadt"],["todesursache","8145","todesursache"],["nennenswerte","6029","nennenswerte"],["veranstaltung","8516","veranstaltung"],["überwiegende","9787","überwiegende"],["neubau","6043","neubau"],["mafia","5453","mafia"],["analysis","253","analysis"],["persischen","6408","persischen"],["möglichkeiten","5905","möglichkeiten"],["dichtung","1901","dichtung"],["stanley","7717","stanley"],["microsoft","5694","microsoft"],["rechtlich","6792","rechtlich"],["wiedergabe","9238","wiedergabe"],["messung","5659","messung"],["marcus","5513","marcus"],["lebenserwartung","5194","lebenserwartung"],["biographie","1310","biographie"],["simpson","7447","simpson"],["schulpflicht","7242","schulpflicht"],["mozart","5841","mozart"],["arbeiten","445","arbeiten"],["dicke","1903","dicke"],["eröffnung","2711","eröffnung"],["wochen","9315","wochen"],["variieren","8498","variieren"],["norden","6132","norden"],["jährlich","4593","jährlich"],["zucker","9497","zucker"],["seither","7345","seither"],["konzerte","4956","konzerte"],["griechischer","3758","griechischer"],["gesundheitlichen","3585","gesundheitlichen"],["tanz","8003","tanz"],["forum","3027","forum"],["stromberg","7846","stromberg"],["osze","6320","osze"],["siegfried","7438","siegfried"],["rep","6899","rep"],["ähnlicher","9685","ähnlicher"],["strebte","7832","strebte"],["beutetiere","1223","beutetiere"],["tatsache","8008","tatsache"],["portugal","6549","portugal"],["schwarzen","7260","schwarzen"],["das","1754","das"],["schwangerschaft","7253","schwangerschaft"],["anspielung","386","anspielung"],["hilfreich","4071","hilfreich"],["einiger","2220","einiger"],["uhr","9665","uhr"],["atlantik","510","atlantik"],["neu","6041","neu"],["serbische","7381","serbische"],["katherine","4698","katherine"],["gäste","3844","gäste"],["einstein","2245","einstein"],["verbundenen","8555","verbundenen"],["verheiratet","8624","verheiratet"],["lennons","5266","lennons"],["frankfurt","3050","frankfurt"],["amerikanische","227","amerikanische"],["spaniens","7571","spaniens"],["fälle","3151","fälle"],["ausgetauscht","645","ausgetauscht"],["nachkriegszeit","5941","nachkriegszeit"],["anatomie","254","anatomie"],["bundesstraßen","1506","bundesstraßen"],["kroatische","5023","kroatische"],["schlag","7181","schlag"],["hoffnungen","4133","hoffnungen"],["elemente","2299","elemente"],["bulgarische","1483","bulgarische"],["positiver","6559","positiver"],["pflanzen","6432","pflanzen"],["and","259","and"],["lehnte","5228","lehnte"],["katholiken","4699","katholiken"],["setzen","7392","setzen"],["nachteile","5948","nachteile"],["grade","3728","grade"],["erlangt","2569","erlangt"],["italienischer","4450","italienischer"],["beschränken","1107","beschränken"],["weizen","9135","weizen"],["projekte","6646","projekte"],["vorbereitung","8930","vorbereitung"],["armen","480","armen"],["begünstigt","923","begünstigt"],["präsidentin","6689","präsidentin"],["hu","4168","hu"],["einzige","2269","einzige"],["generationen","3417","generationen"],["unterliegen","8408","unterliegen"],["−","9805","−"],["gericht","3470","gericht"],["geistes","3342","geistes"],["höchstens","4210","höchstens"],["charaktere","1592","charaktere"],["ungeachtet","8359","ungeachtet"],["kennzeichnung","4733","kennzeichnung"],["gängigen","3841","gängigen"],["link","5339","link"],["zuge","9505","zuge"],["comic","1671","comic"],["erwähnung","2692","erwähnung"],["nachkommen","5940","nachkommen"],["östlich","9737","östlich"],["ganze","3203","ganze"],["psychoanalyse","6700","psychoanalyse"],["statistik","7738","statistik"],["acht","96","acht"],["allgemeinen","195","allgemeinen"],["strategische","7822","strategische"],["guevara","3825","guevara"],["notwendigkeit","6162","notwendigkeit"],["menschenrechtsverletzungen","5646","menschenrechtsverletzungen"],["leiter","5259","leiter"],["geschaffen","3510","geschaffen"],["erwähnten","2691","erwähnten"],["vielfaches","8860","vielfaches"],["model","5779","model"],["weißen","9138","weißen"],["binnen","1308","binnen"],["nachbarländern","5924","nachbarländern"],["einzeln","2263","einzeln"],["verlängert","8679","verlängert"],["schmerzen","7205","schmerzen"],["hohen","4137","hohen"],["zuständigkeit","9573","zuständigkeit"],["ähnlich","9682","ähnlich"],["louis","5386","louis"],["circa","1649","circa"],["katharina","4696","katharina"],["alliierten","200","alliierten"],["mangel","5492","mangel"],["heiratete","3984","heiratete"],["gerne","3495","gerne"],["student","7855","student"],["prinzipien","6605","prinzipien"],["bfai","1275","bfai"],["andré","273","andré"],["jugendliche","4570","jugendliche"],["sound","7543","sound"],["floyd","2958","floyd"],["mit","5747","mit"],["materielle","5558","materielle"],["kurzzeitig","5061","kurzzeitig"],["maximum","5578","maximum"],["wetter","9216","wetter"],["bessere","1141","bessere"],["produzieren","6629","produzieren"],["fotos","3032","fotos"],["juristische","4586","juristische"],["militär","5702","militär"],["schweden","7263","schweden"],["wissenschaftliche","9306","wissenschaftliche"],["effektive","2128","effektive"],["obwohl","6215","obwohl"],["europäer","2745","europäer"],["überblick","9745","überblick"],["schild","7173","schild"],["kollegen","4835","kollegen"],["friedrich","3106","friedrich"],["südostasien","7978","südostasien"],["niemand","6107","niemand"],["welt","9150","welt"],["durchbruch","2060","durchbruch"],["erbe","2458","erbe"],["öffentlichrechtlichen","9719","öffentlichrechtlichen"],["bürger","1542","bürger"],["spiegel","7603","spiegel"],["spielen","7609","spielen"],["menschen","5644","menschen"],["kfzkennzeichen","4744","kfzkennzeichen"],["java","4495","java"],["blutdruck","1353","blutdruck"],["späte","7648","späte"],["andrea","270","andrea"],["fakten","2807","fakten"],["auftretens","573","auftretens"],["wissenschaft","9301","wissenschaft"],["magdeburg","5457","magdeburg"],["maße","5584","maße"],["siedlung","7431","siedlung"],["legislaturperiode","5221","legislaturperiode"],["projekt","6645","projekt"],["enzyklopädie","2446","enzyklopädie"],["geleitet","3370","geleitet"],["heiligen","3969","heiligen"],["bundys","1514","bundys"],["unterscheidet","8419","unterscheidet"],["später","7650","später"],["umfangreicher","8297","umfangreicher"],["uno","8377","uno"],["vater","8502","vater"],["internationaler","4396","internationaler"],["fassen","2834","fassen"],["miniatur|","5718","miniatur|"],["shakespeare","7403","shakespeare"],["verwandten","8809","verwandten"],["männer","5888","männer"],["unbekannt","8344","unbekannt"],["verbrauch","8542","verbrauch"],["verursachte","8796","verursachte"],["zunehmendem","9535","zunehmendem"],["beobachtete","1030","beobachtete"],["matthias","5569","matthias"],["sexuelle","7400","sexuelle"],["weltkrieges","9157","weltkrieges"],["hot","4161","hot"],["helden","3991","helden"],["e","2104","e"],["dem","1803","dem"],["lloyd","5363","lloyd"],["händen","4191","händen"],["nochmals","6122","nochmals"],["singles","7456","singles"],["benötigten","1026","benötigten"],["schlägt","7200","schlägt"],["schnelle","7211","schnelle"],["bachs","741","bachs"],["vaters","8503","vaters"],["gewordene","3624","gewordene"],["experimentelle","2779","experimentelle"],["jedi","4506","jedi"],["gleiches","3675","gleiches"],["flüsse","2977","flüsse"],["charakters","1597","charakters"],["marken","5524","marken"],["tv","8240","tv"],["öl","9729","öl"],["kategoriefrau","4686","kategoriefrau"],["beteiligten","1185","beteiligten"],["genommen","3427","genommen"],["krone","5025","krone"],["black","1330","black"],["indonesien","4307","indonesien"],["gesichert","3555","gesichert"],["fand","2827","fand"],["parks","6360","parks"],["desselben","1851","desselben"],["überprüfung","9772","überprüfung"],["nur","6172","nur"],["neville","6068","neville"],["ausdrücke","601","ausdrücke"],["weswegen","9214","weswegen"],["neues","6052","neues"],["weichen","9105","weichen"],["dj","1962","dj"],["genutzten","3433","genutzten"],["wdr","9079","wdr"],["gemeinsamer","3389","gemeinsamer"],["everest","2758","everest"],["zentrums","9461","zentrums"],["verfasst","8581","verfasst"],["qualitativ","6722","qualitativ"],["lebenden","5191","lebenden"],["kartoffel","4676","kartoffel"],["landesmeister","5125","landesmeister"],["leitlinien","5262","leitlinien"],["begründen","917","begründen"],["omega","6249","omega"],["derek","1838","derek"],["fernsehsender","2873","fernsehsender"],["c","1551","c"],["weltkrieg","9156","weltkrieg"],["ecke","2118","ecke"],["gefördert","3283","gefördert"],["soziale","7557","soziale"],["ermöglichen","2592","ermöglichen"],["tiefe","8112","tiefe"],["autismus","705","autismus"],["stationiert","7736","stationiert"],["entlang","2396","entlang"],["autonomie","715","autonomie"],["dortmund","2000","dortmund"],["bars","775","bars"],["regisseure","6844","regisseure"],["fotografie","3030","fotografie"],["exil","2768","exil"],["gärten","3843","gärten"],["perser","6407","perser"],["vorgänge","8951","vorgänge"],["nacht","5946","nacht"],["motiv","5830","motiv"],["enthaltene","2391","enthaltene"],["parlamentarischen","6363","parlamentarischen"],["insgesamt","4357","insgesamt"],["parlamentswahlen","6365","parlamentswahlen"],["behandlung","927","behandlung"],["verfügbarkeit","8594","verfügbarkeit"],["speicher","7584","speicher"],["diamant","1893","diamant"],["rhetorik","6934","rhetorik"],["extremen","2793","extremen"],["bundes","1487","bundes"],["aufzunehmen","583","aufzunehmen"],["premierminister","6582","premierminister"],["präsident","6687","präsident"],["personal","6410","personal"],["geringe","3480","geringe"],["öffentliche","9715","öffentliche"],["vorhandenen","8956","vorhandenen"],["sagt","7086","sagt"],["insulin","4371","insulin"],["quattro","6726","quattro"],["verändert","8835","verändert"],["stunden","9664","stunden"],["erbaut","2457","erbaut"],["wählte","9366","wählte"],["bekannteste","969","bekannteste"],["rosa","7001","rosa"],["tor","8154","tor"],["kennzeichnen","4732","kennzeichnen"],["immanuel","4269","immanuel"],["stück","7898","stück"],["kommerzielle","4852","kommerzielle"],["befürchtete","890","befürchtete"],["kokain","4834","kokain"],["sun","7919","sun"],["römischkatholischen","7064","römischkatholischen"],["worden","9342","worden"],["bernhard","1067","bernhard"],["fühlt","3163","fühlt"],["ästhetik","9703","ästhetik"],["hiroshima","4107","hiroshima"],["hört","4224","hört"],["anpassung","371","anpassung"],["abseits","65","abseits"],["eintreten","2252","eintreten"],["dateien","1759","dateien"],["experten","2780","experten"],["summer","7918","summer"],["mild","5699","mild"],["herder","4014","herder"],["japanischen","4492","japanischen"],["bewirkte","1249","bewirkte"],["göttin","3848","göttin"],["weitreichende","9134","weitreichende"],["gesunde","3581","gesunde"],["automobilindustrie","712","automobilindustrie"],["wenig","9169","wenig"],["jüdische","4597","jüdische"],["freiwillige","3085","freiwillige"],["vorliegt","8973","vorliegt"],["neuroleptika","6059","neuroleptika"],["lufthansa","5396","lufthansa"],["grant","3737","grant"],["gesetzen","3547","gesetzen"],["abwehr","86","abwehr"],["vermuten","8700","vermuten"],["es","2712","es"],["maximal","5574","maximal"],["modernisierung","5788","modernisierung"],["flüchtlinge","2975","flüchtlinge"],["anfang","279","anfang"],["sprache","7633","sprache"],["mannheim","5500","mannheim"],["reifen","6863","reifen"],["tuberkulose","8228","tuberkulose"],["gottfried","3723","gottfried"],["kehrte","4712","kehrte"],["august","9621","august"],["hauses","3944","hauses"],["prostata","6657","prostata"],["vermieden","8693","vermieden"],["aufgetreten","546","aufgetreten"],["praktiziert","6575","praktiziert"],["verbringen","8552","verbringen"],["kündigte","5092","kündigte"],["mahone","5462","mahone"],["speed","7583","speed"],["kairo","4614","kairo"],["society","7492","society"],["argumente","472","argumente"],["angelegten","314","angelegten"],["verhält","8628","verhält"],["geliebte","3372","geliebte"],["einheiten","2212","einheiten"],["schwimmen","7286","schwimmen"],["telefon","8042","telefon"],["bruce","1454","bruce"],["schätzungen","7296","schätzungen"],["stimmen","7799","stimmen"],["palästina","6346","palästina"],["ereignis","2465","ereignis"],["heiraten","3982","heiraten"],["soweit","7547","soweit"],["fluch","2959","fluch"],["wörterbuch","9381","wörterbuch"],["vereinbart","8567","vereinbart"],["mussolini","5871","mussolini"],["ständigen","7885","ständigen"],["arm","476","arm"],["biss","1325","biss"],["nachgewiesen","5937","nachgewiesen"],["dokumentiert","1978","dokumentiert"],["franzosen","3057","franzosen"],["persönlichkeit","6420","persönlichkeit"],["kennzeichen","4731","kennzeichen"],["bilder","1292","bilder"],["souveränität","7546","souveränität"],["betriebe","1208","betriebe"],["empathie","2319","empathie"],["vorderen","8933","vorderen"],["publikum","6708","publikum"],["demenz","1805","demenz"],["europa","2737","europa"],["− °c","9806","− °c"],["dein","1798","dein"],["untersuchungen","8442","untersuchungen"],["el","2284","el"],["unterdrückung","8393","unterdrückung"],["anspielungen","387","anspielungen"],["kind","4753","kind"],["lebensweise","5200","lebensweise"],["standen","7713","standen"],["kämpfte","5067","kämpfte"],["zug","9503","zug"],["jenseits","4521","jenseits"],["datiert","1763","datiert"],["montag","5808","montag"],["samen","7097","samen"],["vororte","8982","vororte"],["gerhard","3469","gerhard"],["scheitert","7152","scheitert"],["soundtrack","7544","soundtrack"],["mexikanische","5680","mexikanische"],["außergewöhnliche","731","außergewöhnliche"],["lorelai","5381","lorelai"],["verstanden","8747","verstanden"],["nummer","6168","nummer"],["weimarer","9111","weimarer"],["hauptartikel","3929","hauptartikel"],["mein","5622","mein"],["piercing","6471","piercing"],["bord","1383","bord"],["bemerkungen","1005","bemerkungen"],["klima","4803","klima"],["betracht","1191","betracht"],["grundlegenden","3788","grundlegenden"],["sogenanntes","7503","sogenanntes"],["gesicht","3556","gesicht"],["könnten","5083","könnten"],["herausgegeben","4010","herausgegeben"],["kreislauf","4996","kreislauf"],["dreibein","2020","dreibein"],["à","9675","à"],["germanische","3491","germanische"]]},
+  "ja": {"package":"mini-japanese-package-k3","entries":[["いきなり","87","いきなり"],["怪物王女","5322","怪物王女"],["マルドゥックスクランブル","3011","マルドゥックスクランブル"],["現地語表記","6529","現地語表記"],["駅名","7931","駅名"],["闇に舞い降りた天才","7769","闇に舞い降りた天才"],["月島","5826","月島"],["冬","4027","冬"],["イラスト","951","イラスト"],["さいたまスーパーアリーナ","261","さいたまスーパーアリーナ"],["製作著作","7312","製作著作"],["白騎士物語","6644","白騎士物語"],["トーク","2262","トーク"],["プレイステーションポータブル","2803","プレイステーションポータブル"],["戦え超ロボット生命体トランスフォーマー","5397","戦え超ロボット生命体トランスフォーマー"],["おかあさんといっしょ","135","おかあさんといっしょ"],["れいこ","711","れいこ"],["汚言症","6233","汚言症"],["馬詰柳太郎","7928","馬詰柳太郎"],["三浦友和","3465","三浦友和"],["シリーズ天羽翼","1705","シリーズ天羽翼"],["近畿広域圏","7499","近畿広域圏"],["告白","4406","告白"],["ふたりはプリキュア","553","ふたりはプリキュア"],["ブギーポップは笑わない","2740","ブギーポップは笑わない"],["アニソンに愛を込めて","800","アニソンに愛を込めて"],["音楽根岸貴幸","7871","音楽根岸貴幸"],["長所","7710","長所"],["パルフェ","2536","パルフェ"],["対","4937","対"],["おねだり","151","おねだり"],["福島県福島中央テレビ年月日","6803","福島県福島中央テレビ年月日"],["ダンガンロンパ","2039","ダンガンロンパ"],["長崎県長崎文化放送","7706","長崎県長崎文化放送"],["花宵ロマネスク","7172","花宵ロマネスク"],["ほ","564","ほ"],["ポケットモンスター","2910","ポケットモンスター"],["コンピレーション","1535","コンピレーション"],["攻撃再開","5486","攻撃再開"],["精液","6959","精液"],["アキカン大地カケル","748","アキカン大地カケル"],["モノノ怪","3129","モノノ怪"],["官能昔話","4873","官能昔話"],["北斗の拳","4165","北斗の拳"],["予後","3629","予後"],["北アイルランド","4158","北アイルランド"],["フジテレビ版","2707","フジテレビ版"],["ヴェネト州","3421","ヴェネト州"],["横浜スタジアム","6104","横浜スタジアム"],["受賞歴など","4306","受賞歴など"],["マスクオブライト","2976","マスクオブライト"],["真恋姫夢想","6694","真恋姫夢想"],["第二部","6910","第二部"],["キャラクターデザイン総作画監督","1303","キャラクターデザイン総作画監督"],["テレビ宮崎","2131","テレビ宮崎"],["君に捧ぐ物語","4395","君に捧ぐ物語"],["駒込駅","7934","駒込駅"],["山梨県南都留郡","5043","山梨県南都留郡"],["フリー","2724","フリー"],["ブロッケンブラッド","2774","ブロッケンブラッド"],["ザクイズショウ","1634","ザクイズショウ"],["インターネット放送","964","インターネット放送"],["キング","1326","キング"],["長谷川裕一","7722","長谷川裕一"],["堂本剛名義","4537","堂本剛名義"],["ザイロモネア","1630","ザイロモネア"],["みんなのうた","634","みんなのうた"],["年月日テイルズ","5187","年月日テイルズ"],["朽木ルキア","5908","朽木ルキア"],["推理つき","5465","推理つき"],["エドゥアルドセラ","1044","エドゥアルドセラ"],["スクービードゥー","1801","スクービードゥー"],["天下覇道の剣","4730","天下覇道の剣"],["戦う司書","5396","戦う司書"],["スーパーマリン","1903","スーパーマリン"],["戦闘妖精少女","5411","戦闘妖精少女"],["チリ","2070","チリ"],["大賞","4708","大賞"],["総力特集","7041","総力特集"],["バンダイナムコゲームス","2496","バンダイナムコゲームス"],["デュエルマスターズ","2211","デュエルマスターズ"],["かきふらい","180","かきふらい"],["キプロス","1272","キプロス"],["エピソード","1048","エピソード"],["著作権","7238","著作権"],["みずたまぱにっく","615","みずたまぱにっく"],["妖奇士","4806","妖奇士"],["ティターン","2086","ティターン"],["輝きのタクト","7485","輝きのタクト"],["ウィルオウィスプ","988","ウィルオウィスプ"],["テレビ静岡","2154","テレビ静岡"],["シーズン","1723","シーズン"],["大沢樹生","4698","大沢樹生"],["ハングリーハート","2443","ハングリーハート"],["美術進行","7078","美術進行"],["ベルサイユのばら","2862","ベルサイユのばら"],["西郷隆盛","7329","西郷隆盛"],["ハロウィン","2438","ハロウィン"],["クオリア","1367","クオリア"],["声関俊彦","4596","声関俊彦"],["ウェブ","994","ウェブ"],["山口百恵全曲集位","5020","山口百恵全曲集位"],["青い文学シリーズ","7824","青い文学シリーズ"],["アカネ科","744","アカネ科"],["学園祭ツアー","4834","学園祭ツアー"],["モモっとトーク","3132","モモっとトーク"],["儒教","3917","儒教"],["女子アナ一直線","4793","女子アナ一直線"],["時ヲ止メテ","5754","時ヲ止メテ"],["長谷川穂積","7721","長谷川穂積"],["ピアニスト","2595","ピアニスト"],["この醜くも美しい世界","251","この醜くも美しい世界"],["鶴巻和哉","8007","鶴巻和哉"],["聖桜生徒会","7101","聖桜生徒会"],["シチリア州","1661","シチリア州"],["旧芸名の若本紀昭で出演","5700","旧芸名の若本紀昭で出演"],["太字はアニメ主題歌","4761","太字はアニメ主題歌"],["加藤英美里","4138","加藤英美里"],["塚本高史","4544","塚本高史"],["美術監督美術設定","7076","美術監督美術設定"],["まこと","582","まこと"],["書籍","5779","書籍"],["世界遺産","3517","世界遺産"],["第一体育館","6881","第一体育館"],["の夢旅人","488","の夢旅人"],["パチスロ貴族","2520","パチスロ貴族"],["遊☆戯☆王ファイブディーズ","7552","遊☆戯☆王ファイブディーズ"],["スキヤキウエスタン","1796","スキヤキウエスタン"],["ラッシュアワーカーター","3220","ラッシュアワーカーター"],["エリーのアトリエ","1070","エリーのアトリエ"],["声根谷美智子","4579","声根谷美智子"],["スタッフ映画","1823","スタッフ映画"],["大きさ","4643","大きさ"],["機動戦士ζガンダム","6118","機動戦士ζガンダム"],["紫","6990","紫"],["キャラクターデザイン","1299","キャラクターデザイン"],["忌野","5293","忌野"],["水野良樹","6220","水野良樹"],["任侠ヘルパー","3766","任侠ヘルパー"],["史料","4328","史料"],["装飾","7303","装飾"],["過去と未来の絆","7557","過去と未来の絆"],["ニーナアントーク","2356","ニーナアントーク"],["オペレーションケイオス","1117","オペレーションケイオス"],["羽根ペン","7083","羽根ペン"],["大阪大阪城ホール","22","大阪大阪城ホール"],["北海道立総合体育センター","4180","北海道立総合体育センター"],["初版","4065","初版"],["愛知ナゴヤドーム","28","愛知ナゴヤドーム"],["交響曲第番","3669","交響曲第番"],["会いたくて","3790","会いたくて"],["風のららら","7899","風のららら"],["アルフォンスエルリック","879","アルフォンスエルリック"],["圧縮","4484","圧縮"],["光の射す場所","3937","光の射す場所"],["文芸評論家","5547","文芸評論家"],["なつみ","458","なつみ"],["兄弟","3931","兄弟"],["ソウルファイト","1953","ソウルファイト"],["イタリア","934","イタリア"],["スポーツ","1883","スポーツ"],["真夏の果実","6687","真夏の果実"],["残酷な天使のテーゼ","6183","残酷な天使のテーゼ"],["同音異義語","4365","同音異義語"],["ボーカルミニアルバム","2906","ボーカルミニアルバム"],["本土","5892","本土"],["ザ","1627","ザ"],["カテゴリ別","1190","カテゴリ別"],["玉座を継ぐ者","6515","玉座を継ぐ者"],["日曜日","5629","日曜日"],["デビュー後","2208","デビュー後"],["ハリーと同学年の女子生徒","2427","ハリーと同学年の女子生徒"],["ムンバイ","3060","ムンバイ"],["心あたたまる物語","5287","心あたたまる物語"],["ルート","3301","ルート"],["カヌチ","1194","カヌチ"],["本人","5888","本人"],["角川書店角川スニーカー文庫","7348","角川書店角川スニーカー文庫"],["公務員元助役","3964","公務員元助役"],["アスミス","773","アスミス"],["遠藤","7576","遠藤"],["日本テレビ","5645","日本テレビ"],["製作協力","7309","製作協力"],["幕末機関説","5147","幕末機関説"],["一軍","3436","一軍"],["するがモンキー","323","するがモンキー"],["レジェンドオブクリスタニアレードン","3327","レジェンドオブクリスタニアレードン"],["テレビアニメネオ","2114","テレビアニメネオ"],["手塚","5429","手塚"],["山口朝日放送","5018","山口朝日放送"],["イラストコレクション","952","イラストコレクション"],["たっちしよっ","382","たっちしよっ"],["眞魔国でもバレンタイン","6680","眞魔国でもバレンタイン"],["新潟総合テレビ","5596","新潟総合テレビ"],["オトロシの妖姫","1107","オトロシの妖姫"],["あかりりゅりゅ羽","50","あかりりゅりゅ羽"],["コミック版","1508","コミック版"],["ハウス食品","2409","ハウス食品"],["愛とバクダン","5362","愛とバクダン"],["ビッグガンガン","2583","ビッグガンガン"],["古手川祐子","4313","古手川祐子"],["東京国立代々木競技場","34","東京国立代々木競技場"],["レッツゴー","3332","レッツゴー"],["この節の日付は現地時間","249","この節の日付は現地時間"],["彩雲国物語","5255","彩雲国物語"],["構成西崎義展","6093","構成西崎義展"],["ファゴット","2629","ファゴット"],["ときめきメモリアル","424","ときめきメモリアル"],["ウィキ","981","ウィキ"],["ブラント","2752","ブラント"],["ダークネス","2043","ダークネス"],["レートー","3344","レートー"],["オーシャンズ","1152","オーシャンズ"],["アサヒ飲料","764","アサヒ飲料"],["白洲次郎","6640","白洲次郎"],["注","6286","注"],["シリーズ古手梨花","1704","シリーズ古手梨花"],["埼玉西武ライオンズの選手一覧","4532","埼玉西武ライオンズの選手一覧"],["山本圭一","5039","山本圭一"],["エンディングテーマ集","1085","エンディングテーマ集"],["ワールドツアー","3400","ワールドツアー"],["喜劇","4439","喜劇"],["リトルバスターズ","3254","リトルバスターズ"],["空飛ぶ幽霊船","6859","空飛ぶ幽霊船"],["へいぞう","561","へいぞう"],["年度別投手成績","5177","年度別投手成績"],["市川雷蔵","5134","市川雷蔵"],["ガールミーツガール","1255","ガールミーツガール"],["ソーシャルゲーム","1975","ソーシャルゲーム"],["役所広司","5264","役所広司"],["原作青山剛昌","4255","原作青山剛昌"],["迷い猫オーバーラン","7509","迷い猫オーバーラン"],["スタジアム広島","1816","スタジアム広島"],["実演ツアー","4886","実演ツアー"],["第一譚","6891","第一譚"],["沈まぬ太陽","6251","沈まぬ太陽"],["エピソードシスの復讐","1055","エピソードシスの復讐"],["経済","7008","経済"],["驚きの嵐世紀の実験","7935","驚きの嵐世紀の実験"],["スロットル","1895","スロットル"],["儚くも永久のカナシ","3918","儚くも永久のカナシ"],["洋画海外ドラマ","6291","洋画海外ドラマ"],["虹","7274","虹"],["慈善活動","5388","慈善活動"],["第三巻","6895","第三巻"],["ランペイジ","3236","ランペイジ"],["写真集","4022","写真集"],["林部直樹ギター","6008","林部直樹ギター"],["スピッツ","1860","スピッツ"],["丸井","3570","丸井"],["森本浩史","6059","森本浩史"],["ジャイアント","1739","ジャイアント"],["キーワード","1336","キーワード"],["ショーバイ","1695","ショーバイ"],["柴田","6020","柴田"],["尾崎豊","4997","尾崎豊"],["本間昭光キーボード","5904","本間昭光キーボード"],["ベートーヴェン交響曲第番","2869","ベートーヴェン交響曲第番"],["木曜の怪談","5863","木曜の怪談"],["新選組","5606","新選組"],["ヴァンパイア騎士","3414","ヴァンパイア騎士"],["プレミアムエディション","2810","プレミアムエディション"],["東京都港区六本木","5946","東京都港区六本木"],["回","4450","回"],["技術者","5443","技術者"],["バジリスク","2465","バジリスク"],["沢田研二","6267","沢田研二"],["レイ","3309","レイ"],["楓","6078","楓"],["窒息自殺","6861","窒息自殺"],["ひめひび","539","ひめひび"],["ハヤテのごとく","2421","ハヤテのごとく"],["メルルのアトリエ","3109","メルルのアトリエ"],["藤井リナ","7261","藤井リナ"],["ペッティング","2870","ペッティング"],["ひぐらしの哭く頃に","518","ひぐらしの哭く頃に"],["週刊ファミ通","7539","週刊ファミ通"],["ボクとホロの一年","2898","ボクとホロの一年"],["ゼロの使い魔","1945","ゼロの使い魔"],["ファイブ","2624","ファイブ"],["死後","6177","死後"],["ピエロ","2600","ピエロ"],["経歴特色","7007","経歴特色"],["航空機","7151","航空機"],["施設","5612","施設"],["東京少女","5940","東京少女"],["ファミコンジャンプ","2631","ファミコンジャンプ"],["記号","7358","記号"],["航空","7150","航空"],["アナログ","797","アナログ"],["日本放送映画藝術大賞","5665","日本放送映画藝術大賞"],["つちやかおり","408","つちやかおり"],["エミルクロニクルオンライン","1060","エミルクロニクルオンライン"],["仙石原","3731","仙石原"],["渡辺秀武","6368","渡辺秀武"],["ラジオマテリアル","3210","ラジオマテリアル"],["石森史郎","6731","石森史郎"],["ジェイストーム","1730","ジェイストーム"],["ドラム","2299","ドラム"],["豆知識","7414","豆知識"],["モノクロームファクター","3126","モノクロームファクター"],["街","7292","街"],["テレビドラマ","2122","テレビドラマ"],["にょろーん","471","にょろーん"],["ホーカー","2891","ホーカー"],["発売時期","6620","発売時期"],["今日からマ王","3709","今日からマ王"],["飛べない翼人魚の瓶","7910","飛べない翼人魚の瓶"],["旅客合計","5613","旅客合計"],["週刊少年マガジン","7543","週刊少年マガジン"],["お笑いワイドショー","172","お笑いワイドショー"],["収録曲","4300","収録曲"],["イオン","922","イオン"],["アーススター","916","アーススター"],["ソニーミュージックレコーズ","1959","ソニーミュージックレコーズ"],["恋愛写真","5341","恋愛写真"],["少女革命ウテナ","4989","少女革命ウテナ"],["大阪府大阪市淀川区","4725","大阪府大阪市淀川区"],["瀬川","6405","瀬川"],["相模原市","6672","相模原市"],["ゴールドディスク大賞","1564","ゴールドディスク大賞"],["町","6586","町"],["私立ジャスティス学園","6809","私立ジャスティス学園"],["沢村栄治","6265","沢村栄治"],["死神姫の再婚","6181","死神姫の再婚"],["クイズマジックアカデミー","1361","クイズマジックアカデミー"],["徳川家康","5282","徳川家康"],["麒麟","8020","麒麟"],["ブレイドダンサー","2765","ブレイドダンサー"],["紅","6976","紅"],["ライト","3180","ライト"],["河津清三郎","6272","河津清三郎"],["はっぴぃセブン","498","はっぴぃセブン"],["ポケモン","2913","ポケモン"],["ファルシ","2635","ファルシ"],["心あたたまる物語外伝","5288","心あたたまる物語外伝"],["根岸孝旨ベース","6030","根岸孝旨ベース"],["用語解説","6559","用語解説"],["その他の登場人物","347","その他の登場人物"],["品番","4431","品番"],["工藤","5114","工藤"],["メイク","3063","メイク"],["大塚愛","4673","大塚愛"],["伊吹萃香","3778","伊吹萃香"],["踊る♪合唱部","7470","踊る♪合唱部"],["話","7372","話"],["山田正弘","5050","山田正弘"],["音隠れの里","7883","音隠れの里"],["アイゴ科","728","アイゴ科"],["北幌高校学校祭","4164","北幌高校学校祭"],["ハチミツとクローバー","2412","ハチミツとクローバー"],["製作総指揮","7311","製作総指揮"],["シングルベスト","1715","シングルベスト"],["獣の奏者","6509","獣の奏者"],["コトブキヤ","1496","コトブキヤ"],["キッズウォー","1261","キッズウォー"],["燃えよ剣年","6438","燃えよ剣年"],["青森テレビ","7831","青森テレビ"],["アイモ","739","アイモ"],["門矢士","7732","門矢士"],["写真家","4021","写真家"],["グッドネイバーホテル","1414","グッドネイバーホテル"],["後藤","5270","後藤"],["諸田敏","7399","諸田敏"],["タツノコ","1999","タツノコ"],["中","3524","中"],["飯田圭織","7918","飯田圭織"],["コヤス年月日","1510","コヤス年月日"],["陽子","7789","陽子"],["永島慎二","6228","永島慎二"],["特別篇","6467","特別篇"],["三島","3453","三島"],["日清食品カップヌードル","5686","日清食品カップヌードル"],["ラフレシア科","3223","ラフレシア科"],["摩訶不思議","5476","摩訶不思議"],["鉄木","7670","鉄木"],["ベネッセコーポレーション","2856","ベネッセコーポレーション"],["シナモン","1667","シナモン"],["街へいこうよ","7293","街へいこうよ"],["イメージキャラクター年","948","イメージキャラクター年"],["ひとつ屋根の下","532","ひとつ屋根の下"],["フーリエ","2739","フーリエ"],["メガネ編","3076","メガネ編"],["ミサワホーム","3020","ミサワホーム"],["ぼくらの勇気","578","ぼくらの勇気"],["オレらの夏は終わらない","1145","オレらの夏は終わらない"],["長崎県","7704","長崎県"],["近畿広域圏朝日放送","7500","近畿広域圏朝日放送"],["マクロス","2957","マクロス"],["シャーマンズ","1682","シャーマンズ"],["幕之内一歩日本王者","5144","幕之内一歩日本王者"],["忍","5295","忍"],["捜査録","5458","捜査録"],["助演男優賞","4141","助演男優賞"],["サイボーグ","1573","サイボーグ"],["けんと","228","けんと"],["美雪","7079","美雪"],["畑健二郎","6591","畑健二郎"],["真田一輝","6700","真田一輝"],["過去の出演番組","7562","過去の出演番組"],["ファン感謝祭","2653","ファン感謝祭"],["研ナオコ","6741","研ナオコ"],["能ある悪党は牙をかくすその","7112","能ある悪党は牙をかくすその"],["ベース","2867","ベース"],["山口","5015","山口"],["オカンとボクと時々オトン","1098","オカンとボクと時々オトン"],["ディアリースターズ","2165","ディアリースターズ"],["楽譜","6086","楽譜"],["忍たま乱太郎","5296","忍たま乱太郎"],["松田優作","5995","松田優作"],["東北地方","5953","東北地方"],["広島県広島ホームテレビ","5237","広島県広島ホームテレビ"],["その指だけが知っている","357","その指だけが知っている"],["沖田総悟","6253","沖田総悟"],["アンド","897","アンド"],["魔術師","7987","魔術師"],["理系男子キャラクターソング","6532","理系男子キャラクターソング"],["演劇集団キャラメルボックス","6384","演劇集団キャラメルボックス"],["木原敏江","5861","木原敏江"],["きらら","210","きらら"],["涼宮ハルヒの弦奏","6335","涼宮ハルヒの弦奏"],["スコットランド","1808","スコットランド"],["道教","7569","道教"],["シーズンファイナル","1724","シーズンファイナル"],["ピアノソロ","2597","ピアノソロ"],["鉄砲","7671","鉄砲"],["コア数スレッド数","1487","コア数スレッド数"],["発売順","6622","発売順"],["堀越高等学校の人物一覧","4535","堀越高等学校の人物一覧"],["接続詞省略","5464","接続詞省略"],["おまけ","154","おまけ"],["かおる","179","かおる"],["順位","7892","順位"],["疫学","6606","疫学"],["扶桑社","5436","扶桑社"],["サイドアームズ","1571","サイドアームズ"],["芸風","7182","芸風"],["安田","4861","安田"],["欧州連合","6136","欧州連合"],["赤木","7446","赤木"],["アニソン大好き","803","アニソン大好き"],["たかひさ","374","たかひさ"],["別冊","4071","別冊"],["追憶","7513","追憶"],["王子様はカエル","6520","王子様はカエル"],["御色なおし","5277","御色なおし"],["戦闘機一覧","5412","戦闘機一覧"],["会計方","3794","会計方"],["トライアングラー","2235","トライアングラー"],["プロモーションビデオ","2827","プロモーションビデオ"],["愛媛朝日テレビ","5372","愛媛朝日テレビ"],["名前背番号役職","4376","名前背番号役職"],["松平健","5984","松平健"],["市原隼人","5132","市原隼人"],["ボードゲーム","2907","ボードゲーム"],["構築済みスターターボックス","6094","構築済みスターターボックス"],["桑田佳祐","6040","桑田佳祐"],["フジテレビ火曜時枠の連続ドラマ","2706","フジテレビ火曜時枠の連続ドラマ"],["枚組","6009","枚組"],["ジャングルはいつもハレのちグゥ","1752","ジャングルはいつもハレのちグゥ"],["総合","7043","総合"],["松山","5982","松山"],["販売生産番号","7428","販売生産番号"],["間柴了","7743","間柴了"],["幕","5141","幕"],["検査","6075","検査"],["広島","5231","広島"],["夜桜四重奏","4631","夜桜四重奏"],["快刀乱麻","5309","快刀乱麻"],["さとり","270","さとり"],["東京ドーム","5930","東京ドーム"],["摩砂雪","5475","摩砂雪"],["リミックス","3270","リミックス"],["重量","7610","重量"],["福岡県出身の人物一覧","6796","福岡県出身の人物一覧"],["ちびたりあ","398","ちびたりあ"],["特捜戦隊デカレンジャー","6474","特捜戦隊デカレンジャー"],["逢坂","7527","逢坂"],["仮面ライダー倶楽部","3757","仮面ライダー倶楽部"],["バス","2466","バス"],["宇宙戦艦ヤマト完結編","4852","宇宙戦艦ヤマト完結編"],["合体技","4346","合体技"],["曽我泰久","5782","曽我泰久"],["ストレート","1847","ストレート"],["何もかもが君だった","3826","何もかもが君だった"],["身体的特徴","7474","身体的特徴"],["池田","6244","池田"],["ロシア帝国","3353","ロシア帝国"],["金曜プレステージ","7637","金曜プレステージ"],["カイルリース","1177","カイルリース"],["素敵探偵ラビリンス","6984","素敵探偵ラビリンス"],["薔薇水晶","7253","薔薇水晶"],["海外版","6317","海外版"],["畠山","6593","畠山"],["おねがいマイメロディ","149","おねがいマイメロディ"],["暴れん坊教師","5776","暴れん坊教師"],["上越新幹線","3490","上越新幹線"],["沖縄県琉球放送","6259","沖縄県琉球放送"],["近藤勇","7505","近藤勇"],["カゴメ","1184","カゴメ"],["ゲーム作品","1479","ゲーム作品"],["特撮監督","6476","特撮監督"],["番外編","6601","番外編"],["リングにかけろ","3285","リングにかけろ"],["ファントムブラッド","2648","ファントムブラッド"],["シドとチョコボの不思議なダンジョン","1666","シドとチョコボの不思議なダンジョン"],["池田城","6245","池田城"],["軌跡","7478","軌跡"],["山田城","5048","山田城"],["ヴォーカルアルバム","3426","ヴォーカルアルバム"],["ドライブ","2276","ドライブ"],["コスプレ","1495","コスプレ"],["実業家","4885","実業家"],["日刊スポーツドラマグランプリ","5623","日刊スポーツドラマグランプリ"],["上","3475","上"],["ひぐらしデイブレイク改","520","ひぐらしデイブレイク改"],["年東映","5204","年東映"],["鳴動の宇宙","8003","鳴動の宇宙"],["マグノリアの海賊","2962","マグノリアの海賊"],["ディスコグラフィー","2171","ディスコグラフィー"],["笑福亭鶴瓶","6877","笑福亭鶴瓶"],["カリフォルニア州","1212","カリフォルニア州"],["コムカデ綱","1509","コムカデ綱"],["やよい","658","やよい"],["ストレイラブハーツ","1844","ストレイラブハーツ"],["プレイスタイルアグレッシブベースライナー","2798","プレイスタイルアグレッシブベースライナー"],["箒","6947","箒"],["神崎","6762","神崎"],["裁判官","7300","裁判官"],["三目並べ","3470","三目並べ"],["志村","5302","志村"],["デスティニー","2199","デスティニー"],["舞原賢三","7144","舞原賢三"],["ほしいもパラダイス","568","ほしいもパラダイス"],["獏狩り","6508","獏狩り"],["両儀式坂本真綾","3522","両儀式坂本真綾"],["歌阿散井恋次伊藤健太郎","6150","歌阿散井恋次伊藤健太郎"],["フォウストーリー","2689","フォウストーリー"],["キャラクターファイル","1304","キャラクターファイル"],["わが家の歴史","716","わが家の歴史"],["ヤングガンガン","3158","ヤングガンガン"],["フクナガユウジ塚原悠","2701","フクナガユウジ塚原悠"],["ミスティアイランド","3023","ミスティアイランド"],["登場曲","6632","登場曲"],["江夏豊","6235","江夏豊"],["最後の晩餐","5796","最後の晩餐"],["マリア","3001","マリア"],["ターミネーター","2014","ターミネーター"],["石井","6721","石井"],["木曜スペシャル","5864","木曜スペシャル"],["販売","7425","販売"],["明解サイキック読本","5714","明解サイキック読本"],["バースト","2509","バースト"],["忍者戦隊カクレンジャー","5298","忍者戦隊カクレンジャー"],["亜高山帯針葉樹林","3662","亜高山帯針葉樹林"],["田村亮","6573","田村亮"],["スーパーマリオブラザーズ","1902","スーパーマリオブラザーズ"],["キディグレイド","1265","キディグレイド"],["カナリア","1193","カナリア"],["中央公論社","3540","中央公論社"],["朝日山城","5848","朝日山城"],["対応","4939","対応"],["レンタル執事","3343","レンタル執事"],["宮崎市民会館","4902","宮崎市民会館"],["マッスルジェネレーションズ","2986","マッスルジェネレーションズ"],["ダルビッシュ有","2037","ダルビッシュ有"],["輪サーカス","7489","輪サーカス"],["ハートキャッチプリキュア","2451","ハートキャッチプリキュア"],["グラビアアイドル","1417","グラビアアイドル"],["キャラクターデザイン原案","1301","キャラクターデザイン原案"],["テスカトリポカ","2096","テスカトリポカ"],["結城","7012","結城"],["生い立ち","6542","生い立ち"],["第六章","6914","第六章"],["けいこ","220","けいこ"],["加藤晴彦","4137","加藤晴彦"],["秋田県","6827","秋田県"],["直江兼続","6668","直江兼続"],["最終決戦","5803","最終決戦"],["愛玩王子","5378","愛玩王子"],["配給松竹","7605","配給松竹"],["かぶき町銀玉大争奪戦","194","かぶき町銀玉大争奪戦"],["涼宮ハルヒの戸惑","6337","涼宮ハルヒの戸惑"],["テーマ","2160","テーマ"],["着うた","6708","着うた"],["公演会場新宿コマ劇場","3983","公演会場新宿コマ劇場"],["ミュウツー","3037","ミュウツー"],["国会議員","4458","国会議員"],["最南端","5791","最南端"],["ひかる","512","ひかる"],["小林城","4965","小林城"],["ムック","3059","ムック"],["マザー","2964","マザー"],["マッケンジー","2984","マッケンジー"],["麒麟麦酒","8021","麒麟麦酒"],["上原","3476","上原"],["年月英知出版","5202","年月英知出版"],["太字は主役ヒロイン","4763","太字は主役ヒロイン"],["えいじ","128","えいじ"],["キングコング","1328","キングコング"]]},
+  "es": {"package":"mini-spanish-package-k3","entries":[["conceptual","1799","conceptual"],["logrado","5520","logrado"],["acompaña","87","acompaña"],["biología","1017","biología"],["ampliamente","420","ampliamente"],["radio","7653","radio"],["eficiencia","3067","eficiencia"],["novedad","6359","novedad"],["mito","5970","mito"],["investigación","5108","investigación"],["instrumental","4994","instrumental"],["distribución","2899","distribución"],["establecerse","3514","establecerse"],["pico","6968","pico"],["tienda","8992","tienda"],["acuerdo","123","acuerdo"],["stephen","8631","stephen"],["desea","2643","desea"],["homólogos","4615","homólogos"],["ángel","9751","ángel"],["átomos","9766","átomos"],["involucra","5117","involucra"],["mike","5932","mike"],["internos","5061","internos"],["toque","9055","toque"],["tragedia","9099","tragedia"],["martínez","5723","martínez"],["portadores","7146","portadores"],["goles","4312","goles"],["agrupa","245","agrupa"],["tácticas","9221","tácticas"],["piernas","6982","piernas"],["constituye","1962","constituye"],["iluminación","4735","iluminación"],["intentos","5030","intentos"],["sí","8793","sí"],["química","7633","química"],["incluye","4816","incluye"],["provocar","7499","provocar"],["ancestros","442","ancestros"],["corteza","2140","corteza"],["tratamientos","9148","tratamientos"],["nociones","6314","nociones"],["embajada","3165","embajada"],["prevenir","7289","prevenir"],["caracterizó","1272","caracterizó"],["sexo","8411","sexo"],["éstos","9778","éstos"],["victoria","9493","victoria"],["núcleos","6405","núcleos"],["editó","3048","editó"],["empezó","3203","empezó"],["interacción","5033","interacción"],["mariscal","5713","mariscal"],["great","4363","great"],["milenio","5936","milenio"],["sur","8753","sur"],["cerdos","1421","cerdos"],["eliminó","3151","eliminó"],["eréctil","3373","eréctil"],["postura","7184","postura"],["detractores","2721","detractores"],["páncreas","7583","páncreas"],["jimmy","5195","jimmy"],["junta","5243","junta"],["ventas","9439","ventas"],["respiración","7984","respiración"],["negros","6258","negros"],["filial","3941","filial"],["punta","7565","punta"],["climas","1571","climas"],["déficit","3001","déficit"],["etanol","3626","etanol"],["lapso","5304","lapso"],["llegaron","5488","llegaron"],["sector","8286","sector"],["pioneros","7001","pioneros"],["deudas","2724","deudas"],["cualidad","2265","cualidad"],["carencia","1287","carencia"],["lesión","5366","lesión"],["semen","8338","semen"],["fundado","4131","fundado"],["señalado","8421","señalado"],["elegidos","3131","elegidos"],["modificada","5993","modificada"],["válido","9635","válido"],["suficiente","8691","suficiente"],["aparece","524","aparece"],["moleculares","6003","moleculares"],["tormes","9058","tormes"],["botón","1078","botón"],["paladar","6684","paladar"],["patentes","6802","patentes"],["debilidad","2427","debilidad"],["dialecto","2731","dialecto"],["françois","4072","françois"],["edad","3034","edad"],["cien","1485","cien"],["numeración","6390","numeración"],["recepción","7713","recepción"],["sospecha","8605","sospecha"],["líder","5574","líder"],["texas","8964","texas"],["castilla","1331","castilla"],["wallace","9656","wallace"],["pronunciación","7420","pronunciación"],["mercado","5860","mercado"],["darle","2394","darle"],["aplicado","551","aplicado"],["eventos","3658","eventos"],["convertido","2082","convertido"],["drásticamente","2976","drásticamente"],["recuerdo","7777","recuerdo"],["diseñados","2849","diseñados"],["campesinos","1214","campesinos"],["escalar","3378","escalar"],["saga","8207","saga"],["alguno","328","alguno"],["entusiasmo","3333","entusiasmo"],["dificultades","2773","dificultades"],["disputas","2883","disputas"],["ocupando","6492","ocupando"],["impacto","4748","impacto"],["control","2053","control"],["histórica","4582","histórica"],["sudamericano","8675","sudamericano"],["homonimia","4610","homonimia"],["bellas","983","bellas"],["letra","5368","letra"],["árbol","9760","árbol"],["representantes","7932","representantes"],["aleación","297","aleación"],["alexander","313","alexander"],["conductores","1832","conductores"],["dejan","2504","dejan"],["mensajes","5851","mensajes"],["propuso","7452","propuso"],["corazón","2104","corazón"],["plantea","7027","plantea"],["propaganda","7425","propaganda"],["delgado","2513","delgado"],["villa","9525","villa"],["influyen","4910","influyen"],["positivas","7171","positivas"],["dj","2928","dj"],["conseguido","1900","conseguido"],["hubiera","4649","hubiera"],["metálica","5899","metálica"],["notación","6353","notación"],["instrucción","4993","instrucción"],["senadores","8344","senadores"],["campañas","1209","campañas"],["jurídicas","5250","jurídicas"],["artesanía","674","artesanía"],["borges","1074","borges"],["parece","6722","parece"],["convención","2074","convención"],["multitud","6097","multitud"],["concluyó","1809","concluyó"],["concentraciones","1791","concentraciones"],["simpson","8493","simpson"],["cantantes","1235","cantantes"],["movimientos","6069","movimientos"],["carro","1308","carro"],["causan","1361","causan"],["tuberculosis","9196","tuberculosis"],["estípula","3622","estípula"],["páginas","7581","páginas"],["pesos","6951","pesos"],["somos","8588","somos"],["toma","9036","toma"],["apariencia","536","apariencia"],["mañana","5782","mañana"],["falso","3845","falso"],["característicos","1276","característicos"],["tanques","8826","tanques"],["reproductivo","7944","reproductivo"],["man","5636","man"],["listas","5452","listas"],["india","4846","india"],["ingresó","4940","ingresó"],["expandir","3720","expandir"],["antisemitismo","499","antisemitismo"],["separación","8368","separación"],["cabe","1152","cabe"],["encargado","3230","encargado"],["salarios","8217","salarios"],["banco","917","banco"],["relevancia","7878","relevancia"],["propuesta","7449","propuesta"],["enfrenta","3272","enfrenta"],["irracional","5131","irracional"],["estoy","3571","estoy"],["poderoso","7079","poderoso"],["conceptos","1798","conceptos"],["antipsicóticos","498","antipsicóticos"],["vídeo","9646","vídeo"],["destacó","2685","destacó"],["preferentemente","7235","preferentemente"],["deben","2416","deben"],["realizó","7708","realizó"],["móviles","6167","móviles"],["organizó","6596","organizó"],["típicamente","9234","típicamente"],["luchas","5547","luchas"],["historiadores","4578","historiadores"],["dibujar","2740","dibujar"],["universalidad","9283","universalidad"],["dispuestos","2881","dispuestos"],["corresponden","2126","corresponden"],["page","6673","page"],["caminos","1204","caminos"],["occidentales","6471","occidentales"],["retina","8019","retina"],["reproducción","7939","reproducción"],["medicina","5803","medicina"],["vocalista","9596","vocalista"],["hindú","4564","hindú"],["domingo","2951","domingo"],["aumentan","796","aumentan"],["ojo","6523","ojo"],["emite","3184","emite"],["realidad","7691","realidad"],["inversión","5105","inversión"],["will","9677","will"],["feudales","3912","feudales"],["liberado","5386","liberado"],["sintió","8510","sintió"],["respeto","7983","respeto"],["rumores","8163","rumores"],["técnicas","9223","técnicas"],["paraíso","6718","paraíso"],["cable","1157","cable"],["procesar","7354","procesar"],["epstein","3353","epstein"],["musulmana","6122","musulmana"],["legales","5340","legales"],["escultura","3423","escultura"],["ligeramente","5416","ligeramente"],["maduro","5611","maduro"],["generalmente","4233","generalmente"],["balanza","909","balanza"],["centró","1408","centró"],["contribuyó","2052","contribuyó"],["infinito","4897","infinito"],["ascenso","695","ascenso"],["andrea","451","andrea"],["asiáticos","721","asiáticos"],["alcohol","292","alcohol"],["originalmente","6617","originalmente"],["departamentos","2554","departamentos"],["y","9705","y"],["problema","7340","problema"],["cualquiera","2268","cualquiera"],["categoríanovelas","1345","categoríanovelas"],["condición","1822","condición"],["químico","7635","químico"],["profesionales","7383","profesionales"],["proporciona","7440","proporciona"],["crónica","2254","crónica"],["rápida","8175","rápida"],["financieros","3971","financieros"],["funk","4144","funk"],["revelación","8040","revelación"],["history","4581","history"],["observadores","6441","observadores"],["básicamente","1137","básicamente"],["específica","3474","específica"],["ave","846","ave"],["famoso","3856","famoso"],["conferencias","1846","conferencias"],["especificación","3466","especificación"],["romboide","8125","romboide"],["molina","6005","molina"],["oxígeno","6661","oxígeno"],["otros","6655","otros"],["planeado","7016","planeado"],["compositor","1749","compositor"],["ciencias","1487","ciencias"],["ad","135","ad"],["andrés","454","andrés"],["once","6535","once"],["ejes","3101","ejes"],["estilo","3558","estilo"],["cree","2195","cree"],["salvar","8235","salvar"],["discapacidad","2830","discapacidad"],["interiores","5048","interiores"],["gobernantes","4305","gobernantes"],["cromátidas","2233","cromátidas"],["derivados","2580","derivados"],["trenes","9162","trenes"],["nuestras","6379","nuestras"],["productivos","7371","productivos"],["verdes","9458","verdes"],["geométrica","4262","geométrica"],["provisional","7493","provisional"],["permaneció","6895","permaneció"],["intestino","5081","intestino"],["conocidos","1881","conocidos"],["significado","8456","significado"],["accesorios","60","accesorios"],["claude","1563","claude"],["ozono","6662","ozono"],["modo","5997","modo"],["consultado","1980","consultado"],["demostraron","2531","demostraron"],["espaciales","3440","espaciales"],["magnético","5625","magnético"],["n°","6398","n°"],["actividad","101","actividad"],["uniones","9277","uniones"],["monte","6033","monte"],["piso","7005","piso"],["g","4173","g"],["describir","2625","describir"],["servidores","8397","servidores"],["dificultad","2772","dificultad"],["esperar","3486","esperar"],["tomar","9043","tomar"],["liverpool","5463","liverpool"],["tuvieran","9214","tuvieran"],["porcina","7135","porcina"],["universidad","9284","universidad"],["micrófono","5921","micrófono"],["título","9238","título"],["etiqueta","3636","etiqueta"],["etapa","3627","etapa"],["avanzado","843","avanzado"],["teclas","8855","teclas"],["terminada","8931","terminada"],["crónicas","2255","crónicas"],["jesucristo","5192","jesucristo"],["gastrulación","4215","gastrulación"],["estratégica","3574","estratégica"],["ve","9400","ve"],["investigaciones","5107","investigaciones"],["autónoma","834","autónoma"],["comprobar","1758","comprobar"],["compuestos","1765","compuestos"],["sección","8276","sección"],["respecto","7981","respecto"],["stewart","8635","stewart"],["traslado","9137","traslado"],["obtuvo","6463","obtuvo"],["guerras","4394","guerras"],["instrumento","4995","instrumento"],["terremotos","8943","terremotos"],["primordial","7314","primordial"],["escena","3389","escena"],["alfabeto","316","alfabeto"],["edificio","3040","edificio"],["sintagma","8507","sintagma"],["bosques","1076","bosques"],["fotografías","4042","fotografías"],["march","5694","march"],["tecnologías","8857","tecnologías"],["una","9257","una"],["aquiles","604","aquiles"],["oficina","6514","oficina"],["esfuerzo","3433","esfuerzo"],["juicios","5238","juicios"],["consideraron","1927","consideraron"],["alan","273","alan"],["alimento","340","alimento"],["conformado","1857","conformado"],["benito","989","benito"],["decidió","2440","decidió"],["consiguen","1932","consiguen"],["producida","7362","producida"],["asocia","722","asocia"],["papas","6700","papas"],["llamada","5467","llamada"],["alpes","356","alpes"],["cavidades","1368","cavidades"],["cubrir","2291","cubrir"],["híbridos","4685","híbridos"],["piero","6983","piero"],["efectivos","3060","efectivos"],["tantos","8830","tantos"],["isla","5139","isla"],["mago","5627","mago"],["extraer","3803","extraer"],["lucha","5543","lucha"],["exclusivamente","3695","exclusivamente"],["panamá","6692","panamá"],["soneto","8593","soneto"],["concluye","1808","concluye"],["muerto","6085","muerto"],["sería","8401","sería"],["sufren","8697","sufren"],["planeta","7018","planeta"],["subterránea","8657","subterránea"],["crítica","2250","crítica"],["mayoritaria","5777","mayoritaria"],["según","8319","según"],["ecológicos","3017","ecológicos"],["introdujeron","5087","introdujeron"],["auténtica","832","auténtica"],["rin","8077","rin"],["heridas","4529","heridas"],["procedimiento","7349","procedimiento"],["diámetro","2926","diámetro"],["bluray","1048","bluray"],["útero","9820","útero"],["cerca","1413","cerca"],["parientes","6734","parientes"],["creía","2205","creía"],["influye","4909","influye"],["correspondía","2130","correspondía"],["bosque","1075","bosque"],["llegar","5487","llegar"],["representante","7931","representante"],["proponen","7437","proponen"],["austrohúngaro","812","austrohúngaro"],["tv","9217","tv"],["escenario","3390","escenario"],["ocupación","6487","ocupación"],["bases","954","bases"],["contemporáneos","2003","contemporáneos"],["trataba","9143","trataba"],["johannes","5201","johannes"],["vienen","9509","vienen"],["reduce","7790","reduce"],["meramente","5858","meramente"],["mero","5868","mero"],["rango","7660","rango"],["ejecutivos","3088","ejecutivos"],["suizos","8711","suizos"],["hermana","4531","hermana"],["aplicar","554","aplicar"],["pasajes","6782","pasajes"],["redujo","7796","redujo"],["imposición","4775","imposición"],["documentales","2940","documentales"],["mejoró","5825","mejoró"],["estudiadas","3595","estudiadas"],["aguda","254","aguda"],["siquiera","8514","siquiera"],["madre","5606","madre"],["energía","3263","energía"],["papel","6701","papel"],["espectadores","3468","espectadores"],["aquino","605","aquino"],["génesis","4422","génesis"],["adelante","150","adelante"],["fenotipo","3894","fenotipo"],["mucho","6076","mucho"],["alrededores","361","alrededores"],["contenido","2007","contenido"],["utilizaban","9332","utilizaban"],["heath","4499","heath"],["letras","5369","letras"],["calificó","1183","calificó"],["dicen","2745","dicen"],["físico","4165","físico"],["parque","6741","parque"],["economistas","3018","economistas"],["teniendo","8909","teniendo"],["sueño","8689","sueño"],["ofrecer","6519","ofrecer"],["hambre","4474","hambre"],["lc","5327","lc"],["emilio","3178","emilio"],["intelectuales","5012","intelectuales"],["creado","2175","creado"],["fijos","3937","fijos"],["unida","9265","unida"],["misión","5963","misión"],["episodio","3350","episodio"],["puebla","7545","puebla"],["aumento","799","aumento"],["correspondiente","2128","correspondiente"],["valores","9363","valores"],["cárcel","2357","cárcel"],["ese","3426","ese"],["asegurar","699","asegurar"],["intelectual","5011","intelectual"],["tenga","8905","tenga"],["sufrir","8701","sufrir"],["diagnóstico","2727","diagnóstico"],["controlado","2057","controlado"],["autónomo","836","autónomo"],["marta","5719","marta"],["nazis","6232","nazis"],["palacio","6682","palacio"],["método","6152","método"],["caos","1241","caos"],["llevaba","5495","llevaba"],["electorales","3118","electorales"],["hermann","4533","hermann"],["clubes","1582","clubes"],["anatomía","440","anatomía"],["unió","9290","unió"],["subtropical","8659","subtropical"],["basta","955","basta"],["norteamericano","6343","norteamericano"],["reemplazar","7799","reemplazar"],["diarios","2739","diarios"],["abstracto","39","abstracto"],["módem","6162","módem"],["coincide","1612","coincide"],["pensaba","6842","pensaba"],["mendoza","5845","mendoza"],["comercial","1680","comercial"],["comparada","1700","comparada"],["religiosos","7887","religiosos"],["dark","2393","dark"],["continuaron","2024","continuaron"],["esferas","3432","esferas"],["sinónimo","8512","sinónimo"],["ancianos","446","ancianos"],["della","2514","della"],["altitud","373","altitud"],["museo","6116","museo"],["tubo","9197","tubo"],["australiana","808","australiana"],["stalingrado","8628","stalingrado"],["minutos","5954","minutos"],["profundo","7392","profundo"],["reconocía","7761","reconocía"],["históricos","4586","históricos"],["mercantilistas","5864","mercantilistas"],["atletas","763","atletas"],["rachel","7639","rachel"],["quiera","7617","quiera"],["sombrero","8584","sombrero"],["hart","4486","hart"],["recorrer","7768","recorrer"],["leve","5374","leve"],["glande","4293","glande"],["revolucionaria","8046","revolucionaria"],["exista","3702","exista"],["original","6614","original"],["golpes","4316","golpes"],["pecados","6822","pecados"],["gato","4216","gato"],["hijas","4554","hijas"],["prolongada","7410","prolongada"],["abundante","44","abundante"],["previos","7294","previos"],["bermudas","993","bermudas"],["accesible","58","accesible"],["nacionales","6188","nacionales"],["u","9243","u"],["pura","7572","pura"],["hegel","4508","hegel"],["cierta","1496","cierta"],["manifiesto","5654","manifiesto"],["galicia","4181","galicia"],["fortuna","4038","fortuna"],["belleza","984","belleza"],["actual","112","actual"],["nula","6388","nula"],["bastantes","957","bastantes"],["romance","8120","romance"],["permitió","6909","permitió"],["identifican","4711","identifican"],["efecto","3061","efecto"],["automóviles","821","automóviles"],["marcel","5693","marcel"],["horizontal","4629","horizontal"],["eficaces","3064","eficaces"],["motivos","6061","motivos"],["ceremoniales","1427","ceremoniales"],["explosión","3750","explosión"],["homosexual","4611","homosexual"],["metodología","5894","metodología"],["ocurre","6496","ocurre"],["sumar","8718","sumar"],["distrito","2902","distrito"],["batería","965","batería"],["niño","6305","niño"],["xvi","9700","xvi"],["provocan","7497","provocan"],["aceptan","77","aceptan"],["distintas","2893","distintas"],["hecha","4504","hecha"],["esos","3438","esos"],["originalidad","6616","originalidad"],["utilizada","9334","utilizada"],["imposible","4774","imposible"],["expresada","3762","expresada"],["ruta","8172","ruta"],["años","886","años"],["competiciones","1718","competiciones"],["trabajaba","9074","trabajaba"],["gol","4311","gol"],["élite","9769","élite"],["nada","6196","nada"],["diagrama","2729","diagrama"],["tabla","8809","tabla"],["corrupción","2134","corrupción"],["dirige","2818","dirige"],["consideradas","1920","consideradas"],["padre","6670","padre"],["termodinámica","8939","termodinámica"],["temperatura","8879","temperatura"],["ayuda","862","ayuda"]]}
+};
\ No newline at end of file
@@ -0,0 +1,167 @@
+'''
+Package versions and deltas between consecutive builds.
+
+generate_package_manifest.py --versions calls update_versions(). Each mini
+package gets a version number that only moves when a word or image changed, and
+each move writes a delta listing the added, removed and changed words:
+
+versions/index.json                          pointer file, small and never cached
+versions/<package>.json                      snapshot of the latest version (word, image hashes)
+versions/<package>/delta-<from>-<to>.json    what changed between two versions
+
+A client that has version 3 reads index.json, sees version 5 and fetches
+delta-3-4 and delta-4-5; a CDN can purge just the image paths listed in them.
+The manifest also gets PACKAGE_VERSIONS, the version in which each word's images
+last changed. script.js puts that in the image URLs (?v=N), so a rebuild only
+changes the URLs, and the cache entries, of the images that actually changed.
+
+versions/ is the version history of one deployment, so it is kept on the deploy
+host (and ignored by git) rather than committed; without --versions the manifest
+has no PACKAGE_VERSIONS and image URLs carry no ?v=.
+
+python3 package_versions.py
+'''
+
+import os
+import csv
+import sys
+import json
+import argparse
+
+VERSIONS_DIR = 'versions'
+KEEP_DELTAS = 20 # older deltas are deleted; clients further behind reload everything
+
+
+def _atomic_json(path, data, **kwargs):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, **kwargs)
+    os.replace(temp_path, path)
+
+
+def _load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not read {path} ({e}), starting over.")
+        return default
+
+
+def _read_words(pkg):
+    """{id: word} from the package's index.csv, {} if it has none."""
+    path = os.path.join(pkg, 'index.csv')
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return {row['id']: row['word'] for row in csv.DictReader(f) if row.get('id')}
+
+
+def snapshot(pkg, words, digests):
+    """{id: {'word', 'images': {name: sha1}}} for the words of one manifest package."""
+    names = _read_words(pkg)
+    return {
+        folder_id: {
+            'word': names.get(folder_id, ''),
+            'images': {img: digests[os.path.join(pkg, folder_id, img)] for img in sorted(images)},
+        }
+        for folder_id, images in sorted(words.items())
+    }
+
+
+def diff(old, new):
+    """Delta body between two snapshots: added, removed and changed words."""
+    added = {i: new[i] for i in new if i not in old}
+    removed = sorted(i for i in old if i not in new)
+    changed = {}
+    for i in new:
+        if i not in old or old[i] == new[i]:
+            continue
+        before, after = old[i]['images'], new[i]['images']
+        change = {
+            'images_added': {name: h for name, h in after.items() if name not in before},
+            'images_removed': sorted(name for name in before if name not in after),
+            'images_changed': {name: h for name, h in after.items() if name in before and before[name] != h},
+        }
+        if old[i]['word'] != new[i]['word']:
+            change['word'] = new[i]['word']
+        changed[i] = {key: value for key, value in change.items() if value}
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+
+def update_versions(manifest, digests, versions_dir=VERSIONS_DIR):
+    """
+    Compares each package with its last snapshot, bumps the version and writes a delta if
+    anything changed, and updates the pointer file.
+    Returns {pkg: {'version': N, 'words': {id: version its images last changed}}} for the manifest.
+    """
+    os.makedirs(versions_dir, exist_ok=True)
+    pointer_path = os.path.join(versions_dir, 'index.json')
+    pointer = _load_json(pointer_path, {})
+    result = {}
+
+    for pkg, words in manifest.items():
+        state_path = os.path.join(versions_dir, f"{pkg}.json")
+        state = _load_json(state_path, {'version': 0, 'words': {}, 'since': {}})
+        current = snapshot(pkg, words, digests)
+        version = state['version']
+        since = state.get('since', {})
+
+        if current != state['words']:
+            delta = diff(state['words'], current)
+            version += 1
+            for i, entry in current.items():
+                if i not in since or state['words'].get(i, {}).get('images') != entry['images']:
+                    since[i] = version
+            since = {i: since[i] for i in current}
+
+            if state['version']: # the first build has nothing to diff against
+                delta_dir = os.path.join(versions_dir, pkg)
+                os.makedirs(delta_dir, exist_ok=True)
+                name = f"delta-{state['version']}-{version}.json"
+                _atomic_json(os.path.join(delta_dir, name), {'package': pkg, 'from': state['version'], 'to': version, **delta},
+                             indent=1)
+                print(f"{pkg}: version {state['version']} -> {version} "
+                      f"({len(delta['added'])} added, {len(delta['removed'])} removed, {len(delta['changed'])} changed)")
+            else:
+                print(f"{pkg}: version {version} ({len(current)} words)")
+
+            _atomic_json(state_path, {'version': version, 'words': current, 'since': since}, separators=(',', ':'))
+        else:
+            print(f"{pkg}: unchanged at version {version}")
+
+        # Pointer: newest version and the chain of deltas still on disk
+        entry = pointer.get(pkg, {'deltas': []})
+        deltas = entry['deltas']
+        if version != state['version'] and state['version']:
+            deltas.append([state['version'], version, f"{pkg}/delta-{state['version']}-{version}.json"])
+        for _, _, old_file in deltas[:-KEEP_DELTAS]:
+            try:
+                os.remove(os.path.join(versions_dir, old_file))
+            except FileNotFoundError:
+                pass
+        pointer[pkg] = {'version': version, 'snapshot': f"{pkg}.json", 'deltas': deltas[-KEEP_DELTAS:]}
+        result[pkg] = {'version': version, 'words': since}
+
+    _atomic_json(pointer_path, pointer, indent=2)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show package versions and the deltas clients can fetch.")
+    parser.add_argument('--dir', type=str, default=VERSIONS_DIR, help="Versions folder")
+    args = parser.parse_args(argv)
+
+    pointer = _load_json(os.path.join(args.dir, 'index.json'), None)
+    if not pointer:
+        print(f"No versions yet in {args.dir}/. Run generate_package_manifest.py --versions.")
+        sys.exit(1)
+    for pkg, entry in pointer.items():
+        chain = ', '.join(f"{a}->{b}" for a, b, _ in entry['deltas']) or 'none'
+        print(f"{pkg}: version {entry['version']}, deltas: {chain}")
+
+
+if __name__ == "__main__":
+    main()
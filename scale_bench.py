@@ -0,0 +1,352 @@
+'''
+Scale benchmark for the index, mini and manifest tools.
+
+Builds synthetic package trees (10k, 50k and 100k word folders by default, each
+with word.txt and three small images) and runs generate_index_csv.py,
+create_mini_dataset.py, generate_package_manifest.py and generate_manifest.py
+on them, each in a fresh process. Every run records:
+
+- wall and CPU time
+- peak RSS of the process
+- file-system calls seen by an audit hook (open, scandir, listdir, mkdir, copy, ...)
+- read/write syscalls from /proc/self/io (Linux)
+- total syscalls from an extra strace -c pass, if strace is installed
+
+Trees are cached in --work and reused. Results go to a JSON file and can be
+compared against a saved baseline. Timings are noisy on shared machines, so
+they get a loose threshold (--tolerance); call counts and peak RSS are nearly
+deterministic and are held to a tight one. Any regression fails the run.
+
+python3 scale_bench.py run
+python3 scale_bench.py run --sizes 10000 --tools index,manifest --output bench.json
+python3 scale_bench.py run --output bench.json --baseline scale_bench_baseline.json
+python3 scale_bench.py compare bench.json scale_bench_baseline.json
+'''
+
+import os
+import sys
+import json
+import time
+import zlib
+import shutil
+import struct
+import argparse
+import platform
+import resource
+import subprocess
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PACKAGE = 'scale-german-package-k3' # the name create_mini_dataset.py and generate_package_manifest.py expect
+MINI_PACKAGE = 'mini-german-package-k3'
+DEFAULT_SIZES = '10000,50000,100000'
+DEFAULT_WORK = os.path.join('/tmp' if os.path.isdir('/tmp') else ROOT, 'carrot-scale-bench')
+IMAGES_PER_WORD = 3
+
+# Audit events counted as file-system calls
+FS_EVENTS = ('open', 'os.scandir', 'os.listdir', 'os.mkdir', 'os.remove', 'os.rename', 'os.rmdir',
+             'os.symlink', 'os.truncate', 'shutil.copyfile', 'shutil.copymode', 'shutil.copystat',
+             'shutil.copytree', 'shutil.rmtree')
+
+TIME_METRICS = ('wall_s', 'cpu_s')
+# Allowed relative increase per metric (timings: --tolerance)
+TOLERANCE = {'peak_rss_mb': 0.10, 'fs_calls': 0.05, 'read_syscalls': 0.05, 'write_syscalls': 0.05, 'syscalls': 0.05}
+# Absolute slack before a change counts as a regression, on top of the relative one
+NOISE_FLOOR = {'wall_s': 0.05, 'cpu_s': 0.05, 'peak_rss_mb': 2.0, 'fs_calls': 20,
+               'read_syscalls': 20, 'write_syscalls': 20, 'syscalls': 50}
+
+
+def _tiny_png(rgb):
+    """1x1 PNG, built by hand so the tree can be generated without Pillow."""
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    raw = b'\x00' + bytes(rgb)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', 1, 1, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw)) + chunk(b'IEND', b''))
+
+
+# --- Synthetic trees ---
+
+def tree_paths(work, words):
+    root = os.path.join(work, f"w{words}")
+    return {
+        'root': root,
+        'package': os.path.join(root, PACKAGE),
+        'manifest_cwd': os.path.join(root, 'manifest'), # mini-german-package-k3 -> the full tree
+        'image_cwd': os.path.join(root, 'cf'), # coding_friend_vocabulary/~assets/img with one image per word
+    }
+
+
+def build_tree(work, words, regenerate=False):
+    """Creates (or reuses) the synthetic tree for `words` word folders. Returns its paths."""
+    paths = tree_paths(work, words)
+    marker = os.path.join(paths['root'], 'tree.json')
+    if os.path.exists(marker) and not regenerate:
+        return paths
+    if os.path.exists(paths['root']):
+        shutil.rmtree(paths['root'])
+
+    started = time.perf_counter()
+    print(f"Building synthetic tree with {words} words in {paths['root']}...")
+    images = [_tiny_png((i * 80 % 256, 120, 200)) for i in range(IMAGES_PER_WORD)]
+    for word_id in range(1, words + 1):
+        word_dir = os.path.join(paths['package'], str(word_id))
+        os.makedirs(word_dir)
+        with open(os.path.join(word_dir, 'word.txt'), 'w', encoding='utf-8') as f:
+            f.write(f"wort{word_id}")
+        for n, data in enumerate(images, 1):
+            with open(os.path.join(word_dir, f"{n:02d}.png"), 'wb') as f:
+                f.write(data)
+
+    img_dir = os.path.join(paths['image_cwd'], 'coding_friend_vocabulary', '~assets', 'img')
+    os.makedirs(img_dir)
+    for word_id in range(1, words + 1):
+        with open(os.path.join(img_dir, f"word_{word_id}.png"), 'wb') as f:
+            f.write(images[0])
+
+    os.makedirs(paths['manifest_cwd'])
+    os.symlink(os.path.join('..', PACKAGE), os.path.join(paths['manifest_cwd'], MINI_PACKAGE))
+
+    with open(marker, 'w', encoding='utf-8') as f:
+        json.dump({'words': words, 'images_per_word': IMAGES_PER_WORD}, f)
+    print(f"  built in {time.perf_counter() - started:.1f}s")
+    return paths
+
+
+# --- Tools ---
+
+def tool_runs(paths, placeholders):
+    """name -> (cwd, carrot.py command or script path, argv, cleanup before the run)"""
+    mini_dir = os.path.join(paths['root'], MINI_PACKAGE)
+    return {
+        'index': (paths['root'], 'index', [PACKAGE], None),
+        'mini': (paths['root'], 'mini', [PACKAGE, '--items', '600'], mini_dir),
+        'manifest': (paths['manifest_cwd'], 'manifest', [] if placeholders else ['--no-placeholders'], None),
+        'image-manifest': (paths['image_cwd'], os.path.join(ROOT, 'generate_manifest.py'), [], None),
+    }
+
+
+def _proc_io():
+    try:
+        with open('/proc/self/io', 'r') as f:
+            return {key: int(value) for key, value in (line.split(': ') for line in f)}
+    except OSError:
+        return {}
+
+
+def run_child(command, cwd, argv, result_path):
+    """Runs one tool in this process and writes its measurements to result_path."""
+    fs_calls = {}
+
+    def audit(event, args):
+        if event in FS_EVENTS:
+            fs_calls[event] = fs_calls.get(event, 0) + 1
+
+    sys.path.insert(0, ROOT)
+    import carrot
+    import runpy
+    sys.addaudithook(audit)
+    os.chdir(cwd)
+    io_before = _proc_io()
+    wall_started, cpu_started = time.perf_counter(), time.process_time()
+    with open(os.devnull, 'w') as devnull:
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout = sys.stderr = devnull # progress bars and prints would only add noise
+        try:
+            if command in carrot.COMMANDS:
+                carrot.run_command(command, argv)
+            else:
+                runpy.run_path(command, run_name='__main__')
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+    wall, cpu = time.perf_counter() - wall_started, time.process_time() - cpu_started
+    io_after = _proc_io()
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result = {
+        'wall_s': round(wall, 3),
+        'cpu_s': round(cpu, 3),
+        'peak_rss_mb': round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1),
+        'fs_calls': sum(fs_calls.values()),
+        'fs_calls_by_event': dict(sorted(fs_calls.items(), key=lambda kv: -kv[1])),
+    }
+    if io_before:
+        result['read_syscalls'] = io_after['syscr'] - io_before['syscr']
+        result['write_syscalls'] = io_after['syscw'] - io_before['syscw']
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+
+
+def _strace_total(child_command, cwd):
+    """Total syscalls of the child under strace -f -c (process start-up included)."""
+    out_path = os.path.join(cwd, '.strace_summary.txt')
+    subprocess.run(['strace', '-f', '-c', '-qq', '-o', out_path] + child_command, cwd=cwd,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    total = None
+    with open(out_path, 'r') as f:
+        for line in f:
+            fields = line.split()
+            if fields and fields[-1] == 'total':
+                total = int(fields[3])
+    os.remove(out_path)
+    return total
+
+
+def measure(name, run, words, repeat, use_strace):
+    """Runs the tool `repeat` times and keeps the run with the median wall time."""
+    cwd, command, argv, cleanup = run
+    result_path = os.path.join(cwd, f".bench_{name}.json")
+    child = [sys.executable, os.path.abspath(__file__), '_child', command, cwd, result_path, '--'] + argv
+    runs = []
+    for _ in range(repeat):
+        if cleanup and os.path.exists(cleanup):
+            shutil.rmtree(cleanup)
+        subprocess.run(child, cwd=cwd, check=True)
+        with open(result_path, 'r', encoding='utf-8') as f:
+            runs.append(json.load(f))
+        os.remove(result_path)
+    runs.sort(key=lambda r: r['wall_s'])
+    result = runs[len(runs) // 2]
+    result['runs'] = [r['wall_s'] for r in runs]
+    result['us_per_word'] = round(result['wall_s'] / words * 1e6, 2)
+
+    if use_strace:
+        if cleanup and os.path.exists(cleanup):
+            shutil.rmtree(cleanup)
+        result['syscalls'] = _strace_total(child, cwd)
+        os.remove(result_path)
+    return result
+
+
+# --- Reporting ---
+
+def print_results(results, comparison=None):
+    print(f"\n{'words':>7} {'tool':<15} {'wall':>8} {'cpu':>8} {'us/word':>8} {'rss MB':>7} {'fs calls':>9} {'reads':>8} {'writes':>8}")
+    for size, tools in results.items():
+        for name, r in tools.items():
+            line = (f"{size:>7} {name:<15} {r['wall_s']:>7.2f}s {r['cpu_s']:>7.2f}s {r['us_per_word']:>8.1f} "
+                    f"{r['peak_rss_mb']:>7.1f} {r['fs_calls']:>9} {r.get('read_syscalls', '-'):>8} {r.get('write_syscalls', '-'):>8}")
+            if 'syscalls' in r:
+                line += f"  syscalls {r['syscalls']}"
+            if comparison and (size, name) in comparison:
+                line += f"  | wall {comparison[(size, name)]['wall_s']:+.0%} vs baseline"
+            print(line)
+
+
+def compare(current, baseline, time_tolerance):
+    """(per-(size, tool) relative changes, [regression messages])."""
+    changes, regressions = {}, []
+    for size, tools in current['results'].items():
+        for name, result in tools.items():
+            base = baseline['results'].get(size, {}).get(name)
+            if not base:
+                continue
+            delta = {}
+            for metric, floor in NOISE_FLOOR.items():
+                if metric not in result or metric not in base:
+                    continue
+                new, old = result[metric], base[metric]
+                delta[metric] = (new - old) / old if old else 0.0
+                tolerance = time_tolerance if metric in TIME_METRICS else TOLERANCE[metric]
+                if new > old * (1 + tolerance) and new - old > floor:
+                    regressions.append(f"{size} words, {name}: {metric} {old} -> {new} ({delta[metric]:+.0%})")
+            changes[(size, name)] = delta
+    return changes, regressions
+
+
+def report_comparison(current, baseline, tolerance):
+    changes, regressions = compare(current, baseline, tolerance)
+    if not changes:
+        print("Nothing in common with the baseline to compare.")
+        return True
+    print_results(current['results'], changes)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) (timings over {tolerance:.0%}, counts/memory over 5-10%):")
+        for message in regressions:
+            print(f"  {message}")
+        return False
+    print(f"\nNo regressions against the baseline (timings within {tolerance:.0%}, counts/memory within 5-10%).")
+    return True
+
+
+def run_benchmarks(args):
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    tools = [t.strip() for t in args.tools.split(',') if t.strip()]
+    use_strace = bool(shutil.which('strace')) and not args.no_strace
+    if not use_strace:
+        print("Note: strace not found (or --no-strace); recording audit-hook and /proc/self/io counts only.")
+
+    output = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'placeholders': args.placeholders,
+        'repeat': args.repeat,
+        'results': {},
+    }
+    for words in sizes:
+        paths = build_tree(args.work, words, args.regenerate)
+        runs = tool_runs(paths, args.placeholders)
+        unknown = [t for t in tools if t not in runs]
+        if unknown:
+            print(f"Unknown tool(s): {', '.join(unknown)} (choose from {', '.join(runs)})")
+            return False
+        output['results'][str(words)] = {}
+        for name in tools:
+            print(f"  {words} words: {name}...")
+            output['results'][str(words)][name] = measure(name, runs[name], words, max(1, args.repeat), use_strace)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        if not os.path.exists(args.baseline):
+            print(f"Baseline {args.baseline} not found; saving these results as the baseline.")
+            with open(args.baseline, 'w', encoding='utf-8') as f:
+                json.dump(output, f, indent=2)
+        else:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                return report_comparison(output, json.load(f), args.tolerance)
+    print_results(output['results'])
+    return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '_child':
+        # _child <command> <cwd> <result path> -- <argv...>
+        run_child(sys.argv[2], sys.argv[3], sys.argv[6:], sys.argv[4])
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Benchmark the index/mini/manifest tools on large synthetic package trees.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('run', help="Build (or reuse) the trees and benchmark the tools")
+    p.add_argument('--sizes', type=str, default=DEFAULT_SIZES, help="Comma separated word counts")
+    p.add_argument('--tools', type=str, default='index,mini,manifest,image-manifest', help="Comma separated tools to run")
+    p.add_argument('--work', type=str, default=DEFAULT_WORK, help="Where the synthetic trees are kept")
+    p.add_argument('--regenerate', action='store_true', help="Rebuild the trees even if they exist")
+    p.add_argument('--repeat', type=int, default=3, help="Runs per tool; the median run is reported")
+    p.add_argument('--placeholders', action='store_true', help="Let generate_package_manifest.py compute placeholder colors (slow: decodes every image)")
+    p.add_argument('--no-strace', action='store_true', help="Skip the extra strace pass even if strace is installed")
+    p.add_argument('--output', type=str, default=None, help="Write results to this JSON file")
+    p.add_argument('--baseline', type=str, default=None, help="Compare against this JSON file (created from this run if missing)")
+    p.add_argument('--tolerance', type=float, default=0.5, help="Allowed relative increase in wall/CPU time before it counts as a regression")
+
+    p = sub.add_parser('compare', help="Compare two result files")
+    p.add_argument('current')
+    p.add_argument('baseline')
+    p.add_argument('--tolerance', type=float, default=0.5, help="Allowed relative increase in wall/CPU time")
+
+    args = parser.parse_args()
+    if args.command == 'compare':
+        with open(args.current, 'r', encoding='utf-8') as f:
+            current = json.load(f)
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        ok = report_comparison(current, baseline, args.tolerance)
+    else:
+        ok = run_benchmarks(args)
+    sys.exit(0 if ok else 1)
@@ -81,7 +81,7 @@ const app = {
     state: {
         currentLang: null,
         character: '1', // Default character
-        wordMap: new Map(), // TargetWord (normalized) -> { original: string, id: string, images: string[] }
+        wordMap: new Map(), // TargetWord (normalized) -> { original: string, id: string, images: string[], placeholders: string[] }
         sequence: [], // Full Array of TargetWords (normalized) in order
         
         // Progress Tracking
@@ -162,8 +162,8 @@ const app = {
             const el = document.createElement('div');
             el.className = 'option-card disabled'; // Start disabled
             
-            // Add timestamp to prevent caching issues if any
-            el.innerHTML = `<img src="${item.image}?t=${Date.now()}" alt="${item.name}">`;
+            // Images are revalidated by ETag; a timestamp here would defeat the browser cache
+            el.innerHTML = `<img src="${item.image}" alt="${item.name}">`;
             
             el.addEventListener('click', () => app.handleWarmUpSelection(index, el));
             container.appendChild(el);
@@ -476,12 +476,18 @@ const app = {
         
         statusEl.innerText = 'Loading word sequence...';
         
-        const scaleFile = `${langConfig.package}/index.csv`;
-        const response = await fetch(scaleFile);
-        if (!response.ok) throw new Error(`Failed to load ${scaleFile}`);
-        const text = await response.text();
-        
-        app.parseScaleCSV(text, langConfig.package);
+        // Prebuilt lookup (generate_lookup_index.py) saves fetching and normalizing index.csv
+        const lookup = (typeof LOOKUP_INDEX !== 'undefined') ? LOOKUP_INDEX[lang] : null;
+        if (lookup && lookup.package === langConfig.package) {
+            app.loadLookupIndex(lookup);
+        } else {
+            const scaleFile = `${langConfig.package}/index.csv`;
+            const response = await fetch(scaleFile);
+            if (!response.ok) throw new Error(`Failed to load ${scaleFile}`);
+            const text = await response.text();
+            
+            app.parseScaleCSV(text, langConfig.package);
+        }
         
         app.state.allKeys = Array.from(app.state.wordMap.keys());
         console.log(`Loaded ${app.state.allKeys.length} words with images.`);
@@ -507,6 +513,8 @@ const app = {
         }
         
         const packageImages = PACKAGE_MANIFEST[packageName];
+        // Average color per image (generate_package_manifest.py), same order as the image list
+        const packagePlaceholders = (typeof PACKAGE_PLACEHOLDERS !== 'undefined' && PACKAGE_PLACEHOLDERS[packageName]) || {};
 
         for (let i = 1; i < lines.length; i++) { 
             const line = lines[i].trim();
@@ -520,10 +528,16 @@ const app = {
             
             if (packageImages[id] && packageImages[id].length > 0) {
                 const normalized = app.normalizeText(word);
+                // Same rule as the prebuilt lookup: the first word with a key keeps it
+                if (app.state.wordMap.has(normalized)) {
+                    console.warn(`Skipping "${word}" (${id}): same key as "${app.state.wordMap.get(normalized).original}"`);
+                    continue;
+                }
                 app.state.wordMap.set(normalized, {
                     original: word,
                     id: id,
-                    images: packageImages[id].map(img => `${packageName}/${id}/${img}`)
+                    images: app.imagePaths(packageName, id, packageImages[id]),
+                    placeholders: packagePlaceholders[id] || []
                 });
                 sequence.push(normalized);
             }
@@ -532,6 +546,42 @@ const app = {
         app.state.sequence = sequence;
     },
 
+    loadLookupIndex: (lookup) => {
+        const packageName = lookup.package;
+        if (typeof PACKAGE_MANIFEST === 'undefined' || !PACKAGE_MANIFEST[packageName]) {
+            console.error("Manifest not found for " + packageName);
+            return;
+        }
+
+        const packageImages = PACKAGE_MANIFEST[packageName];
+        const packagePlaceholders = (typeof PACKAGE_PLACEHOLDERS !== 'undefined' && PACKAGE_PLACEHOLDERS[packageName]) || {};
+        const sequence = [];
+
+        // Entries are [key, id, word], already normalized and free of duplicate keys
+        lookup.entries.forEach(([key, id, word]) => {
+            if (!packageImages[id] || packageImages[id].length === 0) return;
+            app.state.wordMap.set(key, {
+                original: word,
+                id: id,
+                images: app.imagePaths(packageName, id, packageImages[id]),
+                placeholders: packagePlaceholders[id] || []
+            });
+            sequence.push(key);
+        });
+
+        app.state.sequence = sequence;
+    },
+
+    // ?v= is the package version the word's images last changed in (package_versions.py), so
+    // unchanged images keep their URL, and their cache entry, across package rebuilds
+    imagePaths: (packageName, id, images) => {
+        const versions = (typeof PACKAGE_VERSIONS !== 'undefined' && PACKAGE_VERSIONS[packageName]) || null;
+        const version = versions && versions.words[id];
+        const query = version ? `?v=${version}` : '';
+        return images.map(img => `${packageName}/${id}/${img}${query}`);
+    },
+
+    // Keep in sync with normalize() in generate_lookup_index.py
     normalizeText: (text) => {
         let str = text.toLowerCase();
         if (app.state.currentLang === 'de') {
@@ -616,14 +666,22 @@ const app = {
             el.className = 'option-card disabled';
             
             // Select a random image from the available images for this word
-            // Add timestamp to prevent browser caching
             const imgIndex = Math.floor(Math.random() * opt.images.length);
             const randomImg = opt.images[imgIndex];
             
             // Debug log to verify randomness
             console.log(`Word: ${opt.original} (ID: ${opt.id}) - Selected Image: ${randomImg} (${imgIndex + 1}/${opt.images.length})`);
             
-            el.innerHTML = `<img src="${randomImg}?t=${Date.now()}" alt="Option">`;
+            // Paint the image's average color at once; cleared when the real image has loaded
+            const placeholder = opt.placeholders && opt.placeholders[imgIndex];
+            if (placeholder) {
+                el.style.background = placeholder;
+            }
+            
+            el.innerHTML = `<img src="${randomImg}" alt="Option">`;
+            if (placeholder) {
+                el.querySelector('img').addEventListener('load', () => { el.style.background = ''; }, { once: true });
+            }
             el.dataset.key = opt.key;
             el.addEventListener('click', () => app.handleSelection(el, targetKey));
             optionsArea.appendChild(el);
@@ -684,6 +742,24 @@ const app = {
             return;
         }
 
+        // Pre-generated audio (generate_tts_audio.py) needs no API round-trip
+        const prebuilt = (typeof TTS_MANIFEST !== 'undefined' && TTS_MANIFEST[app.state.currentLang])
+            ? TTS_MANIFEST[app.state.currentLang][text] : null;
+        if (prebuilt) {
+            app.state.currentAudioCache = prebuilt;
+            const audio = new Audio(prebuilt);
+            audio.onended = () => { if (onEnd) onEnd(); };
+            audio.onerror = (e) => {
+                console.error("Pre-generated audio playback error", e);
+                if (onEnd) onEnd();
+            };
+            audio.play().catch(e => {
+                console.error("Pre-generated audio play error", e);
+                if (onEnd) onEnd();
+            });
+            return;
+        }
+
         // Try Google TTS first
         try {
             const audioContent = await app.config.googleTTS.synthesize(text, app.state.currentLang);
@@ -739,6 +815,12 @@ const app = {
             return;
         }
         
+        const sprite = AUDIO_MANIFEST.sprites && AUDIO_MANIFEST.sprites[type];
+        if (sprite && sprite.clips.length > 0) {
+            app.playSpriteClip(type, sprite, onEnd);
+            return;
+        }
+        
         const files = AUDIO_MANIFEST[type];
         const randomFile = files[Math.floor(Math.random() * files.length)];
         let folder = '';
@@ -759,6 +841,50 @@ const app = {
         });
     },
 
+    // One <audio> per sprite; each effect seeks to a random clip and stops at its end
+    playSpriteClip: (type, sprite, onEnd) => {
+        app.state.spriteAudio = app.state.spriteAudio || {};
+        let audio = app.state.spriteAudio[type];
+        if (!audio) {
+            audio = new Audio(sprite.src);
+            audio.preload = 'auto';
+            app.state.spriteAudio[type] = audio;
+        }
+        
+        const [start, duration] = sprite.clips[Math.floor(Math.random() * sprite.clips.length)];
+        clearTimeout(audio.stopTimer);
+        audio.pause();
+        
+        const finish = () => {
+            clearTimeout(audio.stopTimer);
+            audio.pause();
+            if (onEnd) onEnd();
+        };
+        audio.onerror = (e) => {
+            console.error("Sprite audio error", e);
+            finish();
+        };
+        const seekAndPlay = () => {
+            audio.pendingPlay = null;
+            audio.currentTime = start;
+            audio.play().then(() => {
+                audio.stopTimer = setTimeout(finish, duration * 1000);
+            }).catch(e => {
+                console.error("Sprite play error", e);
+                finish();
+            });
+        };
+        
+        // A seek before the metadata has loaded is dropped, and the clip would play from 0
+        if (audio.pendingPlay) audio.removeEventListener('loadedmetadata', audio.pendingPlay);
+        if (audio.readyState >= HTMLMediaElement.HAVE_METADATA) {
+            seekAndPlay();
+        } else {
+            audio.pendingPlay = seekAndPlay;
+            audio.addEventListener('loadedmetadata', seekAndPlay, { once: true });
+        }
+    },
+
     playTreatAnimation: (startEl) => {
         const startRect = startEl.getBoundingClientRect();
         const charEl = document.getElementById('character-img');
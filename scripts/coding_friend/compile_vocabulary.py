@@ -0,0 +1,183 @@
+'''
+Compiles every coding_friend_vocabulary/en-*/*.csv into one vocabulary index.
+
+The index maps English word <-> target-language term <-> category <-> search
+keywords <-> image file, so downstream scripts (and the frontend) read a single
+JSON artifact instead of ~100 semicolon-delimited CSVs. Rebuilds are incremental:
+a source CSV is only re-parsed when its mtime or size changed.
+
+python3 scripts/coding_friend/compile_vocabulary.py
+python3 scripts/coding_friend/compile_vocabulary.py --lookup "food"
+python3 scripts/coding_friend/compile_vocabulary.py --lookup "das Essen" --lang de
+'''
+
+import os
+import csv
+import json
+import argparse
+
+INDEX_VERSION = 1
+DEFAULT_VOCAB_DIR = "coding_friend_vocabulary"
+INDEX_FILENAME = "vocabulary_index.json"
+WORDS_CSV = "all_english_words.csv"
+
+
+def _parse_source(path):
+    """Rows of a language CSV as [target, english, tags]. Format: target;english;;tags"""
+    rows = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for parts in csv.reader(f, delimiter=';'):
+            if len(parts) < 2:
+                continue
+            target, english = parts[0].strip(), parts[1].strip()
+            if target and english:
+                tags = parts[3].strip() if len(parts) > 3 else ''
+                rows.append([target, english, tags])
+    return rows
+
+
+def _source_files(vocab_dir):
+    """Yields (relative path, lang code, category) for each en-<lang>/en-<lang>_<category>.csv."""
+    for pair_dir in sorted(os.listdir(vocab_dir)):
+        pair_path = os.path.join(vocab_dir, pair_dir)
+        if not pair_dir.startswith('en-') or not os.path.isdir(pair_path):
+            continue
+        lang = pair_dir[len('en-'):]
+        for filename in sorted(os.listdir(pair_path)):
+            if not filename.endswith('.csv'):
+                continue
+            category = filename[:-len('.csv')]
+            if category.startswith(pair_dir + '_'):
+                category = category[len(pair_dir) + 1:]
+            yield f"{pair_dir}/{filename}", lang, category
+
+
+def _load_words_csv(path):
+    """English word -> (search keywords, image file) from all_english_words.csv."""
+    words = {}
+    if not os.path.exists(path):
+        return words
+    with open(path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            word = (row.get('English Word') or '').strip()
+            if word:
+                words[word] = ((row.get('Search Keywords') or '').strip(), (row.get('Image File') or '').strip())
+    return words
+
+
+def compile_index(vocab_dir=DEFAULT_VOCAB_DIR, index_path=None, force=False):
+    """
+    Builds (or incrementally refreshes) the index and writes it to index_path.
+    Returns (index dict, number of source CSVs re-parsed).
+    """
+    index_path = index_path or os.path.join(vocab_dir, INDEX_FILENAME)
+
+    previous = {}
+    if not force and os.path.exists(index_path):
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            if previous.get('version') != INDEX_VERSION:
+                previous = {}
+        except (OSError, ValueError):
+            previous = {}
+
+    old_sources = previous.get('sources', {})
+    sources = {}
+    reparsed = 0
+
+    for rel_path, lang, category in _source_files(vocab_dir):
+        stat = os.stat(os.path.join(vocab_dir, rel_path))
+        old = old_sources.get(rel_path)
+        if old and old['mtime'] == stat.st_mtime_ns and old['size'] == stat.st_size:
+            sources[rel_path] = old
+            continue
+        try:
+            rows = _parse_source(os.path.join(vocab_dir, rel_path))
+        except Exception as e:
+            print(f"Error reading {rel_path}: {e}")
+            continue
+        sources[rel_path] = {
+            'lang': lang,
+            'category': category,
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'rows': rows,
+        }
+        reparsed += 1
+
+    words_csv = os.path.join(vocab_dir, WORDS_CSV)
+    words_meta = _load_words_csv(words_csv)
+
+    # Derived lookup tables are cheap to rebuild from the cached rows
+    english = {}
+    targets = {}
+    for rel_path, source in sources.items():
+        lang, category = source['lang'], source['category']
+        for target, word, tags in source['rows']:
+            entry = english.get(word)
+            if entry is None:
+                keywords, image = words_meta.get(word, ('', ''))
+                entry = english[word] = {'keywords': keywords, 'image': image, 'categories': [], 'translations': {}}
+            if category not in entry['categories']:
+                entry['categories'].append(category)
+            translations = entry['translations'].setdefault(lang, [])
+            if target not in translations:
+                translations.append(target)
+            targets.setdefault(lang, {}).setdefault(target, {'english': word, 'category': category, 'tags': tags})
+
+    index = {
+        'version': INDEX_VERSION,
+        'sources': sources,
+        'english': dict(sorted(english.items())),
+        'targets': targets,
+    }
+
+    temp_path = index_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temp_path, index_path)
+    return index, reparsed
+
+
+class VocabularyIndex:
+    """Read-only view over a compiled index with O(1) lookups."""
+
+    def __init__(self, index):
+        self.index = index
+
+    @classmethod
+    def load(cls, vocab_dir=DEFAULT_VOCAB_DIR, index_path=None):
+        with open(index_path or os.path.join(vocab_dir, INDEX_FILENAME), 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def english_words(self):
+        return list(self.index['english'])
+
+    def lookup_english(self, word):
+        return self.index['english'].get(word)
+
+    def lookup_target(self, lang, term):
+        return self.index['targets'].get(lang, {}).get(term)
+
+    def languages(self):
+        return sorted(self.index['targets'])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the coding_friend vocabulary CSVs into one index.")
+    parser.add_argument('--vocab-dir', type=str, default=DEFAULT_VOCAB_DIR, help="coding_friend_vocabulary directory")
+    parser.add_argument('--output', type=str, default=None, help=f"Index path (default: <vocab-dir>/{INDEX_FILENAME})")
+    parser.add_argument('--force', action='store_true', help="Re-parse every CSV instead of only changed ones")
+    parser.add_argument('--lookup', type=str, default=None, help="Look up an English word (or a target term with --lang)")
+    parser.add_argument('--lang', type=str, default=None, help="Language code for --lookup of a target term, e.g. de")
+    args = parser.parse_args()
+
+    index, reparsed = compile_index(args.vocab_dir, args.output, force=args.force)
+    print(f"Index: {len(index['english'])} English words, {len(index['targets'])} languages, "
+          f"{len(index['sources'])} sources ({reparsed} re-parsed).")
+
+    if args.lookup:
+        vocab = VocabularyIndex(index)
+        result = vocab.lookup_target(args.lang, args.lookup) if args.lang else vocab.lookup_english(args.lookup)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
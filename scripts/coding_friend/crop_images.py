@@ -0,0 +1,116 @@
+'''
+Batch square-crop for the coding_friend images.
+
+Crops every image to a centered square and scales it down to a fixed size and
+quality; smaller images are cropped but never scaled up. Images that are already
+square and no larger than the target size are skipped, so re-running is a no-op.
+JPEGs are decoded in draft mode when they are being shrunk, which lets libjpeg
+downscale during decoding instead of decoding at full resolution.
+
+python3 scripts/coding_friend/crop_images.py
+python3 scripts/coding_friend/crop_images.py coding_friend_vocabulary/~assets/img --size 512 --quality 85 --workers 4
+'''
+
+import os
+import time
+import argparse
+
+DEFAULT_SIZE = 512
+DEFAULT_QUALITY = 85
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+def crop_to_square(image_path, size=DEFAULT_SIZE, quality=DEFAULT_QUALITY, verbose=True):
+    """
+    Crops an image to a centered square, shrunk to size x size if it is larger, overwriting it.
+    Returns 'cropped', 'skipped' or 'error'.
+    """
+    from PIL import Image # Deferred so importing this module (download_images.py does) stays cheap
+    try:
+        with Image.open(image_path) as img:
+            width, height = img.size
+            if width == height <= size:
+                return 'skipped'
+
+            if img.format == 'JPEG' and min(width, height) > size:
+                # libjpeg picks a 1/2, 1/4 or 1/8 decode scale that stays at least this large
+                scale = min(width, height) / size
+                img.draft('RGB', (int(width / scale), int(height / scale)))
+                width, height = img.size
+
+            new_side = min(width, height)
+            left = (width - new_side) // 2
+            top = (height - new_side) // 2
+
+            # Crop the center of the image
+            img_square = img.crop((left, top, left + new_side, top + new_side))
+            if new_side > size:
+                img_square = img_square.resize((size, size), Image.LANCZOS)
+
+            save_format = 'PNG' if image_path.lower().endswith('.png') else 'JPEG'
+            if save_format == 'JPEG' and img_square.mode != 'RGB':
+                # e.g. PNGs with alpha or palette images saved under a .jpg name
+                img_square = img_square.convert('RGB')
+
+        # The source file is closed before it gets overwritten
+        if save_format == 'JPEG':
+            img_square.save(image_path, 'JPEG', quality=quality, optimize=True)
+        else:
+            img_square.save(image_path, 'PNG', optimize=True)
+        if verbose:
+            print(f"  - Cropped to square: {image_path}")
+        return 'cropped'
+    except Exception as e:
+        if verbose:
+            print(f"  - Error cropping {image_path}: {e}")
+        return 'error'
+
+
+def _crop_task(args):
+    path, size, quality = args
+    before = os.path.getsize(path)
+    return path, crop_to_square(path, size, quality, verbose=False), before
+
+
+def crop_directory(image_dir, size=DEFAULT_SIZE, quality=DEFAULT_QUALITY, workers=None):
+    """Crops every image directly inside image_dir in a process pool and reports throughput."""
+    from concurrent.futures import ProcessPoolExecutor
+    if not os.path.isdir(image_dir):
+        print(f"Error: Directory not found: {image_dir}")
+        return
+
+    paths = sorted(
+        entry.path for entry in os.scandir(image_dir)
+        if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+    print(f"Found {len(paths)} images in {image_dir}.")
+
+    counts = {'cropped': 0, 'skipped': 0, 'error': 0}
+    bytes_in = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = [(p, size, quality) for p in paths]
+        for path, result, before in executor.map(_crop_task, tasks, chunksize=8):
+            counts[result] += 1
+            bytes_in += before
+            if result == 'error':
+                print(f"  - Error cropping {path}")
+
+    elapsed = time.perf_counter() - start
+    rate = len(paths) / elapsed if elapsed > 0 else 0.0
+    mb_rate = bytes_in / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+    print(f"Cropped {counts['cropped']}, skipped {counts['skipped']}, errors {counts['error']} "
+          f"in {elapsed:.2f}s ({rate:.1f} images/s, {mb_rate:.1f} MB/s read)")
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crop coding_friend images to fixed-size squares.")
+    parser.add_argument("image_dir", nargs='?', default=os.path.join("coding_friend_vocabulary", "~assets", "img"), help="Directory of images to process")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="Maximum output side length in pixels; smaller images are not upscaled")
+    parser.add_argument("--quality", type=int, default=DEFAULT_QUALITY, help="JPEG output quality")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    crop_directory(args.image_dir, args.size, args.quality, args.workers)
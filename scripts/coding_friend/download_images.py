@@ -2,8 +2,14 @@ import os
 import csv
 import shutil
 import re
-from icrawler.builtin import BingImageCrawler
-from PIL import Image
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from crop_images import crop_to_square
+from image_sources import BingBackend, make_backend
+from progress_journal import ResultsJournal, journal_path_for, compact
+from query_cache import QueryCache, CachedSource, DEFAULT_CACHE_DIR, DEFAULT_MAX_MB
 
 def safe_filename(text):
     # Replace spaces with underscores
@@ -14,143 +20,129 @@ def safe_filename(text):
     text = text.strip('. ')
     return text
 
-def crop_to_square(image_path):
+def set_image_column(row, filename):
+    # Row layout: [Word, Keywords, Image]
+    if len(row) < 3:
+        row.append(filename)
+    else:
+        row[2] = filename
+
+def process_row(row, position, total, output_dir, temp_root, backend):
+    """Crawls one word into its own temp dir and returns the updated row."""
+    word = row[0]
+    
+    # Use search keywords if available (2nd column)
+    search_query = word
+    if len(row) > 1 and row[1].strip():
+         search_query = row[1].strip()
+         
+    print(f"[{position}/{total}] Processing: {word} (Query: {search_query})")
+    
+    # Construct filename
+    base_name = safe_filename(word)
+    if not base_name:
+        base_name = "unnamed"
+    
+    # We aim for .jpg mostly with Bing crawler
+    target_filename = f"{base_name}.jpg"
+    target_path = os.path.join(output_dir, target_filename)
+    
+    # Keep an image the row already points at (e.g. retry/<name> folded in from a retry run)
+    existing = row[2] if len(row) > 2 else ''
+    if existing and os.path.exists(os.path.join(output_dir, existing)):
+        print(f"  - Image already exists: {existing}")
+        return row
+
+    # Check if already exists (optional, but good for retries)
+    if os.path.exists(target_path):
+        print(f"  - Image already exists: {target_filename}")
+        set_image_column(row, target_filename)
+        return row
+
+    # Each task crawls into its own temp dir so workers never see each other's files
+    task_dir = tempfile.mkdtemp(dir=temp_root)
     try:
-        with Image.open(image_path) as img:
-            width, height = img.size
-            new_side = min(width, height)
-            
-            left = (width - new_side) / 2
-            top = (height - new_side) / 2
-            right = (width + new_side) / 2
-            bottom = (height + new_side) / 2
+        src_file = backend.fetch(search_query, task_dir)
+        if src_file:
+            # Rename and move
+            shutil.move(src_file, target_path)
+            print(f"  - Downloaded: {target_filename}")
             
-            # Crop the center of the image
-            img_cropped = img.crop((left, top, right, bottom))
-            
-            # Save the cropped image, overwriting the original
-            img_cropped.save(image_path)
-            print(f"  - Cropped to square: {image_path}")
+            # Crop to square
+            crop_to_square(target_path)
+            set_image_column(row, target_filename)
+        else:
+            print(f"  - No image found for: {word}")
+            set_image_column(row, "")
     except Exception as e:
-        print(f"  - Error cropping {image_path}: {e}")
+        print(f"  - Error downloading {word}: {e}")
+        set_image_column(row, "")
+    finally:
+        shutil.rmtree(task_dir, ignore_errors=True)
+    
+    return row
 
-def download_images(csv_path, output_dir):
+def download_images(csv_path, output_dir, workers=4, backend=None):
     # Create output directory if not exists
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
         print(f"Created directory: {output_dir}")
 
-    # Temporary directory for crawler downloads
-    temp_dir = os.path.join(output_dir, 'temp_crawler')
-    if not os.path.exists(temp_dir):
-        os.makedirs(temp_dir)
+    if backend is None:
+        backend = BingBackend()
+
+    # Root for the per-task crawler temp directories
+    temp_root = os.path.join(output_dir, 'temp_crawler')
+    if not os.path.exists(temp_root):
+        os.makedirs(temp_root)
 
-    updated_rows = []
-    
     try:
         with open(csv_path, 'r', encoding='utf-8') as f:
             reader = csv.reader(f)
-            header = next(reader)
-            if 'Image File' not in header:
-                header.append('Image File')
-            updated_rows.append(header)
-            
-            rows = list(reader)
-            total = len(rows)
-            
-            for i, row in enumerate(rows):
-                if not row:
-                    continue
-                    
-                word = row[0]
-                
-                # Use search keywords if available (2nd column)
-                search_query = word
-                if len(row) > 1 and row[1].strip():
-                     search_query = row[1].strip()
-                     
-                print(f"[{i+1}/{total}] Processing: {word} (Query: {search_query})")
-                
-                # Construct filename
-                base_name = safe_filename(word)
-                if not base_name:
-                    base_name = "unnamed"
-                
-                # We aim for .jpg mostly with Bing crawler
-                target_filename = f"{base_name}.jpg"
-                target_path = os.path.join(output_dir, target_filename)
-                
-                # Check if already exists (optional, but good for retries)
-                if os.path.exists(target_path):
-                    print(f"  - Image already exists: {target_filename}")
-                    # Ensure row has filename in correct column (3rd column now: Word, Keywords, Image)
-                    # Input row: [Word, Keywords]
-                    if len(row) < 3:
-                        row.append(target_filename)
-                    else:
-                        row[2] = target_filename
-                    updated_rows.append(row)
-                    continue
-
-                # Crawl
-                # Clear temp dir to avoid confusion
-                for f_name in os.listdir(temp_dir):
-                    os.remove(os.path.join(temp_dir, f_name))
-                
-                try:
-                    crawler = BingImageCrawler(storage={'root_dir': temp_dir}, log_level='ERROR')
-                    # Filters can be added, e.g., license, type
-                    crawler.crawl(keyword=search_query, max_num=1, overwrite=True)
-                    
-                    # Find the downloaded file
-                    downloaded_files = os.listdir(temp_dir)
-                    if downloaded_files:
-                        src_file = os.path.join(temp_dir, downloaded_files[0])
-                        # Rename and move
-                        shutil.move(src_file, target_path)
-                        print(f"  - Downloaded: {target_filename}")
-                        
-                        # Crop to square
-                        crop_to_square(target_path)
-                        
-                        # Add filename to row
-                        if len(row) < 3:
-                            row.append(target_filename)
-                        else:
-                            row[2] = target_filename
-                    else:
-                        print(f"  - No image found for: {word}")
-                        if len(row) < 3:
-                            row.append("")
-                        else:
-                            row[2] = ""
-                except Exception as e:
-                    print(f"  - Error downloading {word}: {e}")
-                    if len(row) < 3:
-                        row.append("")
-                    else:
-                        row[2] = ""
-                
-                updated_rows.append(row)
-
+            next(reader)
+            rows = [row for row in reader if row]
     except Exception as e:
         print(f"Error reading CSV: {e}")
         return
 
+    # Every finished word is journaled right away; words that already have an
+    # image from an earlier (possibly crashed) run are skipped.
+    journal = ResultsJournal(journal_path_for(csv_path))
+    done = {word for word, record in journal.latest('download').items() if record.get('image')}
+    pending = [(i, row) for i, row in enumerate(rows) if row[0] not in done]
+
+    total = len(rows)
+    if done:
+        print(f"Resuming: {total - len(pending)} of {total} words already done.")
+    print(f"Crawling {len(pending)} words with {workers} workers...")
+
+    def run(item):
+        i, row = item
+        row = process_row(row, i + 1, total, output_dir, temp_root, backend)
+        journal.append({'kind': 'download', 'word': row[0], 'keywords': row[1] if len(row) > 1 else '', 'image': row[2]})
+        return row
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for _ in executor.map(run, pending):
+            pass
+
     # Cleanup temp dir
-    if os.path.exists(temp_dir):
-        shutil.rmtree(temp_dir)
+    if os.path.exists(temp_root):
+        shutil.rmtree(temp_root)
 
-    # Write updated CSV
-    try:
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerows(updated_rows)
+    # Fold the journal into the CSV (atomic replace, rows keep their order)
+    if compact(csv_path, journal) is not None:
         print(f"Updated CSV saved to {csv_path}")
-    except Exception as e:
-        print(f"Error writing CSV: {e}")
 
-if __name__ == "__main__":
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Download one image per English word in all_english_words.csv.")
+    parser.add_argument('--workers', type=int, default=4, help="Number of words crawled concurrently")
+    parser.add_argument('--backend', type=str, default='bing', help="Image source: 'bing' or the base URL of a JSON search endpoint")
+    parser.add_argument('--cache-dir', type=str, default=DEFAULT_CACHE_DIR, help="Search/image cache directory")
+    parser.add_argument('--cache-mb', type=int, default=DEFAULT_MAX_MB, help="Size budget for cached images (MB)")
+    parser.add_argument('--no-cache', action='store_true', help="Always search and download from the network")
+    args = parser.parse_args(argv)
+
     # Use relative paths or verify absolute paths
     base_dir = os.getcwd()
     # Updated path to match where the CSV actually is
@@ -160,4 +152,11 @@ if __name__ == "__main__":
     print(f"Working directory: {base_dir}")
     print(f"Target CSV: {csv_file}")
     
-    download_images(csv_file, img_dir)
+    source = make_backend(args.backend)
+    if not args.no_cache:
+        source = CachedSource(source, QueryCache(args.cache_dir, args.cache_mb * 1024 * 1024))
+    
+    download_images(csv_file, img_dir, workers=args.workers, backend=source)
+
+if __name__ == "__main__":
+    main()
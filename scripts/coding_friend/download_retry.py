@@ -2,8 +2,13 @@ import os
 import csv
 import re
 import shutil
-from icrawler.builtin import BingImageCrawler
-from PIL import Image
+import argparse
+import tempfile
+
+from crop_images import crop_to_square
+from image_sources import make_backend
+from progress_journal import ResultsJournal, journal_path_for
+from query_cache import QueryCache, CachedSource, DEFAULT_CACHE_DIR, DEFAULT_MAX_MB
 
 def safe_filename(text):
     """Converts text to a safe filename, replacing spaces with underscores."""
@@ -11,29 +16,13 @@ def safe_filename(text):
     text = re.sub(r'[^\w\s\.-]', '', text)
     return text.strip().replace(' ', '_')
 
-def crop_to_square(image_path):
-    """Crops an image to a square, keeping the center."""
-    try:
-        with Image.open(image_path) as img:
-            width, height = img.size
-            new_side = min(width, height)
-            
-            left = (width - new_side) / 2
-            top = (height - new_side) / 2
-            right = (width + new_side) / 2
-            bottom = (height + new_side) / 2
-            
-            img_cropped = img.crop((left, top, right, bottom))
-            # Convert to RGB if necessary (e.g. for PNGs with alpha) before saving as JPG
-            if img_cropped.mode in ("RGBA", "P"):
-                img_cropped = img_cropped.convert("RGB")
-            
-            img_cropped.save(image_path)
-            print(f"  - Cropped to square: {image_path}")
-    except Exception as e:
-        print(f"  - Error cropping {image_path}: {e}")
-
-def download_retry_images(csv_path, output_dir):
+def download_retry_images(csv_path, output_dir, source, rank=0, journal=None):
+    """
+    Downloads a replacement image per row. With a CachedSource, rank picks which
+    ranked candidate to use (1 = the result after the top one), without a new search.
+    Results go to the journal (if given); rows already retried with the same
+    keywords and rank are skipped.
+    """
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
         print(f"Created directory: {output_dir}")
@@ -49,6 +38,8 @@ def download_retry_images(csv_path, output_dir):
     total = len(reader)
     print(f"Found {total} words to retry.")
 
+    done = journal.latest('retry') if journal else {}
+
     for i, row in enumerate(reader, 1):
         word = row.get("English Word")
         keyword = row.get("Search Keywords")
@@ -59,30 +50,28 @@ def download_retry_images(csv_path, output_dir):
         if not word:
             continue
 
+        previous = done.get(word)
+        if previous and previous.get('image') and previous.get('keywords') == search_query and previous.get('rank') == rank:
+            print(f"[{i}/{total}] Already retried: {word} -> {previous['image']}")
+            continue
+
         print(f"[{i}/{total}] Retrying: {word} (Query: {search_query})")
         
         # Define safe filename
         filename_base = safe_filename(word)
-        # We will let icrawler download to a temp folder, then move/rename
-        temp_dir = os.path.join(output_dir, "temp_download")
-        
-        # Configure crawler
-        crawler = BingImageCrawler(storage={'root_dir': temp_dir})
+        # The source downloads into a temp folder, then we move/rename
+        temp_dir = tempfile.mkdtemp(dir=output_dir)
         
-        # Download 1 image
-        # Using filters to try to get better quality (photo) if possible, 
-        # but icrawler filter options for bing are limited. 
-        # 'type': 'photo' is often a good default filter for Bing if supported, 
-        # but icrawler's Bing crawler filter support is sometimes tricky.
-        # We'll just rely on the specific keywords.
-        crawler.crawl(keyword=search_query, max_num=1, overwrite=True)
+        try:
+            if isinstance(source, CachedSource):
+                src_file = source.fetch(search_query, temp_dir, rank=rank)
+            else:
+                src_file = source.fetch(search_query, temp_dir)
+        except Exception as e:
+            print(f"  - Error downloading {word}: {e}")
+            src_file = None
         
-        # Find the downloaded file
-        downloaded_files = os.listdir(temp_dir)
-        if downloaded_files:
-            # Assume the first file is the one we want (since max_num=1)
-            # Usually named 000001.jpg or similar
-            src_file = os.path.join(temp_dir, downloaded_files[0])
+        if src_file:
             ext = os.path.splitext(src_file)[1]
             dest_filename = f"{filename_base}{ext}"
             dest_file = os.path.join(output_dir, dest_filename)
@@ -94,6 +83,9 @@ def download_retry_images(csv_path, output_dir):
             # Crop
             crop_to_square(dest_file)
             
+            if journal:
+                journal.append({'kind': 'retry', 'word': word, 'keywords': search_query, 'image': dest_filename, 'rank': rank})
+            
             # Clean up temp dir content for next iteration
             # (icrawler might not clean up if we don't)
             # Actually, since we move the file, the dir should be empty or contain other junk?
@@ -106,8 +98,24 @@ def download_retry_images(csv_path, output_dir):
                 shutil.rmtree(temp_dir)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-download images listed in bad_words_retry.csv.")
+    parser.add_argument('--rank', type=int, default=0, help="Which cached search candidate to use (0 = top result, 1 = next, ...)")
+    parser.add_argument('--backend', type=str, default='bing', help="Image source: 'bing' or the base URL of a JSON search endpoint")
+    parser.add_argument('--cache-dir', type=str, default=DEFAULT_CACHE_DIR, help="Search/image cache directory")
+    parser.add_argument('--cache-mb', type=int, default=DEFAULT_MAX_MB, help="Size budget for cached images (MB)")
+    parser.add_argument('--no-cache', action='store_true', help="Always search and download from the network")
+    args = parser.parse_args()
+
     base_dir = os.getcwd()
     retry_csv = os.path.join(base_dir, "coding_friend_vocabulary", "bad_words_retry.csv")
     retry_img_dir = os.path.join(base_dir, "coding_friend_vocabulary", "~assets", "img", "retry")
+    main_csv = os.path.join(base_dir, "coding_friend_vocabulary", "all_english_words.csv")
+    
+    source = make_backend(args.backend)
+    if not args.no_cache:
+        source = CachedSource(source, QueryCache(args.cache_dir, args.cache_mb * 1024 * 1024))
     
-    download_retry_images(retry_csv, retry_img_dir)
+    # Results are folded into all_english_words.csv by progress_journal.py --compact
+    # (or automatically at the end of the next download_images run)
+    journal = ResultsJournal(journal_path_for(main_csv))
+    download_retry_images(retry_csv, retry_img_dir, source, rank=args.rank, journal=journal)
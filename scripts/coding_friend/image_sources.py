@@ -0,0 +1,142 @@
+'''
+Pluggable image sources for the coding_friend crawl scripts.
+
+A backend turns a search query into one downloaded image file:
+
+    backend.fetch(query, dest_dir) -> path of the downloaded file, or None
+
+and exposes the two steps behind it, which CachedSource (query_cache.py) uses
+to remember ranked candidates and their bytes:
+
+    backend.search(query, max_num) -> ranked list of candidate image URLs
+    backend.download(url) -> image bytes, or None
+
+Backends are shared by every worker thread, so each one keeps its expensive
+objects (crawler instance, HTTP session) per thread and reuses them across words.
+
+- BingBackend: icrawler's BingImageCrawler (the default)
+- HttpBackend: a plain JSON search endpoint, e.g. a local fake server for tests.
+  GET {base_url}/search?q=<query>&n=<max_num> -> {"results": ["http://.../a.jpg", ...]}
+'''
+
+import os
+import threading
+from urllib.parse import urlparse
+
+
+def _make_url_recorder():
+    from icrawler import ImageDownloader
+
+    class UrlRecorder(ImageDownloader):
+        """Downloader that only records candidate URLs in rank order."""
+
+        def download(self, task, default_ext, timeout=5, max_retry=3, overwrite=False, **kwargs):
+            with self.lock:
+                if self.reach_max_num():
+                    self.signal.set(reach_max_num=True)
+                    return False
+                self.urls.append(task['file_url'])
+                self.fetched_num += 1
+            return True
+
+    return UrlRecorder
+
+
+def _session(local):
+    session = getattr(local, 'session', None)
+    if session is None:
+        import requests
+        session = requests.Session()
+        local.session = session
+    return session
+
+
+class BingBackend:
+    def __init__(self, log_level='ERROR', timeout=10):
+        self.log_level = log_level
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _crawler(self, dest_dir):
+        crawler = getattr(self._local, 'crawler', None)
+        if crawler is None:
+            from icrawler.builtin import BingImageCrawler
+            crawler = BingImageCrawler(storage={'root_dir': dest_dir}, log_level=self.log_level)
+            self._local.crawler = crawler
+        else:
+            crawler.set_storage({'root_dir': dest_dir})
+        return crawler
+
+    def fetch(self, query, dest_dir):
+        crawler = self._crawler(dest_dir)
+        crawler.crawl(keyword=query, max_num=1, overwrite=True)
+
+        downloaded_files = sorted(os.listdir(dest_dir))
+        if downloaded_files:
+            return os.path.join(dest_dir, downloaded_files[0])
+        return None
+
+    def search(self, query, max_num=1):
+        searcher = getattr(self._local, 'searcher', None)
+        if searcher is None:
+            from icrawler.builtin import BingImageCrawler
+            searcher = BingImageCrawler(downloader_cls=_make_url_recorder(), log_level=self.log_level)
+            self._local.searcher = searcher
+
+        searcher.downloader.urls = []
+        searcher.crawl(keyword=query, max_num=max_num)
+        return list(searcher.downloader.urls)
+
+    def download(self, url):
+        try:
+            response = _session(self._local).get(url, timeout=self.timeout)
+        except Exception:
+            return None
+        if response.status_code != 200 or not response.content:
+            return None
+        return response.content
+
+
+class HttpBackend:
+    def __init__(self, base_url, timeout=10):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def search(self, query, max_num=1):
+        response = _session(self._local).get(f"{self.base_url}/search", params={'q': query, 'n': max_num}, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json().get('results', [])[:max_num]
+
+    def download(self, url):
+        response = _session(self._local).get(url, timeout=self.timeout)
+        if response.status_code != 200 or not response.content:
+            return None
+        return response.content
+
+    def fetch(self, query, dest_dir):
+        for url in self.search(query, max_num=1):
+            data = self.download(url)
+            if data:
+                return write_image(data, url, dest_dir)
+        return None
+
+
+def write_image(data, url, dest_dir, name='000001'):
+    """Writes downloaded bytes into dest_dir, keeping the URL's extension when it has one."""
+    ext = os.path.splitext(urlparse(url).path)[1].lower()
+    if ext not in ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'):
+        ext = '.jpg'
+    dest_path = os.path.join(dest_dir, f"{name}{ext}")
+    with open(dest_path, 'wb') as f:
+        f.write(data)
+    return dest_path
+
+
+def make_backend(spec):
+    """'bing' (default) or an http(s):// search endpoint base URL."""
+    if not spec or spec == 'bing':
+        return BingBackend()
+    if spec.startswith(('http://', 'https://')):
+        return HttpBackend(spec)
+    raise ValueError(f"Unknown image backend: {spec}")
@@ -0,0 +1,176 @@
+'''
+Append-only results journal for the coding_friend download scripts.
+
+download_images and download_retry append one JSON line per finished word
+(fsynced), so a crash loses at most the word in flight and the next run can
+skip everything already done. Compaction folds the journal into
+all_english_words.csv with an atomic replace, then shrinks the journal to the
+latest retry record per word: the CSV has no rank column, and download_retry
+needs keywords + rank to skip words it already retried.
+
+Record: {"kind": "download" | "retry", "word": ..., "keywords": ..., "image": ..., "rank": ...}
+
+python3 scripts/coding_friend/progress_journal.py --compact
+'''
+
+import os
+import csv
+import json
+import argparse
+import threading
+
+RETRY_SUBDIR = 'retry'
+
+
+def journal_path_for(csv_path):
+    return os.path.splitext(csv_path)[0] + '.journal.jsonl'
+
+
+class ResultsJournal:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self._terminate_torn_line()
+
+    def _terminate_torn_line(self):
+        # A crash mid-append can leave a line without its newline; close it off
+        # so the next record doesn't get glued onto the broken one.
+        try:
+            with open(self.path, 'rb+') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+        except FileNotFoundError:
+            pass
+
+    def append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def records(self):
+        """Yields journal records in order. A torn last line from a crash is ignored."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def latest(self, kind):
+        """word -> most recent record of the given kind."""
+        return {r['word']: r for r in self.records() if r.get('kind') == kind and r.get('word')}
+
+    def clear(self):
+        with self.lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def rewrite(self, records):
+        """Atomically replaces the journal with records (clears it if there are none)."""
+        if not records:
+            self.clear()
+            return
+        temp_path = self.path + '.tmp'
+        with self.lock:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+
+
+def _write_csv_atomic(csv_path, rows):
+    temp_path = csv_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, csv_path)
+
+
+def compact(csv_path, journal=None):
+    """
+    Folds journaled results into csv_path ([Word, Keywords, Image] rows).
+    Retry results override download results: their keywords replace the old
+    ones and the image points into the retry/ folder.
+    Returns the number of rows changed, or None on error.
+    """
+    journal = journal or ResultsJournal(journal_path_for(csv_path))
+    downloads = journal.latest('download')
+    retry_markers = journal.latest('retry')
+    retries = {w: r for w, r in retry_markers.items() if r.get('image')}
+
+    try:
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            rows = [row for row in csv.reader(f) if row]
+    except Exception as e:
+        print(f"Error reading CSV: {e}")
+        return None
+
+    if not rows:
+        return 0
+
+    header = rows[0]
+    if 'Search Keywords' not in header:
+        header.insert(1, 'Search Keywords')
+        rows[1:] = [[r[0], ''] + r[1:] for r in rows[1:]]
+    if 'Image File' not in header:
+        header.append('Image File')
+
+    changed = 0
+    for row in rows[1:]:
+        while len(row) < 3:
+            row.append('')
+        word = row[0]
+        before = list(row)
+
+        if word in downloads:
+            row[2] = downloads[word].get('image', '')
+        if word in retries:
+            if retries[word].get('keywords'):
+                row[1] = retries[word]['keywords']
+            row[2] = f"{RETRY_SUBDIR}/{retries[word]['image']}"
+
+        if row != before:
+            changed += 1
+
+    try:
+        _write_csv_atomic(csv_path, rows)
+    except Exception as e:
+        print(f"Error writing CSV: {e}")
+        return None
+
+    # The CSV now holds everything else the journal did; re-running compaction
+    # after a crash right here would just reapply the same values.
+    journal.rewrite(list(retry_markers.values()))
+    return changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or compact the coding_friend results journal.")
+    parser.add_argument('--csv', type=str, default=os.path.join("coding_friend_vocabulary", "all_english_words.csv"), help="Main words CSV")
+    parser.add_argument('--compact', action='store_true', help="Fold the journal into the CSV, keeping only the retry markers")
+    args = parser.parse_args()
+
+    journal = ResultsJournal(journal_path_for(args.csv))
+    if args.compact:
+        changed = compact(args.csv, journal)
+        if changed is not None:
+            print(f"Compacted journal into {args.csv} ({changed} rows updated).")
+    else:
+        records = list(journal.records())
+        kinds = {}
+        for r in records:
+            kinds[r.get('kind')] = kinds.get(r.get('kind'), 0) + 1
+        print(f"{journal.path}: {len(records)} records {kinds}")
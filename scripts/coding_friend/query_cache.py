@@ -0,0 +1,164 @@
+'''
+Persistent on-disk cache for image searches.
+
+Stores, per search query, the ranked list of candidate image URLs, and per URL
+the downloaded bytes. A retry can then take candidate #2 or #3 without a new
+search, and repeated runs are served from disk.
+
+Layout:
+    <root>/queries/<sha1(query)>.json   {"query": ..., "candidates": [url, ...]}
+    <root>/blobs/<sha1(url)>            raw image bytes
+
+Blobs are evicted least-recently-used first (mtime is bumped on every hit) once
+their total size exceeds max_bytes. Query entries are tiny and never evicted.
+
+python3 scripts/coding_friend/query_cache.py --stats
+python3 scripts/coding_friend/query_cache.py --prune --max-mb 200
+'''
+
+import os
+import json
+import hashlib
+import argparse
+import threading
+
+from image_sources import write_image
+
+DEFAULT_CACHE_DIR = os.path.join("coding_friend_vocabulary", "~assets", "crawl_cache")
+DEFAULT_MAX_MB = 500
+
+
+def _key(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class QueryCache:
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.queries_dir = os.path.join(root, 'queries')
+        self.blobs_dir = os.path.join(root, 'blobs')
+        os.makedirs(self.queries_dir, exist_ok=True)
+        os.makedirs(self.blobs_dir, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.total_bytes = sum(e.stat().st_size for e in os.scandir(self.blobs_dir) if e.is_file())
+
+    def _write_atomic(self, path, data):
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def get_candidates(self, query):
+        path = os.path.join(self.queries_dir, f"{_key(query)}.json")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('candidates')
+        except (OSError, ValueError):
+            return None
+
+    def put_candidates(self, query, candidates):
+        path = os.path.join(self.queries_dir, f"{_key(query)}.json")
+        payload = json.dumps({'query': query, 'candidates': candidates}, ensure_ascii=False)
+        self._write_atomic(path, payload.encode('utf-8'))
+
+    def get_blob(self, url):
+        path = os.path.join(self.blobs_dir, _key(url))
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        # Bump mtime so LRU eviction keeps recently used blobs
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return data
+
+    def put_blob(self, url, data):
+        path = os.path.join(self.blobs_dir, _key(url))
+        existed = os.path.exists(path)
+        self._write_atomic(path, data)
+        with self.lock:
+            if not existed:
+                self.total_bytes += len(data)
+            if self.total_bytes > self.max_bytes:
+                self._evict_locked()
+
+    def _evict_locked(self):
+        entries = [e for e in os.scandir(self.blobs_dir) if e.is_file() and not e.name.endswith('.tmp')]
+        entries.sort(key=lambda e: e.stat().st_mtime)
+
+        self.total_bytes = sum(e.stat().st_size for e in entries)
+        for entry in entries:
+            if self.total_bytes <= self.max_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self.total_bytes -= size
+            except OSError:
+                pass
+
+    def prune(self, max_bytes=None):
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        with self.lock:
+            self._evict_locked()
+
+    def stats(self):
+        queries = sum(1 for _ in os.scandir(self.queries_dir))
+        blobs = sum(1 for _ in os.scandir(self.blobs_dir))
+        return {'queries': queries, 'blobs': blobs, 'bytes': self.total_bytes, 'max_bytes': self.max_bytes}
+
+
+class CachedSource:
+    """
+    Wraps an image backend with a QueryCache. fetch() has the same shape as a
+    backend's fetch(), plus a rank: rank 0 is the top result, rank 1 the next
+    candidate, and so on. Unusable candidates are skipped in rank order.
+    """
+
+    def __init__(self, backend, cache, num_candidates=5):
+        self.backend = backend
+        self.cache = cache
+        self.num_candidates = num_candidates
+
+    def candidates(self, query):
+        candidates = self.cache.get_candidates(query)
+        if candidates is None:
+            candidates = self.backend.search(query, max_num=self.num_candidates)
+            if candidates:
+                self.cache.put_candidates(query, candidates)
+        return candidates or []
+
+    def fetch(self, query, dest_dir, rank=0):
+        for url in self.candidates(query)[rank:]:
+            data = self.cache.get_blob(url)
+            if data is None:
+                data = self.backend.download(url)
+                if not data:
+                    continue
+                self.cache.put_blob(url, data)
+            return write_image(data, url, dest_dir)
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or prune the image search cache.")
+    parser.add_argument('--cache-dir', type=str, default=DEFAULT_CACHE_DIR, help="Cache directory")
+    parser.add_argument('--max-mb', type=int, default=DEFAULT_MAX_MB, help="Size budget for cached image bytes (MB)")
+    parser.add_argument('--stats', action='store_true', help="Print cache statistics")
+    parser.add_argument('--prune', action='store_true', help="Evict least recently used images down to --max-mb")
+    args = parser.parse_args()
+
+    cache = QueryCache(args.cache_dir, args.max_mb * 1024 * 1024)
+    if args.prune:
+        cache.prune()
+        print(f"Pruned cache to {cache.total_bytes / (1024 * 1024):.1f} MB")
+    if args.stats or not args.prune:
+        stats = cache.stats()
+        print(f"Queries: {stats['queries']}, images: {stats['blobs']}, "
+              f"size: {stats['bytes'] / (1024 * 1024):.1f} / {stats['max_bytes'] / (1024 * 1024):.0f} MB")
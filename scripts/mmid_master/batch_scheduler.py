@@ -0,0 +1,212 @@
+'''
+Builds several languages in one run, overlapping downloads with extraction.
+
+A downloader thread fetches language N+1 while the main thread extracts
+language N. Downloaded archives count as scratch space until their extraction
+finishes (and they are deleted, unless --keep_full); the downloader waits
+before starting a download that would push scratch usage over the cap.
+With the download cache, deleting an archive also evicts its cached copy:
+the link in --dest and the cache entry are the same bytes on disk, so the cap
+would not hold otherwise. --keep_full keeps both.
+
+python3 scripts/mmid_master/mmid_manager.py --langs de,ja,es --limit 3 --dest packages
+python3 scripts/mmid_master/mmid_manager.py --all --limit 3 --dest packages --scratch-gb 40
+'''
+
+import os
+import json
+import time
+import queue
+import threading
+
+# ISO codes the app uses -> language names in downloads.md
+LANG_ALIASES = {
+    'de': 'german',
+    'ja': 'japanese',
+    'es': 'spanish',
+    'fr': 'french',
+    'ko': 'korean',
+    'fi': 'finnish',
+    'sk': 'slovak',
+}
+
+
+def resolve_languages(spec, available):
+    """'de,ja,spanish' -> (['german', 'japanese', 'spanish'], [unknown names])."""
+    langs, unknown = [], []
+    for name in (s.strip().lower() for s in spec.split(',')):
+        if not name:
+            continue
+        lang = name if name in available else LANG_ALIASES.get(name)
+        if lang in available:
+            if lang not in langs:
+                langs.append(lang)
+        else:
+            unknown.append(name)
+    return langs, unknown
+
+
+def remote_size(url):
+    """Content-Length of url, or None if the server doesn't say."""
+    import urllib.request # ~15ms to import, only needed once a batch runs
+    try:
+        request = urllib.request.Request(url, method='HEAD')
+        with urllib.request.urlopen(request, timeout=15) as response:
+            length = response.headers.get('Content-Length')
+        return int(length) if length else None
+    except Exception:
+        return None
+
+
+class LanguageJob:
+    def __init__(self, lang, url):
+        self.lang = lang
+        self.url = url
+        self.archive = None
+        self.reserved = 0
+        self.download_s = 0.0
+        self.extract_s = 0.0
+        self.words = 0
+        self.output = None
+        self.error = None
+
+    def summary(self):
+        return {
+            'lang': self.lang,
+            'archive_mb': round(self.reserved / 1e6, 1),
+            'download_s': round(self.download_s, 1),
+            'extract_s': round(self.extract_s, 1),
+            'words': self.words,
+            'output': self.output,
+            'status': self.error or 'ok',
+        }
+
+
+class BatchScheduler:
+    def __init__(self, manager, dest, limit, keep_full=False, scratch_bytes=None, pkg_type='full'):
+        self.manager = manager
+        self.dest = dest
+        self.limit = limit
+        self.keep_full = keep_full
+        self.scratch_bytes = scratch_bytes
+        self.pkg_type = pkg_type
+        self.cond = threading.Condition()
+        self.scratch_used = 0
+
+    def _reserve(self, size):
+        # A single archive bigger than the cap is still allowed when nothing else is on disk
+        with self.cond:
+            while self.scratch_bytes and self.scratch_used > 0 and self.scratch_used + size > self.scratch_bytes:
+                self.cond.wait()
+            self.scratch_used += size
+
+    def _release(self, size):
+        with self.cond:
+            self.scratch_used -= size
+            self.cond.notify_all()
+
+    def _reserve_delta(self, job, delta):
+        with self.cond:
+            self.scratch_used += delta
+            job.reserved += delta
+            self.cond.notify_all()
+
+    def _download_all(self, jobs, ready):
+        for job in jobs:
+            filename = job.url.split('/')[-1]
+            # A cached copy is what download_file will link into --dest
+            cached_path = self.manager.cache.lookup(job.url) if self.manager.cache else None
+            local_path = cached_path or os.path.join(self.dest, filename)
+            size = os.path.getsize(local_path) if os.path.exists(local_path) else (remote_size(job.url) or 0)
+            self._reserve(size)
+            job.reserved = size
+
+            started = time.perf_counter()
+            try:
+                job.archive = self.manager.download_file(job.url, self.dest, quiet=True)
+            except Exception as e:
+                job.error = f"download failed: {e}"
+            job.download_s = time.perf_counter() - started
+
+            if job.archive:
+                # Correct the reservation now that the real size is known
+                actual = os.path.getsize(job.archive)
+                self._reserve_delta(job, actual - size)
+            elif not job.error:
+                job.error = 'download failed'
+            ready.put(job)
+        ready.put(None)
+
+    def _extract(self, job):
+        pkg_name = os.path.basename(job.archive).replace('.tgz', '').replace('.tar.gz', '')
+        job.output = os.path.join(self.dest, f"{pkg_name}-k{self.limit}")
+        started = time.perf_counter()
+        try:
+            # A damaged archive is reported, not raised; it must not be deleted (or evicted) below
+            if not self.manager.extract_top_k(job.archive, job.output, self.limit):
+                job.error = 'extract failed'
+        except Exception as e:
+            job.error = f"extract failed: {e}"
+        job.extract_s = time.perf_counter() - started
+
+        if self.manager.pack:
+            job.output += '.pack'
+        elif os.path.isdir(job.output):
+            job.words = sum(1 for name in os.listdir(job.output) if name.isdigit())
+
+        if not self.keep_full and not job.error:
+            self.manager.discard_archive(job.archive)
+            if self.manager.cache:
+                self.manager.cache.evict_url(job.url)
+
+    def run(self, langs):
+        jobs = []
+        for lang in langs:
+            url = self.manager.data[lang].get(self.pkg_type)
+            if url:
+                jobs.append(LanguageJob(lang, url))
+            else:
+                print(f"Skipping {lang}: no {self.pkg_type} package.")
+
+        os.makedirs(self.dest, exist_ok=True)
+        started = time.perf_counter()
+        ready = queue.Queue()
+        downloader = threading.Thread(target=self._download_all, args=(jobs, ready), daemon=True)
+        downloader.start()
+
+        while True:
+            job = ready.get()
+            if job is None:
+                break
+            if job.error:
+                print(f"\n[{job.lang}] {job.error}")
+            else:
+                print(f"\n[{job.lang}] Downloaded in {job.download_s:.1f}s, extracting top {self.limit} to {self.dest}...")
+                self._extract(job)
+            self._release(job.reserved)
+        downloader.join()
+
+        return self._summarize(jobs, time.perf_counter() - started)
+
+    def _summarize(self, jobs, wall_s):
+        download_total = sum(j.download_s for j in jobs)
+        extract_total = sum(j.extract_s for j in jobs)
+        summary = {
+            'wall_s': round(wall_s, 1),
+            'download_s': round(download_total, 1),
+            'extract_s': round(extract_total, 1),
+            'serial_estimate_s': round(download_total + extract_total, 1),
+            'languages': [j.summary() for j in jobs],
+        }
+
+        print(f"\n{'language':<16} {'archive':>10} {'download':>10} {'extract':>10} {'words':>7}  status")
+        for row in summary['languages']:
+            print(f"{row['lang']:<16} {row['archive_mb']:>8.1f}MB {row['download_s']:>9.1f}s {row['extract_s']:>9.1f}s {row['words']:>7}  {row['status']}")
+        print(f"Wall time {wall_s:.1f}s (download {download_total:.1f}s + extract {extract_total:.1f}s "
+              f"= {download_total + extract_total:.1f}s if run serially)")
+
+        summary_path = os.path.join(self.dest, 'batch_summary.json')
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"Summary written to {summary_path}")
+        return summary
@@ -0,0 +1,192 @@
+'''
+Phase-level profiling for the dataset build commands.
+
+Commands wrap their work in metrics.phase('read' | 'decompress' | 'parse' | 'write' | 'fsync' | ...).
+Phases nest per thread: time spent in an inner phase is not counted again in the
+outer one, so on a single thread the per-phase totals add up to the instrumented
+wall time. Phases that run on writer or pool threads overlap the main thread and
+are summed across threads, so there the totals can exceed wall time; compare
+them to each other (and to wall time) to see whether a run is bound by disk,
+CPU or network.
+
+Options the commands share (see add_metrics_arguments):
+    --profile            print a phase summary at the end
+    --metrics out.jsonl  append the summary as one JSON line
+    --trace trace.json   write a Chrome trace (chrome://tracing, Perfetto)
+'''
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+MAX_TRACE_EVENTS = 200000
+HISTOGRAM_BUCKETS = 18 # powers of two in ms: <1ms, <2ms, ... <2^17ms
+
+
+class BuildMetrics:
+    def __init__(self, command, enabled=True, trace=False):
+        self.command = command
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+        self.phase_seconds = {}
+        self.phase_calls = {}
+        self.counters = {}
+        self.word_histogram = [0] * HISTOGRAM_BUCKETS
+        self.word_total = 0.0
+        self.word_max = 0.0
+        self.word_count = 0
+
+        self.trace_events = [] if (enabled and trace) else None
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.t0 = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            stack = self.local.stack = []
+
+        frame = [name, time.perf_counter(), 0.0] # name, start, time spent in child phases
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            elapsed = end - frame[1]
+            if stack:
+                stack[-1][2] += elapsed
+
+            with self.lock:
+                self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + elapsed - frame[2]
+                self.phase_calls[name] = self.phase_calls.get(name, 0) + 1
+                if self.trace_events is not None and len(self.trace_events) < MAX_TRACE_EVENTS:
+                    self.trace_events.append({
+                        'name': name, 'ph': 'X', 'pid': os.getpid(), 'tid': threading.get_ident(),
+                        'ts': round((frame[1] - self.t0) * 1e6, 1), 'dur': round(elapsed * 1e6, 1),
+                    })
+
+    def count(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def word_done(self, seconds):
+        if not self.enabled:
+            return
+        ms = seconds * 1000.0
+        bucket = 0
+        while bucket < HISTOGRAM_BUCKETS - 1 and ms >= (1 << bucket):
+            bucket += 1
+        with self.lock:
+            self.word_histogram[bucket] += 1
+            self.word_total += ms
+            self.word_max = max(self.word_max, ms)
+            self.word_count += 1
+
+    def _percentile(self, fraction):
+        """Upper bound (ms) of the histogram bucket holding the given fraction of words."""
+        target = fraction * self.word_count
+        seen = 0
+        for bucket, n in enumerate(self.word_histogram):
+            seen += n
+            if n and seen >= target:
+                return 1 << bucket
+        return None
+
+    def summary(self):
+        latency = {'count': self.word_count}
+        if self.word_count:
+            latency.update({
+                'mean_ms': round(self.word_total / self.word_count, 3),
+                'max_ms': round(self.word_max, 3),
+                'p50_ms_le': self._percentile(0.5),
+                'p95_ms_le': self._percentile(0.95),
+                'histogram': {f"<{1 << b}ms": n for b, n in enumerate(self.word_histogram) if n},
+            })
+
+        return {
+            'command': self.command,
+            'started': self.started_at,
+            'wall_s': round(time.perf_counter() - self.t0, 3),
+            'phases': {
+                name: {'s': round(seconds, 4), 'calls': self.phase_calls[name]}
+                for name, seconds in sorted(self.phase_seconds.items(), key=lambda kv: -kv[1])
+            },
+            'counters': dict(sorted(self.counters.items())),
+            'word_latency': latency,
+        }
+
+    def print_summary(self):
+        summary = self.summary()
+        print(f"\n--- Profile: {self.command} ({summary['wall_s']:.2f}s wall) ---")
+        for name, phase in summary['phases'].items():
+            share = 100.0 * phase['s'] / summary['wall_s'] if summary['wall_s'] else 0.0
+            print(f"  {name:<14} {phase['s']:>9.3f}s  {share:5.1f}%  ({phase['calls']} calls)")
+        for name, value in summary['counters'].items():
+            print(f"  {name:<14} {value}")
+        latency = summary['word_latency']
+        if latency['count']:
+            print(f"  per word       mean {latency['mean_ms']:.2f}ms, p50 <= {latency['p50_ms_le']}ms, "
+                  f"p95 <= {latency['p95_ms_le']}ms, max {latency['max_ms']:.2f}ms over {latency['count']} words")
+
+    def write_metrics(self, path):
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(self.summary(), ensure_ascii=False) + '\n')
+
+    def write_trace(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.trace_events or [], 'displayTimeUnit': 'ms'}, f)
+
+    def finish(self, profile=False, metrics_path=None, trace_path=None):
+        if not self.enabled:
+            return
+        if profile:
+            self.print_summary()
+        if metrics_path:
+            self.write_metrics(metrics_path)
+            print(f"Metrics appended to {metrics_path}")
+        if trace_path:
+            self.write_trace(trace_path)
+            print(f"Chrome trace written to {trace_path}")
+
+
+class TimedReader:
+    """File wrapper that books raw reads under the 'read' phase and tracks the offset."""
+
+    def __init__(self, fileobj, metrics):
+        self.fileobj = fileobj
+        self.metrics = metrics
+
+    def read(self, size=-1):
+        with self.metrics.phase('read'):
+            data = self.fileobj.read(size)
+        self.metrics.count('bytes_read', len(data))
+        return data
+
+    def tell(self):
+        return self.fileobj.tell()
+
+    def close(self):
+        self.fileobj.close()
+
+
+def add_metrics_arguments(parser):
+    parser.add_argument('--profile', action='store_true', help="Print per-phase timings at the end")
+    parser.add_argument('--metrics', type=str, default=None, help="Append a JSON metrics summary to this .jsonl file")
+    parser.add_argument('--trace', type=str, default=None, help="Write a Chrome trace (chrome://tracing) to this file")
+
+
+def metrics_from_args(command, args):
+    enabled = bool(args.profile or args.metrics or args.trace)
+    return BuildMetrics(command, enabled=enabled, trace=bool(args.trace))
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+
+'''
+Shared download cache for MMID packages and dictionaries.
+
+Downloads used to land in whatever --dest or working directory a command ran
+from, so running from somewhere else fetched the same multi-GB .tgz again and
+nothing ever removed old ones. Now every download goes through one cache:
+
+- location: --cache-dir, else $CARROT_CACHE_DIR, else ~/.cache/carrot/mmid
+  ($XDG_CACHE_HOME is respected)
+- key: URL plus the server's ETag, or Content-Length if there is no ETag, so a
+  republished package is a new entry and not a stale hit
+- atomic publish: curl writes to tmp/ (and resumes there after an interruption);
+  the file moves into objects/<key>/ only once it is complete
+- size budget (--cache-gb, $CARROT_CACHE_GB, default 100 GB): the least recently
+  used entries are evicted after each new download
+
+Callers get a hard link in their --dest, so deleting it after extraction
+leaves the cached copy in place. The archive's record (verify_packages.py) is
+copied next to the link, so `verify_packages.py archive` works on either path.
+
+python3 scripts/mmid_master/download_cache.py ls
+python3 scripts/mmid_master/download_cache.py prune --max-gb 40
+python3 scripts/mmid_master/download_cache.py prune --all
+'''
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import subprocess
+from contextlib import contextmanager
+
+from build_metrics import BuildMetrics
+from verify_packages import load_archive_record, record_archive, store_archive_record
+
+DEFAULT_BUDGET_GB = 100.0
+INDEX_FILENAME = 'index.json'
+
+
+def default_cache_dir():
+    if os.environ.get('CARROT_CACHE_DIR'):
+        return os.environ['CARROT_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'carrot', 'mmid')
+
+
+def default_budget_bytes():
+    try:
+        return int(float(os.environ.get('CARROT_CACHE_GB', DEFAULT_BUDGET_GB)) * 1e9)
+    except ValueError:
+        print(f"Warning: CARROT_CACHE_GB is not a number, using {DEFAULT_BUDGET_GB} GB.")
+        return int(DEFAULT_BUDGET_GB * 1e9)
+
+
+def remote_validator(url):
+    """'etag:<ETag>' or 'size:<Content-Length>' from a HEAD request; '' if unknown, None if unreachable."""
+    import urllib.request # ~15ms to import, only needed once something is downloaded
+    try:
+        request = urllib.request.Request(url, method='HEAD')
+        with urllib.request.urlopen(request, timeout=15) as response:
+            etag = response.headers.get('ETag')
+            length = response.headers.get('Content-Length')
+    except Exception:
+        return None
+    if etag:
+        return f"etag:{etag}"
+    return f"size:{length}" if length else ''
+
+
+class DownloadCache:
+    def __init__(self, root=None, budget_bytes=None):
+        self.root = os.path.abspath(root or default_cache_dir())
+        self.budget_bytes = default_budget_bytes() if budget_bytes is None else budget_bytes
+        self.objects_dir = os.path.join(self.root, 'objects')
+        self.tmp_dir = os.path.join(self.root, 'tmp')
+        self.index_path = os.path.join(self.root, INDEX_FILENAME)
+
+    # --- Index ---
+
+    @contextmanager
+    def _locked_index(self):
+        """The index, loaded under an exclusive lock and saved when the block ends."""
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, '.lock'), 'a') as lock:
+            try:
+                import fcntl
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            except ImportError:
+                pass # No flock on Windows; concurrent runs there may lose an index update
+            index = self._read_index()
+            yield index
+            with open(self.index_path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False, indent=2)
+            os.replace(self.index_path + '.tmp', self.index_path)
+
+    def _read_index(self):
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: cache index {self.index_path} unreadable ({e}), starting a new one.")
+            return {}
+
+    def entries(self):
+        """[(key, entry)] most recently used first, for entries whose file is still there."""
+        index = self._read_index()
+        present = [(key, e) for key, e in index.items() if os.path.exists(os.path.join(self.root, e['path']))]
+        return sorted(present, key=lambda item: -item[1]['last_used'])
+
+    def owns(self, path):
+        return os.path.abspath(path).startswith(self.objects_dir + os.sep)
+
+    # --- Lookup and download ---
+
+    def _key(self, url, validator):
+        return hashlib.sha1(f"{url}\n{validator}".encode('utf-8')).hexdigest()[:20]
+
+    def _hit(self, index, key):
+        entry = index.get(key)
+        if not entry:
+            return None
+        path = os.path.join(self.root, entry['path'])
+        if not os.path.exists(path) or os.path.getsize(path) != entry['size']:
+            del index[key] # evicted by hand or damaged
+            return None
+        entry['last_used'] = time.time()
+        return path
+
+    def lookup(self, url):
+        """Most recently used cached copy of url, without asking the server. None if there is none."""
+        with self._locked_index() as index:
+            for key, entry in sorted(index.items(), key=lambda item: -item[1]['last_used']):
+                if entry['url'] == url:
+                    path = self._hit(index, key)
+                    if path:
+                        return path
+        return None
+
+    def fetch(self, url, quiet=False, metrics=None):
+        """Path of the cached copy of url, downloading it first if needed. None if the download failed."""
+        metrics = metrics or BuildMetrics('download_cache', enabled=False)
+        validator = remote_validator(url)
+        if validator is None:
+            path = self.lookup(url)
+            if path:
+                print(f"Server unreachable, using cached {os.path.basename(path)}.")
+                return path
+            validator = '' # Let curl try anyway and report the error
+
+        key = self._key(url, validator)
+        with self._locked_index() as index:
+            path = self._hit(index, key)
+        if path:
+            print(f"Using cached {os.path.basename(path)} ({self.root}).")
+            return path
+
+        filename = url.split('/')[-1]
+        part_dir = os.path.join(self.tmp_dir, key)
+        os.makedirs(part_dir, exist_ok=True)
+        part_path = os.path.join(part_dir, filename + '.part')
+        print(f"Downloading {url} into the cache ({self.root})...")
+        try:
+            # Resumed with -C - if a previous run was cut off; quiet drops the progress meter
+            command = ['curl', '-L', '-f', '-C', '-', '-o', part_path] + (['-sS'] if quiet else []) + [url]
+            with metrics.phase('network'):
+                subprocess.run(command, check=True)
+        except subprocess.CalledProcessError:
+            print("Error downloading file.")
+            return None
+        except FileNotFoundError:
+            print("Error: curl is not installed or not found.")
+            return None
+
+        size = os.path.getsize(part_path)
+        if validator.startswith('size:') and size != int(validator[5:]):
+            print(f"Error: downloaded {size} bytes, server announced {validator[5:]}.")
+            os.remove(part_path)
+            return None
+
+        # Size and hash recorded next to the file (verify_packages.py archive), still in tmp/
+        staged_path = os.path.join(part_dir, filename)
+        os.replace(part_path, staged_path)
+        with metrics.phase('verify'):
+            record_archive(staged_path, url)
+
+        now = time.time()
+        with self._locked_index() as index:
+            # Publish: one directory rename, so objects/ only ever holds complete downloads
+            object_dir = os.path.join(self.objects_dir, key)
+            os.makedirs(self.objects_dir, exist_ok=True)
+            shutil.rmtree(object_dir, ignore_errors=True)
+            os.replace(part_dir, object_dir)
+            path = os.path.join(object_dir, filename)
+            index[key] = {
+                'url': url,
+                'validator': validator,
+                'path': os.path.relpath(path, self.root),
+                'size': size,
+                'created': now,
+                'last_used': now,
+            }
+            self._evict(index, self.budget_bytes, keep={key})
+        print("Download complete.")
+        return path
+
+    def link_into(self, cached_path, dest_folder):
+        """Hard link of a cached file in dest_folder (same name); the cached path itself if linking isn't possible."""
+        os.makedirs(dest_folder, exist_ok=True)
+        dest_path = os.path.join(dest_folder, os.path.basename(cached_path))
+        if os.path.exists(dest_path):
+            # Never replace a file the caller already has; it gets the cache's copy instead
+            if not os.path.samefile(dest_path, cached_path):
+                return cached_path
+        else:
+            try:
+                os.link(cached_path, dest_path)
+            except OSError:
+                return cached_path # other filesystem; callers use the cache's copy directly
+        record = load_archive_record(cached_path)
+        if record:
+            store_archive_record(dest_path, record)
+        return dest_path
+
+    # --- Eviction ---
+
+    def _evict(self, index, budget_bytes, keep=()):
+        """Removes least recently used entries until the total fits budget_bytes. Returns [(key, entry)] removed."""
+        removed = []
+        total = sum(e['size'] for e in index.values())
+        for key, entry in sorted(index.items(), key=lambda item: item[1]['last_used']):
+            if total <= budget_bytes:
+                break
+            if key in keep:
+                continue
+            shutil.rmtree(os.path.join(self.objects_dir, key), ignore_errors=True)
+            del index[key]
+            total -= entry['size']
+            removed.append((key, entry))
+        return removed
+
+    def evict_url(self, url):
+        """Removes every cached copy of url. Returns the number of bytes freed."""
+        freed = 0
+        with self._locked_index() as index:
+            for key in [k for k, e in index.items() if e['url'] == url]:
+                shutil.rmtree(os.path.join(self.objects_dir, key), ignore_errors=True)
+                freed += index.pop(key)['size']
+        return freed
+
+    def prune(self, budget_bytes=None):
+        """Evicts down to budget_bytes (default: the configured budget) and drops entries whose file is gone."""
+        with self._locked_index() as index:
+            for key in [k for k, e in index.items() if not os.path.exists(os.path.join(self.root, e['path']))]:
+                del index[key]
+            removed = self._evict(index, self.budget_bytes if budget_bytes is None else budget_bytes)
+            # Objects the index doesn't know about (removed from the index by hand, or an older layout)
+            if os.path.isdir(self.objects_dir):
+                for name in os.listdir(self.objects_dir):
+                    if name not in index:
+                        shutil.rmtree(os.path.join(self.objects_dir, name), ignore_errors=True)
+        return removed
+
+
+def add_cache_arguments(parser):
+    parser.add_argument('--cache-dir', type=str, default=None, help="Download cache folder (default: $CARROT_CACHE_DIR or ~/.cache/carrot/mmid)")
+    parser.add_argument('--cache-gb', type=float, default=None, help=f"Download cache size budget in GB (default: $CARROT_CACHE_GB or {DEFAULT_BUDGET_GB:g})")
+    parser.add_argument('--no-cache', action='store_true', help="Download without the shared cache (into --dest or the working directory)")
+
+
+def cache_from_args(args):
+    if args.no_cache:
+        return None
+    return DownloadCache(args.cache_dir, int(args.cache_gb * 1e9) if args.cache_gb is not None else None)
+
+
+def _format_size(size):
+    return f"{size / 1e9:.2f} GB" if size >= 1e8 else f"{size / 1e6:.1f} MB"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and clean the shared MMID download cache.")
+    parser.add_argument('--cache-dir', type=str, default=None, help="Cache folder (default: $CARROT_CACHE_DIR or ~/.cache/carrot/mmid)")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('ls', help="List cached downloads, most recently used first")
+    p = sub.add_parser('prune', help="Evict least recently used downloads down to a size budget")
+    p.add_argument('--max-gb', type=float, default=None, help=f"Budget to prune to (default: $CARROT_CACHE_GB or {DEFAULT_BUDGET_GB:g})")
+    p.add_argument('--all', action='store_true', help="Remove every cached download")
+    args = parser.parse_args(argv)
+
+    cache = DownloadCache(args.cache_dir)
+    if args.command == 'ls':
+        entries = cache.entries()
+        total = sum(e['size'] for _, e in entries)
+        print(f"{cache.root}: {len(entries)} downloads, {_format_size(total)} of {_format_size(cache.budget_bytes)}")
+        for key, entry in entries:
+            last_used = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['last_used']))
+            print(f"  {_format_size(entry['size']):>10}  {last_used}  {os.path.basename(entry['path'])}  ({entry['url']})")
+        return
+
+    budget = 0 if args.all else (int(args.max_gb * 1e9) if args.max_gb is not None else None)
+    removed = cache.prune(budget)
+    for _, entry in removed:
+        print(f"Removed {os.path.basename(entry['path'])} ({_format_size(entry['size'])})")
+    print(f"Pruned {len(removed)} downloads, {_format_size(sum(e['size'] for _, e in removed))} freed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,97 +9,32 @@ python3 mmid-master/download_helper.py --lang french --limit 100
 '''
 
 
-import re
 import os
 import argparse
 import subprocess
 import sys
 import tarfile
 import shutil
+import time
 
-def parse_downloads_md(file_path):
-    """Parses the downloads.md file to extract download links."""
-    downloads = {}
-    
-    # Try to find downloads.md in current directory if default path fails
-    if not os.path.exists(file_path):
-        # Check relative to script location
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        alt_path = os.path.join(base_dir, 'downloads.md')
-        
-        # Check relative to current working directory
-        cwd_path = os.path.join(os.getcwd(), 'mmid-master', 'downloads.md')
-        
-        if os.path.exists(alt_path):
-            file_path = alt_path
-        elif os.path.exists(cwd_path):
-            file_path = cwd_path
-        elif os.path.exists('downloads.md'):
-            file_path = 'downloads.md'
+from build_metrics import BuildMetrics, add_metrics_arguments, metrics_from_args
+from downloads_md import find_downloads_md, parse_downloads_md
+from tar_stream import extract_streaming
+from download_cache import add_cache_arguments, cache_from_args
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-    except FileNotFoundError:
+# Replaced in main() when --profile/--metrics/--trace is given
+metrics = BuildMetrics('download_helper', enabled=False)
+
+def load_downloads(file_path):
+    """Download links from downloads.md, falling back to the usual locations if file_path is missing."""
+    resolved = find_downloads_md(file_path)
+    if not resolved:
         print(f"Error: Could not find {file_path}")
         return {}
+    return parse_downloads_md(resolved)
 
-    # Regex to match the markdown table rows
-    # | language | 100 images | 1 image | metadata | dictionary | web text |
-    # Matches: | name | [link](url) | ...
-    link_pattern = re.compile(r'\[link\]\((https?://[^)]+)\)')
-    
-    for line in lines:
-        line = line.strip()
-        if not line.startswith('|') or '---' in line:
-            continue
-            
-        parts = [p.strip() for p in line.split('|')]
-        # parts[0] is empty because line starts with |
-        # Some lines might have different number of columns or empty columns
-        # The structure is | language | 100 images | 1 image | metadata | dictionary | web text |
-        # So we expect at least 7 parts (including empty first and last)
-        
-        if len(parts) < 3:
-            continue
-            
-        language = parts[1].lower()
-        if not language or language == 'language' or '---' in language or '**' in language:
-            continue
-        
-        # Extract links
-        links = {}
-        # 100 images -> index 2
-        if len(parts) > 2:
-            m = link_pattern.search(parts[2])
-            if m: links['full'] = m.group(1)
-        
-        # 1 image -> index 3
-        if len(parts) > 3:
-            m = link_pattern.search(parts[3])
-            if m: links['mini'] = m.group(1)
-        
-        # metadata -> index 4
-        if len(parts) > 4:
-            m = link_pattern.search(parts[4])
-            if m: links['metadata'] = m.group(1)
-        
-        # dictionary -> index 5
-        if len(parts) > 5:
-            m = link_pattern.search(parts[5])
-            if m: links['dictionary'] = m.group(1)
-        
-        # web text -> index 6
-        if len(parts) > 6:
-            m = link_pattern.search(parts[6])
-            if m: links['text'] = m.group(1)
-        
-        if links:
-            downloads[language] = links
-            
-    return downloads
-
-def download_file(url, dest_folder):
+def download_file(url, dest_folder, cache=None):
+    """Path of the downloaded file (a link to the cache's copy when cache is given), None on failure."""
     if not os.path.exists(dest_folder):
         os.makedirs(dest_folder)
     
@@ -108,17 +43,24 @@ def download_file(url, dest_folder):
     
     if os.path.exists(dest_path):
         print(f"File {filename} already exists. Skipping download.")
-        return
+        return dest_path
+
+    if cache:
+        cached_path = cache.fetch(url, metrics=metrics)
+        return cache.link_into(cached_path, dest_folder) if cached_path else None
 
     print(f"Downloading {url} to {dest_path}...")
     try:
         # Use curl for downloading
-        subprocess.run(['curl', '-O', url], cwd=dest_folder, check=True)
+        with metrics.phase('network'):
+            subprocess.run(['curl', '-O', url], cwd=dest_folder, check=True)
         print("Download complete.")
+        return dest_path
     except subprocess.CalledProcessError:
         print("Error downloading file.")
     except FileNotFoundError:
         print("Error: curl is not installed or not found.")
+    return None
 
 def filter_inner_tar(tar_path, limit):
     """
@@ -128,7 +70,8 @@ def filter_inner_tar(tar_path, limit):
     temp_path = tar_path + ".tmp"
     try:
         with tarfile.open(tar_path, "r:gz") as source, tarfile.open(temp_path, "w:gz") as dest:
-            members = source.getmembers()
+            with metrics.phase('parse'):
+                members = source.getmembers()
             images = [m for m in members if m.name.lower().endswith(('.png', '.jpg', '.jpeg'))]
             others = [m for m in members if m not in images]
             
@@ -136,15 +79,17 @@ def filter_inner_tar(tar_path, limit):
             images.sort(key=lambda x: x.name)
             keep_images = images[:limit]
             
-            for m in others:
-                f = source.extractfile(m)
-                if f:
-                    dest.addfile(m, f)
-                    
-            for m in keep_images:
-                f = source.extractfile(m)
-                if f:
-                    dest.addfile(m, f)
+            with metrics.phase('recompress'):
+                for m in others:
+                    f = source.extractfile(m)
+                    if f:
+                        dest.addfile(m, f)
+                        
+                for m in keep_images:
+                    f = source.extractfile(m)
+                    if f:
+                        dest.addfile(m, f)
+            metrics.count('members', len(members))
         
         os.replace(temp_path, tar_path)
         return True
@@ -157,14 +102,16 @@ def filter_inner_tar(tar_path, limit):
 def process_full_package(filename, limit):
     print(f"\nSmart Mode: Processing {filename} to keep {limit} images per word...")
     
-    extract_dir = filename.replace('.tgz', '').replace('.tar.gz', '')
+    # In the working directory, also when filename is the download cache's copy
+    extract_dir = os.path.basename(filename).replace('.tgz', '').replace('.tar.gz', '')
     
     # 1. Extract the main package
     if not os.path.exists(extract_dir):
         print(f"Extracting main package to {extract_dir}...")
         try:
-            with tarfile.open(filename, "r:gz") as tar:
-                tar.extractall(path=extract_dir)
+            with metrics.phase('extract'):
+                # Streamed member by member; extractall() would load every header first
+                extract_streaming(filename, extract_dir)
         except Exception as e:
             print(f"Failed to extract {filename}: {e}")
             return
@@ -180,8 +127,11 @@ def process_full_package(filename, limit):
         for file in files:
             if file.endswith('.tar.gz'):
                 full_path = os.path.join(root, file)
+                word_started = time.perf_counter()
                 if filter_inner_tar(full_path, limit):
                     filtered_count += 1
+                metrics.word_done(time.perf_counter() - word_started)
+                metrics.count('words')
                 count += 1
                 if count % 100 == 0:
                     print(f"Processed {count} words...", end='\r')
@@ -190,7 +140,7 @@ def process_full_package(filename, limit):
     print(f"You can now find the dataset in: {extract_dir}")
     print("Note: The original large package file was kept. You can delete it manually if satisfied.")
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Download MMID dataset packages.")
     parser.add_argument('--list', action='store_true', help="List all available languages")
     parser.add_argument('--lang', type=str, help="Language to download (e.g., 'french', 'english-01')")
@@ -198,10 +148,21 @@ def main():
                         help="Type of package to download (default: mini)")
     parser.add_argument('--limit', type=int, help="Smart Mode: Number of images per word. If specified (e.g. 3), downloads full package and filters it.")
     parser.add_argument('--md_path', type=str, default='mmid-master/downloads.md', help="Path to downloads.md")
+    add_cache_arguments(parser)
+    add_metrics_arguments(parser)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    global metrics
+    metrics = metrics_from_args('download_helper', args)
+    try:
+        run(args)
+    finally:
+        metrics.finish(args.profile, args.metrics, args.trace)
+
+def run(args):
     
-    data = parse_downloads_md(args.md_path)
+    data = load_downloads(args.md_path)
     
     if not data:
         print("No download data found. Check the path to downloads.md.")
@@ -240,11 +201,10 @@ def main():
             return
             
         url = data[lang][package_type]
-        download_file(url, ".")
+        filename = download_file(url, ".", cache_from_args(args))
         
         if should_filter:
-            filename = url.split('/')[-1]
-            if os.path.exists(filename):
+            if filename and os.path.exists(filename):
                 process_full_package(filename, args.limit)
             else:
                 print("Error: Package file not found after download attempt.")
@@ -0,0 +1,69 @@
+'''
+Parser for the MMID download table (mmid-master/downloads.md).
+
+| language | 100 images | 1 image | metadata | dictionary | web text |
+| german   | [link](...) | [link](...) | ... |
+
+Shared by mmid_manager.py and download_helper.py.
+'''
+
+import os
+import re
+
+# Column index in the split row -> package type
+COLUMNS = {2: 'full', 3: 'mini', 4: 'metadata', 5: 'dictionary', 6: 'text'}
+# Only [link](...) cells: the CNN package table further down uses [download](...)
+# and has language names in other columns, so it must not overwrite these rows
+LINK_PATTERN = re.compile(r'\[link\]\((https?://[^)]+)\)')
+
+
+def find_downloads_md(preferred=None):
+    """preferred if it exists, else the first downloads.md found in the usual places, else None."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    candidates = [
+        preferred,
+        os.path.join(os.getcwd(), 'mmid-master', 'downloads.md'),
+        os.path.join(os.getcwd(), '..', '..', 'mmid-master', 'downloads.md'), # If running from scripts/mmid_master/
+        os.path.join(script_dir, '..', '..', 'mmid-master', 'downloads.md'),
+        os.path.join(script_dir, 'downloads.md'),
+        'downloads.md',
+    ]
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def parse_downloads_md(file_path):
+    """
+    {language: {'full': url, 'mini': url, ...}} with only the columns that have a link.
+    Raises OSError if the file can't be read.
+    """
+    downloads = {}
+    with open(file_path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+
+    for line in lines:
+        line = line.strip()
+        if not line.startswith('|') or '---' in line:
+            continue
+
+        # split gives: ['', 'lang', '100', '1', 'meta', 'dict', 'text', '']
+        parts = [p.strip() for p in line.split('|')]
+        if len(parts) < 3:
+            continue
+
+        language = parts[1].lower()
+        if not language or language == 'language' or '**' in language:
+            continue
+
+        links = {}
+        for index, kind in COLUMNS.items():
+            if index < len(parts):
+                m = LINK_PATTERN.search(parts[index])
+                if m:
+                    links[kind] = m.group(1)
+        if links:
+            downloads[language] = links
+
+    return downloads
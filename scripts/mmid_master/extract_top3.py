@@ -1,13 +1,18 @@
 import os
+import time
 import shutil
 import tarfile
+import argparse
 from tqdm import tqdm
 
-def extract_top_k(source_dir, dest_dir, k=3):
+from build_metrics import BuildMetrics, add_metrics_arguments, metrics_from_args
+
+def extract_top_k(source_dir, dest_dir, k=3, metrics=None):
     """
     Extracts top k images from each word package in source_dir to dest_dir.
     Handles both directory structures and tar.gz files.
     """
+    metrics = metrics or BuildMetrics('extract_top3', enabled=False)
     if not os.path.exists(dest_dir):
         os.makedirs(dest_dir)
         print(f"Created destination directory: {dest_dir}")
@@ -21,7 +26,8 @@ def extract_top_k(source_dir, dest_dir, k=3):
         return
 
     # First, let's look for what's inside the source directory
-    items = os.listdir(source_dir)
+    with metrics.phase('scan'):
+        items = os.listdir(source_dir)
     
     # Filter for word items (usually numeric IDs)
     # They can be directories or .tar.gz files
@@ -39,21 +45,26 @@ def extract_top_k(source_dir, dest_dir, k=3):
         src_path = os.path.join(source_dir, item)
         word_id = item.replace('.tar.gz', '')
         dest_word_dir = os.path.join(dest_dir, word_id)
+        word_start = time.perf_counter()
         
         if os.path.isdir(src_path):
             # Case 1: Source is a directory
-            process_directory(src_path, dest_word_dir, k)
+            process_directory(src_path, dest_word_dir, k, metrics)
         elif tarfile.is_tarfile(src_path):
             # Case 2: Source is a tar.gz file
-            process_tarball(src_path, dest_word_dir, k)
+            process_tarball(src_path, dest_word_dir, k, metrics)
+        metrics.word_done(time.perf_counter() - word_start)
+        metrics.count('words')
 
-def process_directory(src_path, dest_path, k):
+def process_directory(src_path, dest_path, k, metrics=None):
     """Copies top k images from src_path directory to dest_path."""
+    metrics = metrics or BuildMetrics('extract_top3', enabled=False)
     if not os.path.exists(dest_path):
         os.makedirs(dest_path)
         
     # Get all image files
-    files = [f for f in os.listdir(src_path) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
+    with metrics.phase('scan'):
+        files = [f for f in os.listdir(src_path) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
     files.sort() # Sort to ensure we get 01.png, 02.png, etc.
     
     # Select top k
@@ -61,21 +72,27 @@ def process_directory(src_path, dest_path, k):
     
     # Copy images
     for f in to_copy:
-        shutil.copy2(os.path.join(src_path, f), os.path.join(dest_path, f))
+        with metrics.phase('write'):
+            shutil.copy2(os.path.join(src_path, f), os.path.join(dest_path, f))
+        metrics.count('bytes_written', os.path.getsize(os.path.join(dest_path, f)))
         
     # Also copy metadata/word.txt files if they exist
     for meta_file in ['word.txt', 'metadata.json', 'errors.json']:
         if os.path.exists(os.path.join(src_path, meta_file)):
-            shutil.copy2(os.path.join(src_path, meta_file), os.path.join(dest_path, meta_file))
+            with metrics.phase('write'):
+                shutil.copy2(os.path.join(src_path, meta_file), os.path.join(dest_path, meta_file))
 
-def process_tarball(src_path, dest_path, k):
+def process_tarball(src_path, dest_path, k, metrics=None):
     """Extracts top k images from src_path tarball to dest_path."""
+    metrics = metrics or BuildMetrics('extract_top3', enabled=False)
     if not os.path.exists(dest_path):
         os.makedirs(dest_path)
         
     try:
         with tarfile.open(src_path, "r:gz") as tar:
-            members = tar.getmembers()
+            with metrics.phase('parse'):
+                members = tar.getmembers()
+            metrics.count('members', len(members))
             
             # Filter images
             images = [m for m in members if m.name.lower().endswith(('.png', '.jpg', '.jpeg'))]
@@ -96,19 +113,34 @@ def process_tarball(src_path, dest_path, k):
                     # Determine output filename (flatten structure)
                     out_filename = os.path.basename(member.name)
                     out_path = os.path.join(dest_path, out_filename)
-                    with open(out_path, 'wb') as out_f:
-                        shutil.copyfileobj(f, out_f)
+                    with metrics.phase('decompress'):
+                        data = f.read()
+                    with metrics.phase('write'), open(out_path, 'wb') as out_f:
+                        out_f.write(data)
+                    metrics.count('bytes_written', len(data))
                         
     except Exception as e:
         print(f"Error processing {src_path}: {e}")
 
-if __name__ == "__main__":
-    # Configure paths
-    SOURCE_DIR = "/Users/chriswu/Documents/GitHub/carrot_napkin_great/scale-spanish-package/scale-spanish-package"
-    DEST_DIR = "/Users/chriswu/Documents/GitHub/carrot_napkin_great/scale-spanish-package-k3"
-    
-    print(f"Source: {SOURCE_DIR}")
-    print(f"Destination: {DEST_DIR}")
-    
-    extract_top_k(SOURCE_DIR, DEST_DIR, k=3)
+# Defaults when run without arguments
+SOURCE_DIR = "/Users/chriswu/Documents/GitHub/carrot_napkin_great/scale-spanish-package/scale-spanish-package"
+DEST_DIR = "/Users/chriswu/Documents/GitHub/carrot_napkin_great/scale-spanish-package-k3"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract the top k images of each word package into a new folder.")
+    parser.add_argument('source_dir', nargs='?', default=SOURCE_DIR, help="Folder of word folders or <id>.tar.gz files")
+    parser.add_argument('dest_dir', nargs='?', default=DEST_DIR, help="Destination folder")
+    parser.add_argument('--k', type=int, default=3, help="Images to keep per word")
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+    metrics = metrics_from_args('extract_top3', args)
+
+    print(f"Source: {args.source_dir}")
+    print(f"Destination: {args.dest_dir}")
+
+    extract_top_k(args.source_dir, args.dest_dir, k=args.k, metrics=metrics)
     print("\nExtraction complete!")
+    metrics.finish(args.profile, args.metrics, args.trace)
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,11 @@
 import os
 import csv
 import argparse
-from tqdm import tqdm
 
-def generate_csv(dataset_path, output_csv_path):
+from build_metrics import BuildMetrics, add_metrics_arguments, metrics_from_args
+
+def generate_csv(dataset_path, output_csv_path, metrics=None):
+    metrics = metrics or BuildMetrics('generate_index_csv', enabled=False)
     if not os.path.exists(dataset_path):
         print(f"Error: Dataset path '{dataset_path}' does not exist.")
         return
@@ -12,21 +14,25 @@ def generate_csv(dataset_path, output_csv_path):
     data = []
     
     # List all subdirectories
-    subdirs = [d for d in os.listdir(dataset_path) if os.path.isdir(os.path.join(dataset_path, d))]
+    with metrics.phase('scan'):
+        subdirs = [d for d in os.listdir(dataset_path) if os.path.isdir(os.path.join(dataset_path, d))]
     
     print(f"Found {len(subdirs)} folders in {dataset_path}. Processing...")
     
+    from tqdm import tqdm # imported here so --help starts fast
+    
     for subdir in tqdm(subdirs, desc="Reading word.txt files"):
         folder_path = os.path.join(dataset_path, subdir)
         word_txt_path = os.path.join(folder_path, 'word.txt')
         
         if os.path.exists(word_txt_path):
             try:
-                with open(word_txt_path, 'r', encoding='utf-8') as f:
+                with metrics.phase('read'), open(word_txt_path, 'r', encoding='utf-8') as f:
                     word = f.read().strip()
                     # Only add if word is not empty
                     if word:
                         data.append({'id': subdir, 'word': word})
+                        metrics.count('words')
             except Exception as e:
                 print(f"Error reading {word_txt_path}: {e}")
         else:
@@ -46,7 +52,7 @@ def generate_csv(dataset_path, output_csv_path):
     print(f"Writing {len(data)} entries to {output_csv_path}...")
     
     try:
-        with open(output_csv_path, 'w', encoding='utf-8', newline='') as csvfile:
+        with metrics.phase('write'), open(output_csv_path, 'w', encoding='utf-8', newline='') as csvfile:
             fieldnames = ['id', 'word']
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             
@@ -57,11 +63,18 @@ def generate_csv(dataset_path, output_csv_path):
     except Exception as e:
         print(f"Error writing CSV: {e}")
 
-if __name__ == "__main__":
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Generate CSV index from MMID extracted folders.")
     parser.add_argument("dataset_path", help="Path to the extracted dataset directory")
     parser.add_argument("--output", help="Path to the output CSV file (default: index.csv in dataset directory)")
     
-    args = parser.parse_args()
+    add_metrics_arguments(parser)
     
-    generate_csv(args.dataset_path, args.output)
+    args = parser.parse_args(argv)
+    
+    metrics = metrics_from_args('generate_index_csv', args)
+    generate_csv(args.dataset_path, args.output, metrics)
+    metrics.finish(args.profile, args.metrics, args.trace)
+
+if __name__ == "__main__":
+    main()
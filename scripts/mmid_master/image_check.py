@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+'''
+Header-only image validation for MMID word packages.
+
+A fair share of MMID fetches failed (see errors.json) and left truncated files
+or saved error pages behind under image names. check_image() catches those
+without decoding: it checks the magic bytes, reads the dimensions from the
+header (JPEG SOF, PNG IHDR, GIF screen descriptor) and checks the end marker.
+
+During extraction mmid_manager walks each word's images in rank order and
+skips the ones that fail, so a bad image in the top k is replaced by the next
+good one instead of ending up in a quiz round.
+
+python3 scripts/mmid_master/image_check.py mini-german-package-k3
+python3 scripts/mmid_master/image_check.py scale-german-package/1005/03.jpg
+'''
+
+import os
+import sys
+import struct
+import argparse
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+HEAD_BYTES = 64 * 1024 # covers the headers of most files in one read
+TAIL_BYTES = 64
+
+# Start-of-frame markers carrying the dimensions (not DHT C4, JPG C8, DAC CC)
+JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def _jpeg_size(read):
+    """
+    (width, height) from the first SOF segment, or None if the file ends before one.
+    read(offset, n) returns up to n bytes; only the segment headers are read, so
+    large APPn blocks (XMP, Photoshop data) cost a seek instead of a read.
+    """
+    pos = 2
+    while True:
+        header = read(pos, 9)
+        if len(header) < 4 or header[0] != 0xFF:
+            return None
+        marker = header[1]
+        if marker == 0xFF: # fill byte
+            pos += 1
+            continue
+        if marker in (0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7): # no length field
+            pos += 2
+            continue
+        if marker in JPEG_SOF:
+            if len(header) < 9:
+                return None
+            height, width = struct.unpack('>HH', header[5:9])
+            return width, height
+        if marker == 0xDA: # start of scan before any frame header
+            return None
+        pos += 2 + struct.unpack('>H', header[2:4])[0]
+
+
+def _check(head, tail, read):
+    if not head:
+        return 'empty', None
+    tail = tail.rstrip(b'\x00\r\n ')
+
+    if head[:3] == b'\xff\xd8\xff':
+        size = _jpeg_size(read)
+        if size is None:
+            return 'no JPEG frame header', None
+        complete = tail.endswith(b'\xff\xd9')
+    elif head[:8] == b'\x89PNG\r\n\x1a\n':
+        if len(head) < 24 or head[12:16] != b'IHDR':
+            return 'no PNG header', None
+        size = struct.unpack('>II', head[16:24])
+        complete = b'IEND' in tail[-16:]
+    elif head[:6] in (b'GIF87a', b'GIF89a'):
+        if len(head) < 10:
+            return 'no GIF header', None
+        size = struct.unpack('<HH', head[6:10])
+        complete = tail.endswith(b';')
+    else:
+        return 'not an image', None
+
+    if not size[0] or not size[1]:
+        return 'zero dimensions', tuple(size)
+    if not complete:
+        return 'truncated', tuple(size)
+    return None, tuple(size)
+
+
+def check_image(data):
+    """(problem, (width, height)) for an image's bytes; problem is None for a good image."""
+    return _check(data[:HEAD_BYTES], data[-TAIL_BYTES:], lambda offset, n: data[offset:offset + n])
+
+
+def check_image_file(path):
+    """check_image() for a file, reading only its header(s) and last bytes."""
+    try:
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            head = f.read(HEAD_BYTES)
+            if size <= HEAD_BYTES:
+                return check_image(head)
+            f.seek(size - TAIL_BYTES)
+            tail = f.read(TAIL_BYTES)
+
+            def read(offset, n):
+                if offset + n <= len(head):
+                    return head[offset:offset + n]
+                f.seek(offset)
+                return f.read(n)
+            return _check(head, tail, read)
+    except OSError as e:
+        return f"unreadable ({e.strerror})", None
+
+
+def pick_valid(candidates, k, check, executor=None):
+    """
+    The first k candidates (in the given order) that pass check(candidate) -> problem or None,
+    plus [(candidate, problem)] for the ones that were rejected on the way.
+    With an executor, each round checks as many candidates as there are open slots in parallel.
+    """
+    chosen, rejected = [], []
+    pos = 0
+    while len(chosen) < k and pos < len(candidates):
+        batch = candidates[pos:pos + k - len(chosen)]
+        pos += len(batch)
+        problems = executor.map(check, batch) if executor else map(check, batch)
+        for candidate, problem in zip(batch, problems):
+            if problem:
+                rejected.append((candidate, problem))
+            else:
+                chosen.append(candidate)
+    return chosen, rejected
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check images (or every image of a package/word folder) without decoding them.")
+    parser.add_argument('paths', nargs='+', help="Image files, word folders or package folders")
+    args = parser.parse_args()
+
+    checked = bad = 0
+    for path in args.paths:
+        if os.path.isdir(path):
+            files = sorted(os.path.join(root, name) for root, _, names in os.walk(path)
+                           for name in names if name.lower().endswith(IMAGE_EXTENSIONS))
+        else:
+            files = [path]
+        for file_path in files:
+            problem, size = check_image_file(file_path)
+            checked += 1
+            if problem:
+                bad += 1
+                print(f"{file_path}: {problem}")
+    print(f"{checked} images checked, {bad} bad")
+    sys.exit(1 if bad else 0)
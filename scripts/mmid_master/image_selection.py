@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+
+'''
+Metadata-driven top-k image selection for MMID word packages.
+
+Picks images using only metadata.json (original width/height, type, source URL),
+so no image ever has to be opened or decoded.
+
+python3 scripts/mmid_master/image_selection.py mini-german-package-k3/1005 --policy "square:0.8,min:300,type:jpg,distinct-hosts" --k 3
+'''
+
+import os
+import json
+import argparse
+from urllib.parse import urlparse
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# metadata 'ity' values are free-form; fold the common aliases together
+TYPE_ALIASES = {
+    'jpeg': 'jpg',
+    'jpg:small': 'jpg',
+    'jpg:medium': 'jpg',
+    'jpg:large': 'jpg',
+}
+
+_decoder = json.JSONDecoder()
+
+
+def iter_metadata_entries(text):
+    """
+    Yields (key, entry) pairs from the top-level object of a metadata.json string.
+    The whole text is already in memory; entries are decoded one at a time, so a
+    truncated or malformed file still yields every entry before the damage
+    (json.loads would reject it outright).
+    """
+    pos = text.find('{')
+    if pos < 0:
+        return
+    pos += 1
+    length = len(text)
+
+    while pos < length:
+        # Skip whitespace and separators between entries
+        while pos < length and text[pos] in ' \t\r\n,':
+            pos += 1
+        if pos >= length or text[pos] == '}':
+            return
+
+        key, pos = _decoder.raw_decode(text, pos)
+        while pos < length and text[pos] in ' \t\r\n:':
+            pos += 1
+        value, pos = _decoder.raw_decode(text, pos)
+        yield key, value
+
+
+def load_image_metadata(path):
+    """Reads a metadata.json file from disk. Returns {} if it can't be read."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return parse_image_metadata(f.read())
+    except (OSError, UnicodeDecodeError):
+        return {}
+
+
+def parse_image_metadata(text):
+    """
+    Parses metadata.json content (str or bytes) into {image_stem: info}, where info holds
+    'width', 'height', 'type', 'host' and 'success'. Entries are keyed by stem ("09")
+    because the packaged files are renamed (09.JPG in metadata ends up as 09.jpg on disk).
+    """
+    if isinstance(text, bytes):
+        text = text.decode('utf-8', errors='replace')
+
+    images = {}
+    try:
+        for key, entry in iter_metadata_entries(text):
+            if not isinstance(entry, dict):
+                continue
+            google = entry.get('google') or {}
+            url = google.get('ou') or entry.get('image_link') or ''
+            image_type = (google.get('ity') or '').lower()
+            images[str(key)] = {
+                'width': google.get('ow') or 0,
+                'height': google.get('oh') or 0,
+                'type': TYPE_ALIASES.get(image_type, image_type),
+                'host': urlparse(url).netloc.lower(),
+                'success': entry.get('success', True),
+            }
+    except ValueError:
+        # Truncated or malformed metadata: keep whatever parsed cleanly
+        pass
+    return images
+
+
+class SelectionPolicy:
+    """
+    Ranks a word's candidate images from metadata alone.
+
+    Spec is a comma separated list of rules, e.g. "square:0.8,min:300,type:jpg,distinct-hosts":
+      square:R        short side / long side must be >= R
+      min:N           short side must be >= N pixels
+      type:a|b        metadata image type must be one of the listed types
+      distinct-hosts  prefer images from hosts not already picked
+    """
+
+    def __init__(self, min_side=0, min_squareness=0.0, types=None, distinct_hosts=False):
+        self.min_side = min_side
+        self.min_squareness = min_squareness
+        self.types = set(types) if types else None
+        self.distinct_hosts = distinct_hosts
+
+    @classmethod
+    def from_spec(cls, spec):
+        policy = cls()
+        if not spec:
+            return policy
+
+        for rule in spec.split(','):
+            rule = rule.strip().lower()
+            if not rule:
+                continue
+            name, _, value = rule.partition(':')
+            if name == 'square':
+                policy.min_squareness = float(value) if value else 0.9
+            elif name == 'min':
+                policy.min_side = int(value)
+            elif name == 'type':
+                policy.types = {TYPE_ALIASES.get(t, t) for t in value.split('|') if t}
+            elif name == 'distinct-hosts':
+                policy.distinct_hosts = True
+            else:
+                raise ValueError(f"Unknown selection rule: {rule}")
+        return policy
+
+    def accepts(self, info):
+        if not info.get('success', True):
+            return False
+
+        width, height = info.get('width', 0), info.get('height', 0)
+        short_side, long_side = min(width, height), max(width, height)
+        if self.min_side and short_side < self.min_side:
+            return False
+        if self.min_squareness and (not long_side or short_side / long_side < self.min_squareness):
+            return False
+        if self.types is not None and info.get('type') not in self.types:
+            return False
+        return True
+
+    def select(self, filenames, metadata, k):
+        """
+        Returns up to k filenames. Candidates keep their filename (search rank) order;
+        images passing every rule come first, then the rest fill any remaining slots.
+        """
+        ranked = sorted(filenames)
+        if not metadata:
+            return ranked[:k]
+
+        info_for = {f: metadata.get(os.path.splitext(f)[0]) for f in ranked}
+        passing = [f for f in ranked if info_for[f] and self.accepts(info_for[f])]
+        chosen = []
+        seen_hosts = set()
+
+        if self.distinct_hosts:
+            for f in passing:
+                host = info_for[f]['host']
+                if host and host in seen_hosts:
+                    continue
+                seen_hosts.add(host)
+                chosen.append(f)
+                if len(chosen) == k:
+                    return chosen
+
+        for f in passing + ranked:
+            if len(chosen) == k:
+                break
+            if f not in chosen:
+                chosen.append(f)
+        return chosen
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Preview metadata-driven image selection for a word folder.")
+    parser.add_argument("word_dir", help="Path to an extracted word folder containing metadata.json")
+    parser.add_argument("--policy", type=str, default='', help="Selection policy spec, e.g. 'square:0.8,min:300,type:jpg,distinct-hosts'")
+    parser.add_argument("--k", type=int, default=3, help="Number of images to pick")
+
+    args = parser.parse_args()
+
+    metadata = load_image_metadata(os.path.join(args.word_dir, 'metadata.json'))
+    files = [f for f in os.listdir(args.word_dir) if f.lower().endswith(IMAGE_EXTENSIONS)]
+    policy = SelectionPolicy.from_spec(args.policy)
+
+    for name in policy.select(files, metadata, args.k):
+        info = metadata.get(os.path.splitext(name)[0], {})
+        print(f"{name}\t{info.get('width')}x{info.get('height')}\t{info.get('type')}\t{info.get('host')}")
@@ -0,0 +1,217 @@
+'''
+Parallel top-k extraction for nested word archives (scale-*-package/1234.tar.gz).
+
+The outer package is one gzip stream and has to be read in order, but each inner
+archive is small, independent and most of the CPU time goes into decompressing
+it. InnerTarPool lets the reader copy an inner archive (its size is known from the
+TarInfo) into a shared-memory block and move on; a process pool decompresses the
+blocks, picks the top k and hands back only the chosen files. At most `window`
+archives are in flight, so memory stays capped however far the workers fall behind,
+and results come back in stream order.
+
+pick_from_tar() is the selection itself and is also used inline by mmid_manager.py.
+'''
+
+import os
+import io
+import tarfile
+from collections import deque
+
+from build_metrics import BuildMetrics
+from image_check import check_image
+from image_selection import parse_image_metadata
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+META_FILES = ('word.txt', 'metadata.json', 'errors.json')
+# The reading process decompresses the outer stream, so it gets one core of its own
+DEFAULT_INNER_WORKERS = max(0, min(8, (os.cpu_count() or 1) - 1))
+COPY_CHUNK = 1024 * 1024
+
+
+def pick_from_tar(tar_obj, k, policy=None, validate=True, metrics=None):
+    """
+    ([(filename, data)] to write, [(filename, problem)] rejected) for one word archive:
+    the top k images (by policy, else by name), skipping bad ones when validating,
+    followed by the word's metadata files.
+    """
+    metrics = metrics or BuildMetrics('inner_pool', enabled=False)
+    with metrics.phase('parse'):
+        members = tar_obj.getmembers()
+    images = [m for m in members if m.name.lower().endswith(IMAGE_EXTENSIONS)]
+    images.sort(key=lambda x: x.name)
+
+    meta_files = [m for m in members if os.path.basename(m.name) in META_FILES]
+
+    ranked = images
+    metadata_member = next((m for m in meta_files if os.path.basename(m.name) == 'metadata.json'), None)
+    if policy and metadata_member:
+        f = tar_obj.extractfile(metadata_member)
+        with metrics.phase('parse'):
+            metadata = parse_image_metadata(f.read()) if f else {}
+        by_name = {os.path.basename(m.name): m for m in images}
+        ranked = [by_name[n] for n in policy.select(list(by_name), metadata, len(by_name) if validate else k)]
+
+    def read(member):
+        f = tar_obj.extractfile(member)
+        if not f:
+            return None
+        with metrics.phase('decompress'):
+            return f.read()
+
+    files, rejected = [], []
+    if validate:
+        # The archive is already in memory; walk down the ranking until k images pass
+        for member in ranked:
+            if len(files) == k:
+                break
+            data = read(member)
+            if data is None:
+                continue
+            with metrics.phase('validate'):
+                problem, _ = check_image(data)
+            if problem:
+                rejected.append((os.path.basename(member.name), problem))
+            else:
+                files.append((os.path.basename(member.name), data))
+        to_read = meta_files
+    else:
+        to_read = ranked[:k] + meta_files
+
+    for member in to_read:
+        data = read(member)
+        if data is not None:
+            files.append((os.path.basename(member.name), data))
+    return files, rejected
+
+
+class SharedBufferReader:
+    """Read-only, seekable file object over a memoryview, so tarfile can open a block without copying it."""
+
+    def __init__(self, buf):
+        self.buf = buf
+        self.pos = 0
+
+    def read(self, size=-1):
+        end = len(self.buf) if size is None or size < 0 else min(len(self.buf), self.pos + size)
+        data = bytes(self.buf[self.pos:end])
+        self.pos = end
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.pos
+        elif whence == io.SEEK_END:
+            offset += len(self.buf)
+        self.pos = max(0, offset)
+        return self.pos
+
+    def tell(self):
+        return self.pos
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+
+def _pick_from_shared(shm_name, size, k, policy, validate):
+    """Runs in a worker: pick_from_tar() on the archive in shared-memory block shm_name."""
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=shm_name)
+    view = shm.buf[:size]
+    try:
+        with tarfile.open(fileobj=SharedBufferReader(view), mode="r:gz") as inner_tar:
+            return pick_from_tar(inner_tar, k, policy, validate)
+    finally:
+        # Every export of the buffer has to be gone before the block can be closed
+        view.release()
+        shm.close()
+
+
+class InnerTarPool:
+    """
+    pool.submit(key, fileobj, size) copies an archive into shared memory and queues it;
+    it returns the results that are ready, in submission order, as (key, files, rejected, error).
+    Call drain() at the end for the rest. Blocks once `window` archives are in flight.
+    """
+
+    def __init__(self, workers, k, policy=None, validate=True, window=None, metrics=None):
+        # Both cost ~20ms to import; flat packages never create a pool
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+        self.shared_memory = shared_memory
+        # Not fork: the OutputWriter threads may hold locks at that moment, and a forked
+        # worker would inherit them locked
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        self.k = k
+        self.policy = policy
+        self.validate = validate
+        self.window = max(1, window or 2 * workers)
+        self.metrics = metrics or BuildMetrics('inner_pool', enabled=False)
+        self.in_flight = deque() # (key, future, shm)
+
+    def submit(self, key, fileobj, size):
+        ready = []
+        while len(self.in_flight) >= self.window:
+            ready.append(self._finish_oldest())
+
+        shm = self.shared_memory.SharedMemory(create=True, size=max(1, size))
+        try:
+            with self.metrics.phase('read'):
+                self._copy_into(fileobj, shm.buf, size)
+            future = self.executor.submit(_pick_from_shared, shm.name, size, self.k, self.policy, self.validate)
+        except BaseException:
+            self._release(shm)
+            raise
+        self.in_flight.append((key, future, shm))
+
+        # Hand back whatever finished meanwhile without waiting for the rest
+        while self.in_flight and self.in_flight[0][1].done():
+            ready.append(self._finish_oldest())
+        return ready
+
+    def drain(self):
+        ready = []
+        while self.in_flight:
+            ready.append(self._finish_oldest())
+        return ready
+
+    def close(self):
+        """Drops anything still in flight (after an error or Ctrl+C) and stops the workers."""
+        while self.in_flight:
+            _, future, shm = self.in_flight.popleft()
+            future.cancel()
+            try:
+                future.exception()
+            except BaseException:
+                pass
+            self._release(shm)
+        self.executor.shutdown(wait=True)
+
+    def _copy_into(self, fileobj, buf, size):
+        pos = 0
+        while pos < size:
+            n = fileobj.readinto(buf[pos:min(size, pos + COPY_CHUNK)])
+            if not n:
+                raise EOFError(f"archive ended after {pos} of {size} bytes")
+            pos += n
+
+    def _finish_oldest(self):
+        key, future, shm = self.in_flight.popleft()
+        try:
+            with self.metrics.phase('wait'):
+                files, rejected = future.result()
+            return key, files, rejected, None
+        except Exception as e:
+            return key, [], [], e
+        finally:
+            self._release(shm)
+
+    def _release(self, shm):
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
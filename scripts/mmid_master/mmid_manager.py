@@ -3,7 +3,14 @@
 '''
 python3 scripts/mmid_master/mmid_manager.py --list
 python3 scripts/mmid_master/mmid_manager.py --lang japanese --download --limit 3
+python3 scripts/mmid_master/mmid_manager.py --langs de,ja,es --limit 3 --dest packages
+python3 scripts/mmid_master/mmid_manager.py --extract --source scale-japanese-package.tgz --limit 3 --dest out/k3 --shard 0/4
 python3 scripts/mmid_master/mmid_manager.py --extract --source scale-japanese-package.tgz --limit 3
+python3 scripts/mmid_master/mmid_manager.py --extract --source scale-japanese-package.tgz --limit 3 --select "square:0.8,min:300,type:jpg,distinct-hosts"
+python3 scripts/mmid_master/mmid_manager.py --extract --source scale-japanese-package.tgz --limit 3 --writers 8 --fsync
+python3 scripts/mmid_master/mmid_manager.py --extract --source scale-japanese-package.tgz --limit 3 --pack
+python3 scripts/mmid_master/mmid_manager.py --extract --source scale-spanish-package.tgz --limit 3 --inner-workers 4
+python3 scripts/mmid_master/mmid_manager.py --extract --source https://example.org/scale-spanish-package.tgz --limit 3 --dest scale-spanish-package-k3
 '''
 
 
@@ -14,33 +21,40 @@ import argparse
 import re
 import subprocess
 import tarfile
-import shutil
 import json
-from tqdm import tqdm
+from contextlib import closing
+
+from downloads_md import find_downloads_md, parse_downloads_md
+from image_selection import SelectionPolicy
+from build_metrics import BuildMetrics, add_metrics_arguments, metrics_from_args
+from output_writer import OutputWriter, DEFAULT_WORKERS
+from package_pack import PackWriter
+from batch_scheduler import BatchScheduler, resolve_languages
+from verify_packages import load_archive_record, record_archive
+from shard_merge import SHARD_MANIFEST, parse_shard, shard_dir, write_shard_outputs
+from inner_pool import DEFAULT_INNER_WORKERS
+from word_source import iter_words
+from download_cache import DownloadCache, add_cache_arguments, cache_from_args
 
 class MMIDManager:
     def __init__(self, downloads_md_path=None):
         self.downloads_md_path = downloads_md_path
         self.data = {}
+        self.selection_policy = None # SelectionPolicy; None keeps the first k by filename
+        self.metrics = BuildMetrics('mmid_manager', enabled=False)
+        self.writer_workers = DEFAULT_WORKERS # 0 writes synchronously
+        self.fsync = False
+        self.pack = False # write <dest>.pack + index instead of a directory tree
+        self.shard = None # (i, N): only word ids with crc32(id) % N == i
+        self.writer = None # OutputWriter while an extraction is running
+        self.validate = True # skip truncated/non-image files and backfill from lower-ranked images
+        self.rejected = {} # word id -> {filename: problem} for the current extraction
+        self.inner_workers = DEFAULT_INNER_WORKERS # processes for nested word archives (0 = inline)
+        self.cache = DownloadCache() # shared download cache; None downloads straight into --dest
         
     def resolve_downloads_md_path(self):
         """Finds the downloads.md file."""
-        if self.downloads_md_path and os.path.exists(self.downloads_md_path):
-            return self.downloads_md_path
-            
-        # Search common locations
-        candidates = [
-            os.path.join(os.getcwd(), 'mmid-master', 'downloads.md'),
-            os.path.join(os.getcwd(), '..', '..', 'mmid-master', 'downloads.md'), # If running from scripts/mmid_master/
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'mmid-master', 'downloads.md'),
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'downloads.md'),
-            'downloads.md'
-        ]
-        
-        for path in candidates:
-            if os.path.exists(path):
-                return path
-        return None
+        return find_downloads_md(self.downloads_md_path)
 
     def parse_downloads_md(self):
         """Parses the downloads.md file to extract download links."""
@@ -53,50 +67,10 @@ class MMIDManager:
         print(f"Reading data from: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            self.data.update(parse_downloads_md(file_path))
         except Exception as e:
             print(f"Error reading file: {e}")
             return False
-
-        # Regex to extract URL from [link](url)
-        link_pattern = re.compile(r'\((https?://[^)]+)\)')
-        
-        for line in lines:
-            line = line.strip()
-            if not line.startswith('|') or '---' in line:
-                continue
-                
-            parts = [p.strip() for p in line.split('|')]
-            
-            # | language | 100 images | 1 image | metadata | dictionary | web text |
-            # split gives: ['', 'lang', '100', '1', 'meta', 'dict', 'text', '']
-            
-            if len(parts) < 3:
-                continue
-                
-            language = parts[1].lower()
-            if not language or language == 'language' or '**' in language:
-                continue
-            
-            links = {}
-            
-            # Helper to extract link from column index
-            def get_link(index):
-                if index < len(parts):
-                    m = link_pattern.search(parts[index])
-                    return m.group(1) if m else None
-                return None
-
-            links['full'] = get_link(2)       # 100 images
-            links['mini'] = get_link(3)       # 1 image
-            links['metadata'] = get_link(4)   # metadata
-            links['dictionary'] = get_link(5) # dictionary
-            links['text'] = get_link(6)       # web text
-            
-            # Only add if we have at least one link
-            if any(links.values()):
-                self.data[language] = links
                 
         return True
 
@@ -118,7 +92,7 @@ class MMIDManager:
             print(f"  {lang}")
         print()
 
-    def download_file(self, url, dest_folder):
+    def download_file(self, url, dest_folder, quiet=False):
         if not os.path.exists(dest_folder):
             os.makedirs(dest_folder)
         
@@ -126,13 +100,30 @@ class MMIDManager:
         dest_path = os.path.join(dest_folder, filename)
         
         if os.path.exists(dest_path):
-            print(f"File {filename} already exists in {dest_folder}. Skipping download.")
-            return dest_path
+            record = load_archive_record(dest_path)
+            if record and record['size'] != os.path.getsize(dest_path):
+                print(f"File {filename} does not match its recorded size ({record['size']} bytes). Downloading again.")
+                os.remove(dest_path)
+            else:
+                print(f"File {filename} already exists in {dest_folder}. Skipping download.")
+                return dest_path
+
+        if self.cache:
+            cached_path = self.cache.fetch(url, quiet=quiet, metrics=self.metrics)
+            return self.cache.link_into(cached_path, dest_folder) if cached_path else None
 
         print(f"Downloading {url} to {dest_path}...")
         try:
-            # Use curl for downloading, it's reliable and shows progress
-            subprocess.run(['curl', '-L', '-O', url], cwd=dest_folder, check=True)
+            # Use curl for downloading, it's reliable and shows progress.
+            # The download lands in .part (resumed with -C - if a previous run was cut off)
+            # and only gets the real name once curl succeeds, so a partial file is never reused.
+            # quiet drops curl's progress meter, which would garble a concurrent extraction's progress bar
+            part_name = filename + '.part'
+            with self.metrics.phase('network'):
+                subprocess.run(['curl', '-L', '-C', '-', '-o', part_name] + (['-sS'] if quiet else []) + [url], cwd=dest_folder, check=True)
+            os.replace(os.path.join(dest_folder, part_name), dest_path)
+            with self.metrics.phase('verify'):
+                record_archive(dest_path, url)
             print("Download complete.")
             return dest_path
         except subprocess.CalledProcessError:
@@ -145,6 +136,7 @@ class MMIDManager:
     def _handle_dictionary(self, source_path, dest_dir):
         """
         Attempts to download the dictionary for the language and create a words.json mapping.
+        With --pack both go into the pack's root instead of dest_dir, which is never created.
         """
         # 1. Guess language from filename
         filename = os.path.basename(source_path)
@@ -173,18 +165,27 @@ class MMIDManager:
         # 3. Download dictionary
         dict_filename = os.path.basename(dict_url)
         dict_path = os.path.join(dest_dir, dict_filename)
+        json_path = os.path.join(dest_dir, 'words.json')
+        temp_path = None
         
-        if not os.path.exists(dest_dir):
+        if self.pack:
+            dict_path = temp_path = dest_dir.rstrip('/\\') + '.dictionary.tmp'
+        elif not os.path.exists(dest_dir):
             os.makedirs(dest_dir)
 
         try:
-            if not os.path.exists(dict_path):
+            if self.pack or not os.path.exists(dict_path):
                 print(f"Downloading dictionary for {lang}...")
-                subprocess.run(['curl', '-L', '-o', dict_path, dict_url], check=True)
+                if self.cache:
+                    cached_path = self.cache.fetch(dict_url, metrics=self.metrics)
+                    if not cached_path:
+                        return
+                    dict_path = cached_path if self.pack else self.cache.link_into(cached_path, dest_dir)
+                else:
+                    subprocess.run(['curl', '-L', '-o', dict_path, dict_url], check=True)
                 
             # 4. Process TSV to JSON
-            json_path = os.path.join(dest_dir, 'words.json')
-            if not os.path.exists(json_path):
+            if self.pack or not os.path.exists(json_path):
                 print("Generating words.json from dictionary...")
                 word_map = {}
                 with open(dict_path, 'r', encoding='utf-8') as f:
@@ -195,193 +196,169 @@ class MMIDManager:
                             word_id = parts[1]
                             word_map[word_id] = word
                 
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(word_map, f, ensure_ascii=False, indent=2)
+                data = json.dumps(word_map, ensure_ascii=False, indent=2).encode('utf-8')
+                if self.pack:
+                    with open(dict_path, 'rb') as f:
+                        self.writer.write(os.path.join(dest_dir, dict_filename), f.read())
+                    self.writer.write(json_path, data)
+                else:
+                    with open(json_path, 'wb') as f:
+                        f.write(data)
                     
                 print(f"Created words.json with {len(word_map)} entries.")
             
         except Exception as e:
             print(f"Error handling dictionary: {e}")
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
 
     def extract_top_k(self, source_path, dest_dir, k):
         """
-        Extracts top k images from source_path (tarball or directory) to dest_dir.
+        Extracts top k images from source_path (tarball, directory or http(s) URL of a tarball) to dest_dir.
+        Returns False if the source couldn't be read to the end, so callers keep the archive.
+        Ctrl+C is re-raised once the pending writes are flushed.
         """
-        if not os.path.exists(source_path):
+        is_url = source_path.startswith(('http://', 'https://'))
+        if not is_url and not os.path.exists(source_path):
             print(f"Error: Source not found: {source_path}")
-            return
+            return False
+        if not is_url and not os.path.isdir(source_path) and not tarfile.is_tarfile(source_path):
+            print(f"Error: Source is neither a directory nor a tar file: {source_path}")
+            return False
+
+        if self.shard:
+            dest_dir = self.output_dir(dest_dir)
+            print(f"Shard {self.shard[0]}/{self.shard[1]}: writing to {dest_dir}")
 
-        if not os.path.exists(dest_dir):
+        if not self.pack and not os.path.exists(dest_dir):
             os.makedirs(dest_dir)
             print(f"Created destination directory: {dest_dir}")
-
-        # Try to handle dictionary/mapping automatically
-        self._handle_dictionary(source_path, dest_dir)
-
-        if os.path.isdir(source_path):
-            print(f"Processing directory: {source_path}")
-            self._process_directory_source(source_path, dest_dir, k)
-        elif tarfile.is_tarfile(source_path):
-            print(f"Processing tarball: {source_path}")
-            self._process_tarball_source(source_path, dest_dir, k)
+        if self.shard and os.path.exists(os.path.join(dest_dir, SHARD_MANIFEST)):
+            # A rerun is unfinished until it writes its own manifest
+            os.remove(os.path.join(dest_dir, SHARD_MANIFEST))
+
+        if self.pack:
+            # Everything, the dictionary included, goes into the one file; dest_dir is never created
+            pack_path = self.output_dir(dest_dir)
+            os.makedirs(os.path.dirname(os.path.abspath(pack_path)), exist_ok=True)
+            self.writer = PackWriter(pack_path, dest_dir)
+            print(f"Writing packed package: {pack_path}")
         else:
-            print(f"Error: Source is neither a directory nor a tar file: {source_path}")
+            self.writer = OutputWriter(self.writer_workers, fsync=self.fsync, metrics=self.metrics)
+        self.rejected = {}
+        try:
+            # Try to handle dictionary/mapping automatically
+            self._handle_dictionary(source_path, dest_dir)
 
-    def _process_directory_source(self, source_dir, dest_dir, k):
-        # Find word folders (or tarballs inside)
-        items = os.listdir(source_dir)
-        # Assuming structure: source_dir/word_id/images...
-        # Or source_dir might contain word_id.tar.gz
-        
-        # We need to detect if source_dir is the package root (containing numbered folders)
-        # or if it's already inside a word folder (unlikely for batch processing)
-        
-        word_items = [i for i in items if i.replace('.tar.gz', '').isdigit()]
-        
-        if not word_items:
-            # Maybe the source_dir IS the extracted package folder which contains the word folders
-            # Let's check one level deeper if needed, or just assume the provided path is correct
-            print(f"Found {len(word_items)} word items in {source_dir}.")
-        
-        for item in tqdm(word_items, desc="Processing words"):
-            src_item_path = os.path.join(source_dir, item)
-            word_id = item.replace('.tar.gz', '')
-            dest_word_dir = os.path.join(dest_dir, word_id)
-            
-            if os.path.isdir(src_item_path):
-                self._copy_top_k_from_dir(src_item_path, dest_word_dir, k)
-            elif tarfile.is_tarfile(src_item_path):
-                self._extract_top_k_from_tar(src_item_path, dest_word_dir, k)
-
-    def _process_tarball_source(self, tar_path, dest_dir, k):
-        # If it's a main package tarball (e.g., scale-spanish-package.tgz), 
-        # it contains many .tar.gz files (one per word) inside.
-        # We can extract them on the fly without extracting the whole big package first.
-        
-        print(f"Reading main package stream from {tar_path}...")
-        print("Note: This is a large file (19GB+), scanning may take a moment to start...")
-        
+            if os.path.isdir(source_path):
+                print(f"Processing directory: {source_path}")
+            else:
+                print(f"Processing tarball: {source_path}")
+            ok = self._write_words(source_path, dest_dir, k)
+            self._write_rejected_report(dest_dir)
+        finally:
+            # Pending writes finish (and are fsynced) before the caller sees the output
+            self.writer.close()
+            self.writer = None
+
+        if self.shard and ok:
+            # shard_manifest.json marks the shard as finished for shard_merge.py
+            words = write_shard_outputs(dest_dir, self.shard)
+            print(f"Shard {self.shard[0]}/{self.shard[1]}: {words} words. Run shard_merge.py once every shard has finished.")
+        elif self.shard:
+            print(f"Shard {self.shard[0]}/{self.shard[1]} did not finish; rerun it before merging.")
+        return ok
+
+    def output_dir(self, dest_dir):
+        """What extract_top_k(source, dest_dir, k) writes: dest_dir, its shard folder with --shard, or <dest_dir>.pack."""
+        if self.pack:
+            return dest_dir.rstrip('/\\') + '.pack'
+        return shard_dir(dest_dir, self.shard) if self.shard else dest_dir
+
+    def _write_words(self, source_path, dest_dir, k):
+        """Writes every record of word_source.iter_words() to dest_dir/<word id>/ (or the pack). False if reading failed."""
+        from tqdm import tqdm # imported here so --list and --help start fast
+        is_dir = os.path.isdir(source_path)
+        if is_dir:
+            pbar = tqdm(desc="Processing words")
+        else:
+            # A package is one gzip stream: progress is tracked by compressed bytes consumed,
+            # which gives a real ETA even though the number of words isn't known up front
+            print(f"Reading main package stream from {source_path}...")
+            print("Note: This is a large file (19GB+), scanning may take a moment to start...")
+            pbar = tqdm(desc="Scanning & Extracting", unit="B", unit_scale=True)
+
+        def progress(done, total):
+            if total and pbar.total != total:
+                pbar.total = total
+                pbar.refresh()
+            pbar.update(done - pbar.n)
+
+        words = iter_words(source_path, k, self.selection_policy, self.validate, self.shard, self.inner_workers,
+                           parse_metadata=False, metrics=self.metrics, progress=progress, warn=pbar.write)
+        count = 0
         try:
-            # Use 'r|gz' for streaming access which avoids reading the whole file structure first
-            with tarfile.open(tar_path, "r|gz") as main_tar:
-                count = 0
-                word_counts = {} # word_id -> number of images extracted
-                
-                # Wrap main_tar in tqdm to show progress of iterating through members
-                # Since we don't know the total number of files, it will show iterations/sec
-                pbar = tqdm(main_tar, desc="Scanning & Extracting", unit="file")
-                
-                for member in pbar:
-                    if not member.isfile():
-                        continue
-                        
-                    # CASE A: Nested tarball (e.g. scale-spanish-package/1234.tar.gz)
-                    if member.name.endswith('.tar.gz') and member.name.split('/')[-1].replace('.tar.gz', '').isdigit():
-                        word_id = member.name.split('/')[-1].replace('.tar.gz', '')
-                        dest_word_dir = os.path.join(dest_dir, word_id)
-                        
-                        # Extract the inner tar to memory/temp file to process it
-                        f = main_tar.extractfile(member)
-                        if f:
-                            try:
-                                with tarfile.open(fileobj=f, mode="r:gz") as inner_tar:
-                                    self._extract_from_tar_object(inner_tar, dest_word_dir, k)
-                                count += 1
-                                if count % 100 == 0:
-                                    pbar.set_description(f"Extracted {count} words")
-                            except Exception as e:
-                                pbar.write(f"Warning: Failed to process inner tar {member.name}: {e}")
-                    
-                    # CASE B: Flat directory structure (e.g. scale-japanese-package/5418/01.jpg)
-                    else:
-                        parts = member.name.split('/')
-                        # Expect: root_dir/word_id/filename
-                        if len(parts) >= 3 and parts[-2].isdigit():
-                            word_id = parts[-2]
-                            filename = parts[-1]
-                            dest_word_dir = os.path.join(dest_dir, word_id)
-                            
-                            is_image = filename.lower().endswith(('.png', '.jpg', '.jpeg'))
-                            is_meta = filename in ['word.txt', 'metadata.json', 'errors.json']
-                            
-                            if is_image:
-                                current_word_count = word_counts.get(word_id, 0)
-                                if current_word_count < k:
-                                    self._extract_direct_file(main_tar, member, dest_word_dir)
-                                    word_counts[word_id] = current_word_count + 1
-                                    
-                                    # Just for progress update roughly
-                                    if current_word_count == 0:
-                                        count += 1
-                                        if count % 100 == 0:
-                                            pbar.set_description(f"Extracted {count} words")
-                            
-                            elif is_meta:
-                                self._extract_direct_file(main_tar, member, dest_word_dir)
-
-                print(f"\nFinished processing {count} word packages.")
-
-        except KeyboardInterrupt:
-            print("\nOperation cancelled by user.")
-            return
+            with closing(words):
+                for record in words:
+                    dest_word_dir = os.path.join(dest_dir, record.word_id)
+                    self._ensure_dir(dest_word_dir)
+                    for filename, problem in record.rejected:
+                        self._reject(dest_word_dir, filename, problem)
+                    for filename, data in record.images + record.meta_files:
+                        self._write_data(data, os.path.join(dest_word_dir, filename))
+                    count += 1
+                    if not is_dir and count % 100 == 0:
+                        pbar.set_description(f"Extracted {count} words")
         except Exception as e:
-            print(f"Error processing main tarball: {e}")
+            print(f"Error processing {'directory' if is_dir else 'main tarball'}: {e}")
+            return False
+        finally:
+            pbar.close()
+        if not is_dir:
+            print(f"\nFinished processing {count} word packages.")
+        return True
 
-    def _extract_direct_file(self, tar_obj, member, dest_path):
-        if not os.path.exists(dest_path):
-            os.makedirs(dest_path)
-            
-        f = tar_obj.extractfile(member)
-        if f:
-            out_filename = os.path.basename(member.name)
-            out_path = os.path.join(dest_path, out_filename)
-            with open(out_path, 'wb') as out_f:
-                shutil.copyfileobj(f, out_f)
+    def discard_archive(self, path):
+        """Deletes a downloaded package once it is extracted. The cache's own copy stays; its size budget cleans up."""
+        if self.cache and self.cache.owns(path):
+            return
+        print(f"Removing large package file: {path}")
+        os.remove(path)
 
-    def _copy_top_k_from_dir(self, src_path, dest_path, k):
-        if not os.path.exists(dest_path):
-            os.makedirs(dest_path)
-            
-        files = [f for f in os.listdir(src_path) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-        files.sort()
-        
-        to_copy = files[:k]
-        
-        for f in to_copy:
-            shutil.copy2(os.path.join(src_path, f), os.path.join(dest_path, f))
-            
-        for meta_file in ['word.txt', 'metadata.json', 'errors.json']:
-            if os.path.exists(os.path.join(src_path, meta_file)):
-                shutil.copy2(os.path.join(src_path, meta_file), os.path.join(dest_path, meta_file))
+    def _reject(self, dest_word_dir, filename, problem):
+        self.rejected.setdefault(os.path.basename(dest_word_dir), {})[filename] = problem
+        self.metrics.count('images_rejected')
 
-    def _extract_top_k_from_tar(self, tar_path, dest_path, k):
-        try:
-            with tarfile.open(tar_path, "r:gz") as tar:
-                self._extract_from_tar_object(tar, dest_path, k)
-        except Exception as e:
-            print(f"Error reading tar {tar_path}: {e}")
+    def _write_rejected_report(self, dest_dir):
+        """rejected_images.json in the package root, listing the images that were skipped and why."""
+        if not self.rejected:
+            return
+        total = sum(len(items) for items in self.rejected.values())
+        report = {word_id: self.rejected[word_id] for word_id in sorted(self.rejected, key=int)}
+        data = json.dumps(report, ensure_ascii=False, indent=2).encode('utf-8')
+        self._write_data(data, os.path.join(dest_dir, 'rejected_images.json'))
+        print(f"Skipped {total} bad images in {len(self.rejected)} words (replaced by lower-ranked ones where available); see rejected_images.json")
+
+    def _ensure_dir(self, path):
+        if self.writer:
+            self.writer.ensure_dir(path)
+        elif not os.path.exists(path):
+            os.makedirs(path)
+
+    def _write_data(self, data, out_path):
+        if self.writer:
+            # Hand off to the write-behind pool; the decompressor keeps going
+            self.writer.write(out_path, data)
+            return
+        self._ensure_dir(os.path.dirname(out_path))
+        with self.metrics.phase('write'):
+            with open(out_path, 'wb') as out_f:
+                out_f.write(data)
+        self.metrics.count('bytes_written', len(data))
+        self.metrics.count('files_written')
 
-    def _extract_from_tar_object(self, tar_obj, dest_path, k):
-        if not os.path.exists(dest_path):
-            os.makedirs(dest_path)
-            
-        members = tar_obj.getmembers()
-        images = [m for m in members if m.name.lower().endswith(('.png', '.jpg', '.jpeg'))]
-        images.sort(key=lambda x: x.name)
-        
-        to_extract = images[:k]
-        
-        meta_files = [m for m in members if os.path.basename(m.name) in ['word.txt', 'metadata.json', 'errors.json']]
-        
-        for member in to_extract + meta_files:
-            f = tar_obj.extractfile(member)
-            if f:
-                out_filename = os.path.basename(member.name)
-                out_path = os.path.join(dest_path, out_filename)
-                with open(out_path, 'wb') as out_f:
-                    shutil.copyfileobj(f, out_f)
-
-    def run(self):
+    def run(self, argv=None):
         parser = argparse.ArgumentParser(description="MMID Dataset Manager: Download and Extract")
         parser.add_argument('--list', action='store_true', help="List available languages")
         parser.add_argument('--lang', type=str, help="Language to process")
@@ -389,10 +366,51 @@ class MMIDManager:
         parser.add_argument('--extract', action='store_true', help="Extract images from package")
         parser.add_argument('--source', type=str, help="Source path for extraction (existing file or folder)")
         parser.add_argument('--limit', type=int, default=None, help="Number of images per word to keep (e.g. 3)")
+        parser.add_argument('--langs', type=str, default=None, help="Comma separated languages (names or de/ja/es codes) to download and extract in one pipelined run")
+        parser.add_argument('--all', action='store_true', help="Download and extract every language in downloads.md")
+        parser.add_argument('--scratch-gb', type=float, default=None, help="With --langs/--all: max GB of downloaded archives on disk at once")
         parser.add_argument('--dest', type=str, default='.', help="Destination folder for downloads/extraction")
         parser.add_argument('--keep_full', action='store_true', help="Keep the full downloaded package after extraction")
+        parser.add_argument('--select', type=str, default=None, help="Metadata-driven image selection policy, e.g. 'square:0.8,min:300,type:jpg,distinct-hosts'")
+        parser.add_argument('--writers', type=int, default=DEFAULT_WORKERS, help="Background threads writing extracted files (0 = write inline)")
+        parser.add_argument('--fsync', action='store_true', help="fsync all extracted files in one batch at the end")
+        parser.add_argument('--shard', type=str, default=None, help="Only handle word ids with crc32(id) %% N == i, e.g. 0/4; combine with shard_merge.py")
+        parser.add_argument('--pack', action='store_true', help="Write a single-file <dest>.pack with an offset index instead of a folder per word")
+        parser.add_argument('--no-validate', action='store_true', help="Copy the top k images without checking headers and end markers")
+        add_cache_arguments(parser)
+        parser.add_argument('--inner-workers', type=int, default=DEFAULT_INNER_WORKERS, help="Processes decompressing nested word archives of a package tarball (0 = inline)")
+        add_metrics_arguments(parser)
         
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
+        self.metrics = metrics_from_args('mmid_manager', args)
+        self.writer_workers = max(0, args.writers)
+        self.fsync = args.fsync
+        self.pack = args.pack
+        self.validate = not args.no_validate
+        self.inner_workers = max(0, args.inner_workers)
+        self.cache = cache_from_args(args)
+        try:
+            self._run(args, parser)
+        finally:
+            self.metrics.finish(args.profile, args.metrics, args.trace)
+
+    def _run(self, args, parser):
+        if args.shard:
+            try:
+                self.shard = parse_shard(args.shard)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return
+            if self.pack:
+                print("Error: --shard writes folders; pack the merged package with package_pack.py instead.")
+                return
+
+        if args.select:
+            try:
+                self.selection_policy = SelectionPolicy.from_spec(args.select)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return
         
         # 1. List Languages
         if args.list:
@@ -411,11 +429,33 @@ class MMIDManager:
                 limit = args.limit
                 
             dest_dir = args.dest if args.dest != '.' else f"{args.source}_extracted"
-            self.extract_top_k(args.source, dest_dir, limit)
-            print(f"Extraction complete to {dest_dir}")
+            if not self.extract_top_k(args.source, dest_dir, limit):
+                print(f"Error: extraction did not finish; {self.output_dir(dest_dir)} is incomplete.")
+                sys.exit(1)
+            print(f"Extraction complete to {self.output_dir(dest_dir)}")
             return
 
-        # 3. Download and/or Extract Language
+        # 3. Several languages: download N+1 while extracting N
+        if args.langs or args.all:
+            if not args.limit:
+                print("Error: --limit is required with --langs/--all.")
+                return
+            if not self.parse_downloads_md():
+                return
+            if args.all:
+                langs = sorted(self.data)
+            else:
+                langs, unknown = resolve_languages(args.langs, self.data)
+                if unknown:
+                    print(f"Language(s) not found: {', '.join(unknown)}")
+                    return
+            scratch = int(args.scratch_gb * 1e9) if args.scratch_gb else None
+            scheduler = BatchScheduler(self, args.dest, args.limit, args.keep_full, scratch,
+                                       pkg_type='mini' if args.limit == 1 else 'full')
+            scheduler.run(langs)
+            return
+
+        # 4. Download and/or Extract Language
         if args.lang:
             if not self.parse_downloads_md():
                 return
@@ -452,13 +492,14 @@ class MMIDManager:
                     extract_dest = os.path.join(args.dest, f"{pkg_name}-k{args.limit}")
                     
                     print(f"\nExtracting top {args.limit} images to {extract_dest}...")
-                    self.extract_top_k(downloaded_file, extract_dest, args.limit)
+                    if not self.extract_top_k(downloaded_file, extract_dest, args.limit):
+                        print(f"Error: extraction did not finish; keeping {downloaded_file}.")
+                        sys.exit(1)
                     
                     if not args.keep_full:
-                        print(f"Removing large package file: {downloaded_file}")
-                        os.remove(downloaded_file)
+                        self.discard_archive(downloaded_file)
                         
-                    print(f"\nDone! Your dataset is ready at: {extract_dest}")
+                    print(f"\nDone! Your dataset is ready at: {self.output_dir(extract_dest)}")
 
             elif args.extract:
                 # User asked to extract but didn't say download, assume file exists in dest?
@@ -466,10 +507,15 @@ class MMIDManager:
                 # Let's look for the file in dest.
                 filename = url.split('/')[-1]
                 possible_path = os.path.join(args.dest, filename)
+                if not os.path.exists(possible_path) and self.cache:
+                    # Downloaded earlier from another folder: no network needed
+                    possible_path = self.cache.lookup(url) or possible_path
                 if os.path.exists(possible_path):
                      pkg_name = filename.replace('.tgz', '').replace('.tar.gz', '')
                      extract_dest = os.path.join(args.dest, f"{pkg_name}-k{args.limit if args.limit else 'all'}")
-                     self.extract_top_k(possible_path, extract_dest, args.limit if args.limit else 10000)
+                     if not self.extract_top_k(possible_path, extract_dest, args.limit if args.limit else 10000):
+                         print(f"Error: extraction did not finish; {self.output_dir(extract_dest)} is incomplete.")
+                         sys.exit(1)
                 else:
                     print(f"File {filename} not found in {args.dest}. Use --download to fetch it.")
             
@@ -482,5 +528,12 @@ class MMIDManager:
         else:
             parser.print_help()
 
+def main(argv=None):
+    try:
+        MMIDManager().run(argv)
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user.")
+        sys.exit(130)
+
 if __name__ == "__main__":
-    MMIDManager().run()
+    main()
@@ -0,0 +1,115 @@
+'''
+Write-behind output stage for extraction.
+
+The extract loop decompresses a member and hands the bytes to OutputWriter.write(),
+which only blocks when too many writes are already pending. A small thread pool
+does the open/write/close, word directories are created once and remembered, and
+fsync (optional) is done for all files in one batch when the writer is closed.
+
+    with OutputWriter(workers=4, fsync=True) as writer:
+        writer.write('out/1234/01.jpg', data)
+'''
+
+import os
+import threading
+
+from build_metrics import BuildMetrics
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 256 # ~256 x 50KB images held in memory at most
+
+
+class OutputWriter:
+    def __init__(self, workers=DEFAULT_WORKERS, max_pending=DEFAULT_MAX_PENDING, fsync=False, metrics=None):
+        self.workers = workers
+        self.fsync = fsync
+        self.metrics = metrics or BuildMetrics('output_writer', enabled=False)
+
+        self.created_dirs = set() # only kept for fsync; words arrive one after another otherwise
+        self.last_dir = None
+        self.written_paths = []
+        self.errors = []
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(max(1, max_pending))
+        # concurrent.futures costs ~10ms to import; mmid_manager --list never gets here
+        from concurrent.futures import ThreadPoolExecutor
+        # workers=0 writes synchronously on the calling thread
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='writer') if workers > 0 else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def ensure_dir(self, path):
+        """os.makedirs, but not again for the directory it just created (or any it created, with fsync)."""
+        if path == self.last_dir or path in self.created_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        with self.lock:
+            self.last_dir = path
+            if self.fsync:
+                self.created_dirs.add(path)
+
+    def write(self, out_path, data):
+        self.ensure_dir(os.path.dirname(out_path) or '.')
+        if self.executor is None:
+            self._write_file(out_path, data)
+            return
+
+        # Blocks only when max_pending writes are queued (bounded memory)
+        if not self.slots.acquire(blocking=False):
+            with self.metrics.phase('backpressure'):
+                self.slots.acquire()
+        future = self.executor.submit(self._write_file, out_path, data)
+        future.add_done_callback(lambda _: self.slots.release())
+
+    def _write_file(self, out_path, data):
+        try:
+            with self.metrics.phase('write'):
+                with open(out_path, 'wb') as out_f:
+                    out_f.write(data)
+        except OSError as e:
+            with self.lock:
+                self.errors.append((out_path, e))
+            return
+        self.metrics.count('bytes_written', len(data))
+        self.metrics.count('files_written')
+        if self.fsync:
+            with self.lock:
+                self.written_paths.append(out_path)
+
+    def _fsync_all(self):
+        with self.metrics.phase('fsync'):
+            for path in self.written_paths:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            # Directory entries too, so the new files survive a crash
+            for path in self.created_dirs:
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except OSError:
+                    continue
+                try:
+                    os.fsync(fd)
+                except OSError:
+                    pass # Not supported for directories on every platform
+                finally:
+                    os.close(fd)
+        self.written_paths = []
+
+    def close(self):
+        """Waits for pending writes, then fsyncs them if requested. Prints any write errors."""
+        if self.executor is not None:
+            with self.metrics.phase('drain'):
+                self.executor.shutdown(wait=True)
+            self.executor = None
+        if self.fsync:
+            self._fsync_all()
+        for path, e in self.errors:
+            print(f"Error writing {path}: {e}")
+        return not self.errors
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+'''
+Single-file packed package format.
+
+A package directory (word_id/01.jpg, word_id/word.txt, ...) becomes two files:
+    <name>.pack        all file contents concatenated
+    <name>.pack.json   {"version": 1, "files": {word_id: [[name, offset, length], ...]}}
+
+Files at the package root (index.csv, words.json) are stored under the "." key.
+PackReader maps the data file with mmap, so reading an image is a slice of the
+mapping rather than an open/read/close per file. The slice is copied out as
+bytes, so nothing a caller keeps holds the mapping open after close().
+
+python3 scripts/mmid_master/package_pack.py pack mini-german-package-k3
+python3 scripts/mmid_master/package_pack.py ls mini-german-package-k3.pack
+python3 scripts/mmid_master/package_pack.py unpack mini-german-package-k3.pack mini-german-package-k3
+'''
+
+import os
+import sys
+import mmap
+import json
+import argparse
+import threading
+
+PACK_VERSION = 1
+ROOT_KEY = '.'
+
+
+def index_path_for(pack_path):
+    return pack_path + '.json'
+
+
+class PackWriter:
+    """
+    Appends files to a .pack and writes the index on close.
+    Has the write()/ensure_dir()/close() interface of OutputWriter, so the
+    extract loop can write into a pack instead of a directory tree.
+    """
+
+    def __init__(self, pack_path, root):
+        self.pack_path = pack_path
+        self.root = root
+        self.files = {}
+        self.offset = 0
+        self.lock = threading.Lock()
+        self.temp_path = pack_path + '.tmp'
+        self.data_f = open(self.temp_path, 'wb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def ensure_dir(self, path):
+        pass # Nothing to create, directories only exist in the index
+
+    def write(self, out_path, data):
+        rel = os.path.relpath(out_path, self.root)
+        word_id, name = os.path.split(rel)
+        self.add(word_id or ROOT_KEY, name, data)
+
+    def add(self, word_id, name, data):
+        with self.lock:
+            self.data_f.write(data)
+            entries = self.files.setdefault(word_id, [])
+            # A rewritten file replaces the earlier entry; its old bytes stay as dead space
+            entries[:] = [e for e in entries if e[0] != name]
+            entries.append([name, self.offset, len(data)])
+            self.offset += len(data)
+
+    def close(self):
+        if self.data_f is None:
+            return True
+        self.data_f.close()
+        self.data_f = None
+        os.replace(self.temp_path, self.pack_path)
+
+        files = {word_id: sorted(entries) for word_id, entries in self.files.items()}
+        index = {'version': PACK_VERSION, 'data': os.path.basename(self.pack_path), 'size': self.offset, 'files': files}
+        index_path = index_path_for(self.pack_path)
+        with open(index_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(index_path + '.tmp', index_path)
+        return True
+
+
+class PackReader:
+    def __init__(self, pack_path):
+        self.pack_path = pack_path
+        with open(index_path_for(pack_path), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') != PACK_VERSION:
+            raise ValueError(f"Unsupported pack version: {index.get('version')}")
+        self.files = {word_id: {name: (offset, length) for name, offset, length in entries}
+                      for word_id, entries in index['files'].items()}
+
+        self.data_f = open(pack_path, 'rb')
+        # mmap can't map an empty file
+        self.data = mmap.mmap(self.data_f.fileno(), 0, access=mmap.ACCESS_READ) if index['size'] else b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data_f.close()
+
+    def words(self):
+        return sorted((w for w in self.files if w != ROOT_KEY), key=lambda w: int(w) if w.isdigit() else w)
+
+    def names(self, word_id):
+        return sorted(self.files.get(word_id, {}))
+
+    def images(self, word_id):
+        return [n for n in self.names(word_id) if n.lower().endswith(('.png', '.jpg', '.jpeg'))]
+
+    def read(self, word_id, name):
+        """Returns the file's bytes, or None if it isn't in the pack."""
+        entry = self.files.get(word_id, {}).get(name)
+        if entry is None:
+            return None
+        offset, length = entry
+        return self.data[offset:offset + length]
+
+    def word_text(self, word_id):
+        data = self.read(word_id, 'word.txt')
+        return data.decode('utf-8').strip() if data is not None else None
+
+    def unpack(self, dest_dir):
+        count = 0
+        for word_id, entries in self.files.items():
+            word_dir = dest_dir if word_id == ROOT_KEY else os.path.join(dest_dir, word_id)
+            os.makedirs(word_dir, exist_ok=True)
+            for name in entries:
+                with open(os.path.join(word_dir, name), 'wb') as out_f:
+                    out_f.write(self.read(word_id, name))
+                count += 1
+        return count
+
+
+def pack_directory(package_dir, pack_path=None):
+    """Packs an extracted package directory. Returns (pack path, number of files)."""
+    pack_path = pack_path or package_dir.rstrip('/\\') + '.pack'
+    count = 0
+    with PackWriter(pack_path, package_dir) as writer:
+        for entry in sorted(os.scandir(package_dir), key=lambda e: e.name):
+            if entry.is_dir():
+                for file in sorted(os.scandir(entry.path), key=lambda e: e.name):
+                    if file.is_file():
+                        with open(file.path, 'rb') as f:
+                            writer.add(entry.name, file.name, f.read())
+                        count += 1
+            elif entry.is_file():
+                with open(entry.path, 'rb') as f:
+                    writer.add(ROOT_KEY, entry.name, f.read())
+                count += 1
+    return pack_path, count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack, list or unpack single-file MMID packages.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('pack', help="Pack an extracted package directory")
+    p.add_argument('package_dir')
+    p.add_argument('--output', type=str, default=None, help="Pack path (default: <package_dir>.pack)")
+
+    p = sub.add_parser('unpack', help="Unpack a .pack into a directory tree")
+    p.add_argument('pack_path')
+    p.add_argument('dest_dir')
+
+    p = sub.add_parser('ls', help="Summarize a .pack")
+    p.add_argument('pack_path')
+    p.add_argument('--word', type=str, default=None, help="List the files of one word id")
+
+    args = parser.parse_args()
+
+    if args.command == 'pack':
+        if not os.path.isdir(args.package_dir):
+            print(f"Error: Not a directory: {args.package_dir}")
+            sys.exit(1)
+        pack_path, count = pack_directory(args.package_dir, args.output)
+        print(f"Packed {count} files into {pack_path} ({os.path.getsize(pack_path) // 1024} KB)")
+
+    elif args.command == 'unpack':
+        with PackReader(args.pack_path) as reader:
+            count = reader.unpack(args.dest_dir)
+        print(f"Unpacked {count} files to {args.dest_dir}")
+
+    else:
+        with PackReader(args.pack_path) as reader:
+            if args.word:
+                for name in reader.names(args.word):
+                    print(f"  {name:<16} {len(reader.read(args.word, name))} bytes")
+            else:
+                words = reader.words()
+                images = sum(len(reader.images(w)) for w in words)
+                print(f"{args.pack_path}: {len(words)} words, {images} images, {os.path.getsize(args.pack_path) // 1024} KB")
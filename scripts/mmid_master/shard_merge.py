@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+
+'''
+Sharded extraction support.
+
+mmid_manager --shard i/N only handles word ids with crc32(id) % N == i and
+writes them to <dest>.shard-i-of-N/, together with a partial index.csv and
+shard_manifest.json. Shards can run as separate processes or on separate hosts
+(each with its own decompression stream); once all are done, merge moves the
+word folders into <dest>/, writes the combined index.csv and updates
+package_manifest.js. The manifest update holds a lock file, so merges of
+different packages into the same manifest don't overwrite each other.
+Nothing is moved unless every shard 0..N-1 is there and finished (has its
+shard_manifest.json).
+
+python3 scripts/mmid_master/mmid_manager.py --extract --source scale-german-package.tgz --limit 3 --dest out/k3 --shard 0/4
+python3 scripts/mmid_master/shard_merge.py out/k3 --manifest package_manifest.js
+'''
+
+import os
+import re
+import csv
+import sys
+import glob
+import json
+import time
+import shutil
+import zlib
+import filecmp
+import argparse
+
+SHARD_MANIFEST = 'shard_manifest.json'
+REJECTED_REPORT = 'rejected_images.json'
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+
+def parse_shard(spec):
+    """'2/8' -> (2, 8). Raises ValueError for anything else."""
+    match = re.fullmatch(r'\s*(\d+)\s*/\s*(\d+)\s*', spec or '')
+    if not match:
+        raise ValueError(f"Invalid shard '{spec}', expected i/N, e.g. 0/4")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or index >= count:
+        raise ValueError(f"Invalid shard '{spec}': need 0 <= i < N")
+    return index, count
+
+
+def in_shard(word_id, shard):
+    # crc32 rather than hash(): str hashes are randomized per process
+    index, count = shard
+    return zlib.crc32(word_id.encode('utf-8')) % count == index
+
+
+def shard_dir(dest_dir, shard):
+    return f"{dest_dir.rstrip('/')}.shard-{shard[0]}-of-{shard[1]}"
+
+
+def _word_entries(package_dir):
+    """[(word_id, word or None, [images])] for the numbered folders of package_dir."""
+    entries = []
+    for entry in os.scandir(package_dir):
+        if not (entry.is_dir() and entry.name.isdigit()):
+            continue
+        images = sorted(f.name for f in os.scandir(entry.path) if f.is_file() and f.name.lower().endswith(IMAGE_EXTENSIONS))
+        word = None
+        word_txt = os.path.join(entry.path, 'word.txt')
+        if os.path.exists(word_txt):
+            with open(word_txt, 'r', encoding='utf-8') as f:
+                word = f.read().strip() or None
+        entries.append((entry.name, word, images))
+    entries.sort(key=lambda e: int(e[0]))
+    return entries
+
+
+def _write_index(path, entries):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['id', 'word'])
+        writer.writeheader()
+        for word_id, word, _ in entries:
+            if word:
+                writer.writerow({'id': word_id, 'word': word})
+
+
+def write_shard_outputs(output_dir, shard):
+    """Partial index.csv + shard_manifest.json for one finished shard."""
+    entries = _word_entries(output_dir)
+    _write_index(os.path.join(output_dir, 'index.csv'), entries)
+    with open(os.path.join(output_dir, SHARD_MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump({'shard': list(shard), 'words': {w: images for w, _, images in entries if images}}, f, indent=2)
+    return len(entries)
+
+
+class FileLock:
+    """Lock file created with O_EXCL; works on local disks and most network shares."""
+
+    def __init__(self, path, timeout=300, stale_after=3600):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, f"{os.getpid()}\n".encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        os.remove(self.path) # Left behind by a crashed merge
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {self.path}")
+                time.sleep(0.2)
+
+    def __exit__(self, exc_type, exc, tb):
+        os.remove(self.path)
+
+
+def _parse_manifest_js(text):
+    """{'PACKAGE_MANIFEST': ..., 'AUDIO_MANIFEST': ..., ...} in file order."""
+    decoder = json.JSONDecoder()
+    sections = {}
+    for match in re.finditer(r'const\s+(\w+)\s*=\s*', text):
+        value, _ = decoder.raw_decode(text, match.end())
+        sections[match.group(1)] = value
+    return sections
+
+
+def update_package_manifest(manifest_path, package_name, words):
+    """
+    Replaces PACKAGE_MANIFEST[package_name], keeping every other section as it was. The package's
+    placeholders and versions describe the old images, so they are dropped until
+    generate_package_manifest.py recomputes them.
+    """
+    with FileLock(manifest_path + '.lock'):
+        sections = {'PACKAGE_MANIFEST': {}}
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                sections = _parse_manifest_js(f.read()) or sections
+        sections.setdefault('PACKAGE_MANIFEST', {})[package_name] = words
+        stale = [name for name in ('PACKAGE_PLACEHOLDERS', 'PACKAGE_VERSIONS') if package_name in sections.get(name, {})]
+        for name in stale:
+            del sections[name][package_name]
+        if stale:
+            print(f"Dropped {package_name} from {', '.join(stale)}; run generate_package_manifest.py to recompute them.")
+
+        # Same layout generate_package_manifest.py writes
+        temp_path = manifest_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            f.write(";\n\n".join(f"const {name} = {json.dumps(value, indent=2)}" for name, value in sections.items()))
+            f.write(";")
+        os.replace(temp_path, manifest_path)
+
+
+def _load_report(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not read {path} ({e})")
+        return {}
+
+
+def _merge_rejected_report(path, moved_ids, rejected):
+    """
+    Combines the shards' rejected_images.json into the package's. Entries of an
+    existing report are kept except for the words that were just replaced.
+    """
+    report = _load_report(path) if os.path.exists(path) else {}
+    for word_id in moved_ids:
+        report.pop(word_id, None)
+    report.update(rejected)
+    if not report:
+        return
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({w: report[w] for w in sorted(report, key=int)}, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+
+
+def _check_shard_set(shard_dirs):
+    """Reasons not to merge: mixed N, missing shards, or shards without shard_manifest.json (unfinished)."""
+    found = {}
+    for directory in shard_dirs:
+        match = re.search(r'\.shard-(\d+)-of-(\d+)$', directory.rstrip('/'))
+        if not match:
+            return [f"{directory} is not a shard folder (<dest>.shard-i-of-N)"]
+        found[int(match.group(1)), int(match.group(2))] = directory
+
+    counts = {count for _, count in found}
+    if len(counts) != 1:
+        return [f"shard folders disagree on N ({', '.join(str(n) for n in sorted(counts))}): {sorted(found.values())}"]
+    count = counts.pop()
+    problems = [f"shard {i}/{count} is missing" for i in range(count) if (i, count) not in found]
+    problems += [f"{directory} has no {SHARD_MANIFEST} (not finished)"
+                 for _, directory in sorted(found.items()) if not os.path.exists(os.path.join(directory, SHARD_MANIFEST))]
+    return problems
+
+
+def merge_shards(dest_dir, manifest_path=None, shard_dirs=None):
+    """Moves all <dest_dir>.shard-*-of-N folders into dest_dir and writes the combined outputs."""
+    shard_dirs = shard_dirs or sorted(glob.glob(glob.escape(dest_dir.rstrip('/')) + '.shard-*-of-*'))
+    if not shard_dirs:
+        print(f"No shards found for {dest_dir}")
+        return None
+
+    problems = _check_shard_set(shard_dirs)
+    if problems:
+        print(f"Error: not merging {dest_dir}, the shard set is incomplete:")
+        for problem in problems:
+            print(f"  {problem}")
+        return None
+
+    os.makedirs(dest_dir, exist_ok=True)
+    moved = []
+    rejected = {}
+    for directory in shard_dirs:
+        for entry in os.scandir(directory):
+            target = os.path.join(dest_dir, entry.name)
+            if entry.is_dir() and entry.name.isdigit():
+                if os.path.exists(target):
+                    shutil.rmtree(target)
+                shutil.move(entry.path, target)
+                moved.append(entry.name)
+            elif entry.name == REJECTED_REPORT:
+                # Per-word report covering only this shard's words
+                rejected.update(_load_report(entry.path))
+            elif entry.name in ('index.csv', SHARD_MANIFEST):
+                continue # rebuilt below
+            elif not os.path.exists(target):
+                shutil.move(entry.path, target)
+            elif not filecmp.cmp(entry.path, target, shallow=False):
+                # Files every shard writes the same way (words.json, the dictionary) are skipped above
+                print(f"Warning: {entry.name} in {directory} differs from {target}; keeping {target}")
+        shutil.rmtree(directory)
+
+    _merge_rejected_report(os.path.join(dest_dir, REJECTED_REPORT), moved, rejected)
+    entries = _word_entries(dest_dir)
+    _write_index(os.path.join(dest_dir, 'index.csv'), entries)
+    if manifest_path:
+        package_name = os.path.basename(os.path.normpath(dest_dir))
+        update_package_manifest(manifest_path, package_name, {w: images for w, _, images in entries if images})
+    print(f"Merged {len(shard_dirs)} shards ({len(moved)} words) into {dest_dir}")
+    return len(entries)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge sharded extraction outputs into one package.")
+    parser.add_argument('dest', help="Package folder the shards were extracted for (the --dest given to the shards)")
+    parser.add_argument('--manifest', type=str, default=None, help="package_manifest.js to update with this package")
+    args = parser.parse_args()
+
+    if merge_shards(args.dest, args.manifest) is None:
+        sys.exit(1)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+'''
+Bounded-memory iteration over streamed tar archives.
+
+tarfile appends every TarInfo it reads to TarFile.members, in 'r|gz' stream
+mode too, so a pass over a multi-million-member package keeps every header
+alive until the end. iter_members() yields the same members but drops that
+list after each one has been handled, so memory stays flat however big the
+archive is.
+
+The memory check builds a synthetic archive and compares peak RSS of a plain
+iter(tar) pass, an iter_members() pass and a real MMIDManager extraction, plus
+an extraction of an archive with only 3 files per word ("words"), where any
+per-word state would grow with the number of words:
+
+python3 scripts/mmid_master/tar_stream.py --check-memory --members 1000000
+'''
+
+import os
+import io
+import sys
+import json
+import time
+import tarfile
+import argparse
+import resource
+import tempfile
+import subprocess
+
+
+def iter_members(tar):
+    """
+    Yields the members of a tar opened in stream mode, forgetting each header
+    once the caller asks for the next one. Only for one sequential pass: the
+    TarFile can't list or look up earlier members afterwards.
+    """
+    while True:
+        member = tar.next()
+        if member is None:
+            return
+        yield member
+        # Rebinding (rather than clearing) leaves any list the caller holds intact
+        tar.members = []
+
+
+def extract_streaming(tar_path, dest_dir):
+    """Stream-mode replacement for extractall() that doesn't accumulate headers."""
+    count = skipped = 0
+    with tarfile.open(tar_path, "r|gz") as tar:
+        for member in iter_members(tar):
+            # Earlier headers are gone, so a hard link can't find its target; packages
+            # only hold folders and regular files anyway
+            if not (member.isfile() or member.isdir()):
+                skipped += 1
+                continue
+            tar.extract(member, path=dest_dir)
+            count += 1
+    if skipped:
+        print(f"Skipped {skipped} links or special files in {tar_path}")
+    return count
+
+
+# --- Memory check ---
+
+def build_synthetic_archive(path, members, per_word=1000):
+    """Flat package layout (root/word_id/NN.jpg), tiny files, fast compression."""
+    # SOI, a 16x16 frame header and EOI: passes image_check, so nothing lands in the rejected report
+    payload = b'\xff\xd8\xff\xc0\x00\x11\x08\x00\x10\x00\x10\x03\x01\x11\x00\x02\x11\x01\x03\x11\x01\xff\xd9'
+    with tarfile.open(path, 'w:gz', compresslevel=1) as tar:
+        for i in range(members):
+            word_id, n = divmod(i, per_word)
+            info = tarfile.TarInfo(f"synthetic-package/{word_id + 1}/{n:04d}.jpg")
+            info.size = len(payload)
+            tar.addfile(info, io.BytesIO(payload))
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_mode(mode, archive, workdir):
+    """Runs in a child process so each mode gets its own peak RSS."""
+    from mmid_manager import MMIDManager # imported up front so its modules count towards the baseline
+    baseline = _peak_rss_mb()
+    started = time.perf_counter()
+    count = 0
+    if mode in ('manager', 'words'):
+        MMIDManager().extract_top_k(archive, os.path.join(workdir, f'out-{mode}'), 1)
+    else:
+        with tarfile.open(archive, 'r|gz') as tar:
+            members = iter(tar) if mode == 'plain' else iter_members(tar)
+            for member in members:
+                count += 1
+    print(json.dumps({'mode': mode, 'members': count, 'seconds': round(time.perf_counter() - started, 1),
+                      'baseline_mb': round(baseline, 1), 'peak_mb': round(_peak_rss_mb(), 1)}))
+
+
+def check_memory(members, limit_mb, modes):
+    with tempfile.TemporaryDirectory() as workdir:
+        archive = os.path.join(workdir, 'synthetic-package.tgz')
+        print(f"Building synthetic archive with {members} members...")
+        build_synthetic_archive(archive, members)
+        words_archive = os.path.join(workdir, 'synthetic-words-package.tgz')
+        if 'words' in modes:
+            print(f"Building synthetic archive with {members} members, 3 per word...")
+            build_synthetic_archive(words_archive, members, per_word=3)
+
+        results = {}
+        for mode in modes:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--run-mode', mode,
+                 words_archive if mode == 'words' else archive, workdir],
+                check=True, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            results[mode] = result
+            growth = result['peak_mb'] - result['baseline_mb']
+            print(f"  {mode:<8} peak {result['peak_mb']:7.1f} MB (+{growth:.1f} MB over startup) in {result['seconds']}s")
+
+    failed = [m for m in modes if m != 'plain' and results[m]['peak_mb'] - results[m]['baseline_mb'] > limit_mb]
+    if failed:
+        print(f"FAIL: {', '.join(failed)} grew more than {limit_mb} MB")
+        return False
+    print(f"OK: streaming modes stayed within +{limit_mb} MB")
+    return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == '--run-mode':
+        _run_mode(sys.argv[2], sys.argv[3], sys.argv[4])
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Bounded-memory tar streaming and its peak-RSS check.")
+    parser.add_argument('--check-memory', action='store_true', help="Build a synthetic archive and compare peak RSS")
+    parser.add_argument('--members', type=int, default=1000000, help="Members in the synthetic archive")
+    parser.add_argument('--limit-mb', type=float, default=32.0, help="Allowed RSS growth for the streaming modes")
+    parser.add_argument('--modes', type=str, default='plain,iterator,manager,words', help="Comma separated: plain, iterator, manager, words (3 files per word)")
+    args = parser.parse_args()
+
+    if not args.check_memory:
+        parser.print_help()
+        sys.exit(0)
+    sys.exit(0 if check_memory(args.members, args.limit_mb, args.modes.split(',')) else 1)
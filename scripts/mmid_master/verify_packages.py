@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+
+'''
+Integrity checks for downloaded archives and built packages.
+
+Archives: download_file records each archive's size and a chunked SHA-256 in
+archive_records.json next to it. The chunks are hashed in parallel, so
+verifying a multi-GB .tgz is bounded by disk speed, not by one core.
+
+Packages: every word in index.csv and every image listed in PACKAGE_MANIFEST
+must exist and pass image_check.check_image() (magic bytes, dimensions in the
+header, end marker). Files are read in parallel. A stat cache (.verify_cache.json in the
+package) means only files whose mtime/size changed are re-read and re-hashed.
+
+python3 scripts/mmid_master/verify_packages.py archive scale-german-package.tgz
+python3 scripts/mmid_master/verify_packages.py package mini-german-package-k3
+python3 scripts/mmid_master/verify_packages.py package mini-german-package-k3 --manifest package_manifest.js --full
+'''
+
+import os
+import csv
+import sys
+import json
+import hashlib
+import argparse
+
+from image_check import check_image
+
+RECORDS_FILENAME = 'archive_records.json'
+CACHE_FILENAME = '.verify_cache.json'
+CHUNK_SIZE = 64 * 1024 * 1024
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif')
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+
+# --- Archives ---
+
+def _hash_chunk(path, offset, length):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        remaining = length
+        while remaining:
+            data = f.read(min(remaining, 1 << 20))
+            if not data:
+                break
+            digest.update(data)
+            remaining -= len(data)
+    return digest.digest()
+
+
+def chunked_sha256(path, workers=DEFAULT_WORKERS):
+    """SHA-256 over the SHA-256s of consecutive 64MB chunks; the chunks hash in parallel."""
+    from concurrent.futures import ThreadPoolExecutor # Imported on use: mmid_manager imports this module at startup
+    size = os.path.getsize(path)
+    offsets = range(0, max(size, 1), CHUNK_SIZE)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = list(executor.map(lambda o: _hash_chunk(path, o, CHUNK_SIZE), offsets))
+    return hashlib.sha256(b''.join(digests)).hexdigest()
+
+
+def _load_records(folder):
+    path = os.path.join(folder, RECORDS_FILENAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_archive_record(archive_path):
+    return _load_records(os.path.dirname(archive_path) or '.').get(os.path.basename(archive_path))
+
+
+def record_archive(archive_path, url=None):
+    """Stores size + chunked hash of a freshly downloaded archive. Returns the record."""
+    record = {
+        'size': os.path.getsize(archive_path),
+        'sha256_chunked': chunked_sha256(archive_path),
+        'url': url,
+    }
+    store_archive_record(archive_path, record)
+    return record
+
+
+def store_archive_record(archive_path, record):
+    """Writes record for archive_path into the archive_records.json next to it."""
+    folder = os.path.dirname(archive_path) or '.'
+    records = _load_records(folder)
+    records[os.path.basename(archive_path)] = record
+    path = os.path.join(folder, RECORDS_FILENAME)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+def verify_archive(archive_path, workers=DEFAULT_WORKERS):
+    """Returns (ok, message)."""
+    if not os.path.exists(archive_path):
+        return False, "missing"
+    record = load_archive_record(archive_path)
+    size = os.path.getsize(archive_path)
+    if not record:
+        return False, f"no record in {RECORDS_FILENAME} (size {size})"
+    if size != record['size']:
+        return False, f"size {size}, recorded {record['size']}"
+    if chunked_sha256(archive_path, workers) != record['sha256_chunked']:
+        return False, "hash mismatch"
+    return True, f"ok ({size // (1024 * 1024)} MB)"
+
+
+# --- Packages ---
+
+def load_package_manifest(manifest_path):
+    """PACKAGE_MANIFEST from package_manifest.js, or {} if the file isn't there."""
+    if not manifest_path or not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    start = text.index('{', text.index('PACKAGE_MANIFEST'))
+    manifest, _ = json.JSONDecoder().raw_decode(text[start:])
+    return manifest
+
+
+def _read_index_ids(package_dir):
+    path = os.path.join(package_dir, 'index.csv')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return {row['id'].strip() for row in csv.DictReader(f) if row.get('id')}
+
+
+def _check_file(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    problem, _ = check_image(data)
+    return hashlib.sha256(data).hexdigest(), problem
+
+
+def verify_package(package_dir, manifest_path=None, full=False, workers=DEFAULT_WORKERS):
+    """
+    Returns a report: {'words': n, 'checked': files re-read, 'cached': files trusted from the
+    stat cache, 'missing': [...], 'extra': [...], 'bad': ['id/name (problem)', ...], 'missing_words': [...]}.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    package_name = os.path.basename(os.path.normpath(package_dir))
+    expected = load_package_manifest(manifest_path).get(package_name)
+    index_ids = _read_index_ids(package_dir)
+
+    cache_path = os.path.join(package_dir, CACHE_FILENAME)
+    cache = {}
+    if not full and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+
+    report = {'words': 0, 'checked': 0, 'cached': 0, 'missing': [], 'extra': [], 'bad': [], 'missing_words': []}
+    on_disk = {}
+    for entry in os.scandir(package_dir):
+        if entry.is_dir() and entry.name.isdigit():
+            on_disk[entry.name] = {f.name: f for f in os.scandir(entry.path) if f.is_file()}
+    report['words'] = len(on_disk)
+
+    if index_ids is not None:
+        report['missing_words'] = sorted(index_ids - set(on_disk), key=int)
+
+    to_check = []
+    new_cache = {}
+    for word_id, files in sorted(on_disk.items(), key=lambda kv: int(kv[0])):
+        images = {name for name in files if name.lower().endswith(IMAGE_EXTENSIONS)}
+        if expected is not None:
+            listed = set(expected.get(word_id, []))
+            report['missing'] += [f"{word_id}/{name}" for name in sorted(listed - images)]
+            report['extra'] += [f"{word_id}/{name}" for name in sorted(images - listed)]
+        for name in sorted(images):
+            rel = f"{word_id}/{name}"
+            stat = files[name].stat()
+            cached = cache.get(rel)
+            # Entries written before problems were stored hold a bool instead; re-read those
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size and not isinstance(cached[3], bool):
+                new_cache[rel] = cached
+                report['cached'] += 1
+                if cached[3]:
+                    report['bad'].append(f"{rel} ({cached[3]})")
+            else:
+                to_check.append((rel, files[name].path, stat))
+
+    if expected is not None:
+        report['missing_words'] += sorted(set(expected) - set(on_disk) - set(report['missing_words']), key=int)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda item: _check_file(item[1]), to_check)
+        for (rel, path, stat), (digest, problem) in zip(to_check, results):
+            new_cache[rel] = [stat.st_mtime_ns, stat.st_size, digest, problem]
+            report['checked'] += 1
+            if problem:
+                report['bad'].append(f"{rel} ({problem})")
+    report['bad'].sort(key=lambda rel: (int(rel.split('/')[0]), rel))
+
+    try:
+        with open(cache_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(new_cache, f, separators=(',', ':'))
+        os.replace(cache_path + '.tmp', cache_path)
+    except OSError as e:
+        print(f"Warning: could not write {cache_path}: {e}")
+    return report
+
+
+def print_package_report(package_dir, report, limit=20):
+    print(f"{package_dir}: {report['words']} words, {report['checked']} files read, {report['cached']} unchanged (stat cache)")
+    for key in ('missing_words', 'missing', 'extra', 'bad'):
+        items = report[key]
+        if items:
+            shown = ', '.join(items[:limit]) + (f", ... (+{len(items) - limit})" if len(items) > limit else '')
+            print(f"  {key.replace('_', ' ')}: {len(items)}: {shown}")
+    problems = sum(len(report[k]) for k in ('missing_words', 'missing', 'extra', 'bad'))
+    print("  OK" if not problems else f"  {problems} problem(s)")
+    return problems == 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify downloaded archives and built packages.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('archive', help="Check archives against archive_records.json")
+    p.add_argument('archives', nargs='+')
+    p.add_argument('--record', action='store_true', help="(Re)record the archives as they are now")
+    p.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="Parallel chunk hashers")
+
+    p = sub.add_parser('package', help="Check package folders against index.csv and PACKAGE_MANIFEST")
+    p.add_argument('packages', nargs='+')
+    p.add_argument('--manifest', type=str, default='package_manifest.js', help="package_manifest.js to compare against")
+    p.add_argument('--full', action='store_true', help="Ignore the stat cache and re-read every file")
+    p.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="Parallel file readers")
+
+    args = parser.parse_args()
+
+    all_ok = True
+    if args.command == 'archive':
+        for archive in args.archives:
+            if args.record:
+                record = record_archive(archive)
+                print(f"{archive}: recorded {record['size']} bytes")
+                continue
+            ok, message = verify_archive(archive, args.workers)
+            all_ok &= ok
+            print(f"{archive}: {message}")
+    else:
+        for package in args.packages:
+            report = verify_package(package, args.manifest, args.full, args.workers)
+            all_ok &= print_package_report(package, report)
+
+    sys.exit(0 if all_ok else 1)
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+
+'''
+Word records from any MMID package source, in memory.
+
+iter_words(source, k) yields one WordRecord per word, which unpacks as
+(word_id, word, metadata, [(filename, bytes)]) with the top k images. The
+source can be any of:
+
+- a directory of word folders (1234/01.jpg ...) or word archives (1234.tar.gz)
+- a package tarball of nested word archives (scale-spanish-package/1234.tar.gz)
+- a flat package tarball (scale-japanese-package/1234/01.jpg)
+- an http(s) URL of either tarball, read as a stream without saving it
+
+Nothing is written to disk, so hashing, re-encoding, validation or catalog
+steps can consume the records directly. mmid_manager.py --extract is one such
+consumer: it writes each record to a folder or a .pack.
+
+    for word_id, word, metadata, images in iter_words('scale-german-package.tgz', 3):
+        ...
+
+python3 scripts/mmid_master/word_source.py scale-german-package.tgz --limit 3 --words 5
+'''
+
+import os
+import io
+import json
+import time
+import tarfile
+import argparse
+from collections import namedtuple
+
+from build_metrics import BuildMetrics, TimedReader
+from image_check import check_image, check_image_file, pick_valid
+from image_selection import load_image_metadata
+from inner_pool import InnerTarPool, pick_from_tar, IMAGE_EXTENSIONS, META_FILES
+from shard_merge import in_shard
+from tar_stream import iter_members
+
+VALIDATE_THREADS = 8 # header reads for directory sources
+
+
+class WordRecord(namedtuple('WordRecord', 'word_id word metadata images')):
+    """
+    One word of a package. Unpacks as (word_id, word, metadata, images):
+      word      text of word.txt, None if the word has none
+      metadata  metadata.json as a dict ({} if missing; None with parse_metadata=False)
+      images    [(filename, bytes)] of the chosen images, best first
+    Writers also get .meta_files, the word's word.txt / metadata.json / errors.json as
+    [(filename, bytes)], and .rejected, [(filename, problem)] for images that failed validation.
+    """
+    meta_files = ()
+    rejected = ()
+
+
+def _record(word_id, files, rejected, parse_metadata):
+    images = [(name, data) for name, data in files if name not in META_FILES]
+    meta_files = [(name, data) for name, data in files if name in META_FILES]
+    meta = dict(meta_files)
+
+    word = meta['word.txt'].decode('utf-8', errors='replace').strip() if 'word.txt' in meta else None
+    metadata = None
+    if parse_metadata:
+        try:
+            metadata = json.loads(meta['metadata.json']) if 'metadata.json' in meta else {}
+        except ValueError:
+            metadata = {}
+
+    record = WordRecord(word_id, word, metadata, images)
+    record.meta_files = meta_files
+    record.rejected = rejected
+    return record
+
+
+class _CountingReader:
+    """Counts the bytes read, for progress on streams that can't tell() (HTTP responses)."""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.position = 0
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        self.position += len(data)
+        return data
+
+    def tell(self):
+        return self.position
+
+    def close(self):
+        self.fileobj.close()
+
+
+def iter_words(source, k, policy=None, validate=True, shard=None, inner_workers=0, parse_metadata=True,
+               metrics=None, progress=None, warn=print):
+    """
+    Yields a WordRecord per word of source (directory, package tarball or http(s) URL).
+
+    policy         SelectionPolicy ranking images by metadata.json (ignored for flat tarballs,
+                   which stream images before their metadata)
+    validate       skip truncated/non-image files and take the next-ranked image instead
+    shard          (i, N): only word ids with crc32(id) % N == i
+    inner_workers  processes decompressing nested word archives (0 = in this process)
+    progress       progress(done, total): words for directories, compressed bytes for tarballs
+    warn           called with a message for every word that can't be read
+
+    Raises ValueError if source is none of the supported kinds.
+    """
+    metrics = metrics or BuildMetrics('word_source', enabled=False)
+    options = dict(k=k, policy=policy, validate=validate, shard=shard, parse_metadata=parse_metadata,
+                   metrics=metrics, progress=progress, warn=warn)
+
+    if source.startswith(('http://', 'https://')):
+        import urllib.request # ~15ms to import; local sources never need it
+        response = urllib.request.urlopen(source, timeout=60)
+        try:
+            length = response.headers.get('Content-Length')
+            yield from _iter_tar_stream(response, int(length) if length else None, inner_workers, **options)
+        finally:
+            response.close()
+    elif os.path.isdir(source):
+        yield from _iter_directory(source, **options)
+    elif tarfile.is_tarfile(source):
+        with open(source, 'rb') as raw:
+            yield from _iter_tar_stream(raw, os.path.getsize(source), inner_workers, **options)
+    else:
+        raise ValueError(f"Source is neither a directory, a tar file nor a URL: {source}")
+
+
+# --- Directories ---
+
+def _iter_directory(source_dir, k, policy, validate, shard, parse_metadata, metrics, progress, warn):
+    # Word folders (1234/) or word archives (1234.tar.gz) directly under source_dir
+    word_items = [i for i in os.listdir(source_dir) if i.replace('.tar.gz', '').isdigit()]
+    if shard:
+        word_items = [i for i in word_items if in_shard(i.replace('.tar.gz', ''), shard)]
+    if not word_items:
+        warn(f"Found 0 word items in {source_dir}.")
+
+    pool = None
+    if validate:
+        from concurrent.futures import ThreadPoolExecutor
+        pool = ThreadPoolExecutor(max_workers=VALIDATE_THREADS, thread_name_prefix='validate')
+    try:
+        for done, item in enumerate(word_items, 1):
+            path = os.path.join(source_dir, item)
+            word_id = item.replace('.tar.gz', '')
+            started = time.perf_counter()
+            record = None
+
+            if os.path.isdir(path):
+                files, rejected = _pick_from_folder(path, k, policy, validate, pool, metrics)
+                record = _record(word_id, files, rejected, parse_metadata)
+            elif tarfile.is_tarfile(path):
+                try:
+                    with tarfile.open(path, "r:gz") as tar:
+                        files, rejected = pick_from_tar(tar, k, policy, validate, metrics)
+                    record = _record(word_id, files, rejected, parse_metadata)
+                except Exception as e:
+                    warn(f"Error reading tar {path}: {e}")
+
+            if record is not None:
+                metrics.word_done(time.perf_counter() - started)
+                metrics.count('words')
+                yield record
+            if progress:
+                progress(done, len(word_items))
+    finally:
+        if pool:
+            pool.shutdown()
+
+
+def _pick_from_folder(src_path, k, policy, validate, pool, metrics):
+    """pick_from_tar() for an extracted word folder; only the chosen images are read in full."""
+    names = sorted(f for f in os.listdir(src_path) if f.lower().endswith(IMAGE_EXTENSIONS))
+
+    if policy:
+        with metrics.phase('parse'):
+            metadata = load_image_metadata(os.path.join(src_path, 'metadata.json'))
+        # Full preference order, so bad picks can be backfilled from the rest
+        ranked = policy.select(names, metadata, len(names) if validate else k)
+    else:
+        ranked = names
+
+    rejected = []
+    if validate:
+        with metrics.phase('validate'):
+            chosen, rejected = pick_valid(ranked, k, lambda f: check_image_file(os.path.join(src_path, f))[0], pool)
+    else:
+        chosen = ranked[:k]
+
+    files = []
+    with metrics.phase('read'):
+        for name in chosen + [m for m in META_FILES if os.path.exists(os.path.join(src_path, m))]:
+            with open(os.path.join(src_path, name), 'rb') as f:
+                files.append((name, f.read()))
+    return files, rejected
+
+
+# --- Package tarballs ---
+
+def _iter_tar_stream(raw, total, inner_workers, k, policy, validate, shard, parse_metadata, metrics, progress, warn):
+    """Records from a gzipped package tarball read front to back (a file or an HTTP response)."""
+    counted = _CountingReader(raw)
+    source = TimedReader(counted, metrics) if metrics.enabled else counted
+    inner_pool = None # created at the first nested word archive
+    warned_flat_policy = False
+
+    # Flat packages list a word's files contiguously, so only the current word is buffered:
+    # its first k good images in stream order, metadata files and rejections
+    current_word = None
+    current_files, current_rejected = [], []
+    current_images = 0
+    word_started = 0.0
+    # Only the word finished last is remembered, so a word that comes back right after another
+    # one is caught; state stays O(1) however many words the package has
+    previous_word = None
+    warned_split = None
+
+    def finish_current():
+        metrics.word_done(time.perf_counter() - word_started)
+        metrics.count('words')
+        return _record(current_word, current_files, current_rejected, parse_metadata)
+
+    def pool_records(results):
+        for (name, word_id, started), files, rejected, error in results:
+            if error:
+                warn(f"Warning: Failed to process inner tar {name}: {error}")
+                continue
+            metrics.word_done(time.perf_counter() - started)
+            metrics.count('words')
+            yield _record(word_id, files, rejected, parse_metadata)
+
+    try:
+        # Use 'r|gz' for streaming access which avoids reading the whole file structure first
+        with tarfile.open(fileobj=source, mode="r|gz") as main_tar:
+            # iter(main_tar) would keep every TarInfo in main_tar.members for the whole pass
+            members = iter_members(main_tar)
+            while True:
+                with metrics.phase('parse'):
+                    member = next(members, None)
+                if member is None:
+                    break
+                if progress:
+                    progress(counted.tell(), total)
+                metrics.count('members')
+
+                if not member.isfile():
+                    continue
+
+                # CASE A: Nested tarball (e.g. scale-spanish-package/1234.tar.gz)
+                if member.name.endswith('.tar.gz') and member.name.split('/')[-1].replace('.tar.gz', '').isdigit():
+                    word_id = member.name.split('/')[-1].replace('.tar.gz', '')
+                    if shard and not in_shard(word_id, shard):
+                        continue # Another shard decompresses this one
+                    started = time.perf_counter()
+                    f = main_tar.extractfile(member)
+                    if not f:
+                        continue
+                    if inner_workers > 0:
+                        # The reader only copies the archive out; a worker process decompresses it
+                        if inner_pool is None:
+                            inner_pool = InnerTarPool(inner_workers, k, policy, validate, metrics=metrics)
+                        yield from pool_records(inner_pool.submit((member.name, word_id, started), f, member.size))
+                        continue
+                    try:
+                        # The outer stream isn't seekable; buffer the (small) inner
+                        # archive so it can be read in any order (metadata.json first)
+                        with metrics.phase('decompress'):
+                            inner_bytes = f.read()
+                        with tarfile.open(fileobj=io.BytesIO(inner_bytes), mode="r:gz") as inner_tar:
+                            files, rejected = pick_from_tar(inner_tar, k, policy, validate, metrics)
+                    except Exception as e:
+                        warn(f"Warning: Failed to process inner tar {member.name}: {e}")
+                        continue
+                    metrics.word_done(time.perf_counter() - started)
+                    metrics.count('words')
+                    yield _record(word_id, files, rejected, parse_metadata)
+                    continue
+
+                # CASE B: Flat directory structure (e.g. scale-japanese-package/5418/01.jpg)
+                parts = member.name.split('/')
+                # Expect: root_dir/word_id/filename
+                if len(parts) < 3 or not parts[-2].isdigit() or (shard and not in_shard(parts[-2], shard)):
+                    continue
+                word_id, filename = parts[-2], parts[-1]
+
+                # Members of a word are contiguous in the stream
+                if word_id == previous_word:
+                    # Its record is already written; taking more files now could exceed k or replace images
+                    if warned_split != word_id:
+                        warn(f"Warning: word {word_id} reappears later in the stream; skipping its remaining files.")
+                        warned_split = word_id
+                    continue
+                if word_id != current_word:
+                    if current_word is not None:
+                        previous_word = current_word
+                        yield finish_current()
+                    current_word, word_started = word_id, time.perf_counter()
+                    current_files, current_rejected = [], []
+                    current_images = 0
+
+                is_image = filename.lower().endswith(IMAGE_EXTENSIONS)
+                # A bad image doesn't use up a slot, so the next one in the stream takes its place
+                if (is_image and current_images < k) or filename in META_FILES:
+                    if is_image and policy and not warned_flat_policy:
+                        warn("Note: flat packages stream images before metadata.json; --select is ignored for this layout.")
+                        warned_flat_policy = True
+                    f = main_tar.extractfile(member)
+                    if not f:
+                        continue
+                    with metrics.phase('decompress'):
+                        data = f.read()
+                    if is_image and validate:
+                        with metrics.phase('validate'):
+                            problem, _ = check_image(data)
+                        if problem:
+                            current_rejected.append((filename, problem))
+                            continue
+                    current_files.append((filename, data))
+                    current_images += is_image
+
+            if current_word is not None:
+                yield finish_current()
+            if inner_pool:
+                yield from pool_records(inner_pool.drain())
+            if progress:
+                progress(counted.tell(), total)
+    finally:
+        if inner_pool:
+            inner_pool.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the word records iter_words() yields for a package source.")
+    parser.add_argument('source', help="Package folder, package tarball or http(s) URL")
+    parser.add_argument('--limit', type=int, default=3, help="Images per word")
+    parser.add_argument('--words', type=int, default=10, help="Stop after this many words (0 = all)")
+    parser.add_argument('--no-validate', action='store_true', help="Don't check image headers and end markers")
+    args = parser.parse_args(argv)
+
+    count = 0
+    for word_id, word, metadata, images in iter_words(args.source, args.limit, validate=not args.no_validate):
+        sizes = ', '.join(f"{name} {len(data)}B" for name, data in images)
+        print(f"{word_id}\t{word or '-'}\t{len(metadata)} metadata entries\t{sizes}")
+        count += 1
+        if count == args.words:
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+'''
+Local static server for the app and its packages.
+
+- Strong ETags (content hash, cached by mtime/size) with 304 revalidation
+- Cache-Control: immutable for content-hashed names or ?v=<hex digest>, no-cache otherwise
+  (?v=2 style counters are bumped by hand and revalidate like everything else)
+- Precompressed .br / .gz siblings served by Accept-Encoding (create with --precompress)
+- HTTP/1.1 keep-alive and single-range requests (206)
+- Packed packages (scripts/mmid_master/package_pack.py) served without unpacking:
+  --pack mini-german-package-k3.pack answers /mini-german-package-k3/<id>/<file>
+
+python3 serve_assets.py
+python3 serve_assets.py --port 8080 --pack mini-german-package-k3.pack
+python3 serve_assets.py --precompress
+'''
+
+import os
+import re
+import sys
+import gzip
+import hashlib
+import argparse
+import mimetypes
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts', 'mmid_master'))
+from package_pack import PackReader
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+COMPRESSIBLE = ('.html', '.js', '.css', '.csv', '.json', '.svg', '.txt')
+HASHED_NAME = re.compile(r'[0-9a-f]{16,}\.[a-z0-9]+$') # e.g. assets/audio/tts/<sha256[:20]>.mp3
+HASHED_VERSION = re.compile(r'[0-9a-f]{8,}') # ?v=<content hash>; a plain ?v=2 is not one
+# --precompress only writes siblings for app-shell assets (each pattern is in .gitignore)
+PRECOMPRESSED = ('.html', '.js', '.css', '.csv', '.json')
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')] # preference order
+
+mimetypes.add_type('text/javascript', '.js')
+mimetypes.add_type('text/csv', '.csv')
+
+
+class ETagCache:
+    """Content hashes keyed by (path, mtime_ns, size), so each file is hashed once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tags = {}
+
+    def file_tag(self, path, stat):
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        tag = self.tags.get(key)
+        if tag is None:
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            tag = f'"{digest.hexdigest()[:24]}"'
+            with self.lock:
+                self.tags[key] = tag
+        return tag
+
+    def blob_tag(self, key, data):
+        tag = self.tags.get(key)
+        if tag is None:
+            tag = f'"{hashlib.sha256(data).hexdigest()[:24]}"'
+            with self.lock:
+                self.tags[key] = tag
+        return tag
+
+
+def parse_range(header, size):
+    """(start, end) inclusive for a single 'bytes=' range, None to ignore it, or 'invalid' for 416."""
+    match = re.fullmatch(r'bytes=(\d*)-(\d*)', header.strip())
+    if not match or match.group(1) == match.group(2) == '':
+        return None
+    first, last = match.groups()
+    if first == '':
+        length = int(last)
+        if length == 0:
+            return 'invalid'
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return 'invalid'
+    return start, end
+
+
+class AssetHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1' # keep-alive
+    # Headers and body go out in separate writes; with Nagle on, keep-alive
+    # clients wait ~40ms for the delayed ACK on every response
+    disable_nagle_algorithm = True
+    server_version = 'CarrotAssets/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def _serve(self, send_body):
+        url = urllib.parse.urlsplit(self.path)
+        rel = urllib.parse.unquote(url.path).lstrip('/') or 'index.html'
+        parts = [p for p in rel.split('/') if p not in ('', '.')]
+        if '..' in parts:
+            return self._error(403)
+
+        version = urllib.parse.parse_qs(url.query).get('v', [''])[0]
+        hashed = HASHED_VERSION.fullmatch(version) or HASHED_NAME.search(rel)
+        cache_control = IMMUTABLE if hashed else REVALIDATE
+
+        # Packed packages first: /<pack name>/<word id>/<file>
+        if parts and parts[0] in self.server.packs:
+            if len(parts) == 2:
+                word_id, name = '.', parts[1]
+            elif len(parts) == 3:
+                word_id, name = parts[1], parts[2]
+            else:
+                return self._error(404)
+            reader = self.server.packs[parts[0]]
+            data = reader.read(word_id, name)
+            if data is None:
+                return self._error(404)
+            etag = self.server.etags.blob_tag((parts[0], word_id, name), data)
+            return self._send(data, len(data), name, etag, cache_control, None, send_body)
+
+        path = os.path.join(self.server.root, *parts)
+        if os.path.isdir(path):
+            path = os.path.join(path, 'index.html')
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return self._error(404)
+
+        # Precompressed sibling, if the client accepts it and it isn't older than the source
+        accepted = self.headers.get('Accept-Encoding', '')
+        encoding = None
+        if path.endswith(COMPRESSIBLE):
+            for name, suffix in ENCODINGS:
+                if name not in accepted:
+                    continue
+                try:
+                    sibling_stat = os.stat(path + suffix)
+                except OSError:
+                    continue
+                if sibling_stat.st_mtime >= stat.st_mtime:
+                    encoding, path, stat = name, path + suffix, sibling_stat
+                    break
+
+        etag = self.server.etags.file_tag(path, stat)
+        with open(path, 'rb') as f:
+            self._send(f, stat.st_size, rel, etag, cache_control, encoding, send_body)
+
+    def _send(self, body, size, name, etag, cache_control, encoding, send_body):
+        """body is bytes-like or an open file."""
+        headers = {
+            'ETag': etag,
+            'Cache-Control': cache_control,
+            'Content-Type': mimetypes.guess_type(name)[0] or 'application/octet-stream',
+            'Accept-Ranges': 'bytes',
+        }
+        if name.endswith(COMPRESSIBLE):
+            headers['Vary'] = 'Accept-Encoding'
+        if encoding:
+            headers['Content-Encoding'] = encoding
+
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match and (if_none_match.strip() == '*' or etag in [t.strip() for t in if_none_match.split(',')]):
+            self.send_response(304)
+            for key in ('ETag', 'Cache-Control', 'Vary'):
+                if key in headers:
+                    self.send_header(key, headers[key])
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        status, start, end = 200, 0, size - 1
+        range_header = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        if range_header and not encoding and (not if_range or if_range.strip() == etag):
+            byte_range = parse_range(range_header, size)
+            if byte_range == 'invalid':
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            if byte_range:
+                status, (start, end) = 206, byte_range
+                headers['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+        length = max(0, end - start + 1)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(length))
+        self.end_headers()
+        if not send_body or length == 0:
+            return
+
+        if hasattr(body, 'read'):
+            body.seek(start)
+            remaining = length
+            while remaining:
+                chunk = body.read(min(remaining, 1 << 16))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+        else:
+            self.wfile.write(body[start:end + 1])
+
+    def _error(self, status):
+        body = f'{status} {self.responses[status][0]}\n'.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+
+class AssetServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, root, packs=None, verbose=False):
+        super().__init__(address, AssetHandler)
+        self.root = os.path.abspath(root)
+        self.packs = packs or {}
+        self.verbose = verbose
+        self.etags = ETagCache()
+
+
+def precompress(root):
+    """
+    Writes .gz (and .br if the brotli module is installed) next to app-shell assets that changed.
+    Word folders of packages (folders next to an index.csv) are skipped; their files are small and many.
+    """
+    written = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        if 'index.csv' in filenames:
+            dirnames[:] = []
+        dirnames[:] = [d for d in dirnames if not d.startswith(('.', '__')) and d != 'node_modules']
+        for filename in filenames:
+            if not filename.endswith(PRECOMPRESSED):
+                continue
+            path = os.path.join(dirpath, filename)
+            source_mtime = os.path.getmtime(path)
+            with open(path, 'rb') as f:
+                data = None
+                targets = [('.gz', lambda d: gzip.compress(d, 9, mtime=0))]
+                if brotli:
+                    targets.append(('.br', lambda d: brotli.compress(d, quality=11)))
+                for suffix, compress in targets:
+                    out_path = path + suffix
+                    if os.path.exists(out_path) and os.path.getmtime(out_path) >= source_mtime:
+                        continue
+                    if data is None:
+                        data = f.read()
+                    with open(out_path, 'wb') as out_f:
+                        out_f.write(compress(data))
+                    written += 1
+    if not brotli:
+        print("Note: brotli module not installed, only .gz files were written.")
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the app and packages with caching, compression and range support.")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--bind', type=str, default='127.0.0.1')
+    parser.add_argument('--root', type=str, default='.', help="Directory to serve")
+    parser.add_argument('--pack', action='append', default=[], help="Serve a .pack at /<name>/ (repeatable)")
+    parser.add_argument('--precompress', action='store_true', help="Write .gz/.br siblings for text assets and exit")
+    parser.add_argument('--verbose', action='store_true', help="Log every request")
+    args = parser.parse_args()
+
+    if args.precompress:
+        print(f"Wrote {precompress(args.root)} precompressed files.")
+        sys.exit(0)
+
+    packs = {}
+    for pack_path in args.pack:
+        name = os.path.basename(pack_path)
+        name = name[:-len('.pack')] if name.endswith('.pack') else name
+        packs[name] = PackReader(pack_path)
+        print(f"Serving {pack_path} at /{name}/ ({len(packs[name].words())} words)")
+
+    server = AssetServer((args.bind, args.port), args.root, packs, args.verbose)
+    print(f"Serving {server.root} on http://{args.bind}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        server.server_close()
+        for reader in packs.values():
+            reader.close()
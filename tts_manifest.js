@@ -0,0 +1 @@
+const TTS_MANIFEST = {};
\ No newline at end of file